@@ -4,34 +4,23 @@
 # All UI components, formatting, and theming live in ui/.
 # All tab rendering functions live in tabs/.
 # This file: data loading, sidebar filters, engine calls, tab dispatch.
+#
+# Tabs are lazy: only the open tab is rendered, and its module (with
+# Plotly) and the engines it reads are loaded on first use.
 # ============================================================
 
+import importlib
+
 import streamlit as st
 import pandas as pd
 
-from data.load_data import load_data, get_df_with_sg
-from engines.hole_summary import build_hole_summary
-from engines.driving import build_driving_results
-from engines.approach import build_approach_results
-from engines.short_game import build_short_game_results
-from engines.putting import build_putting_results
-from engines.tiger5 import build_tiger5_results
-from engines.scoring_performance import build_scoring_performance
-from engines.coachs_corner import build_coachs_corner
+from data.load_data import current_dataset, get_refresher
 from engines.strokes_gained import BENCHMARK_FILES
+from golf_analytics.pipeline import select_shots, build_engine_results
+from engines.rerun_profile import RerunProfile
 
 from ui.css import inject_css
-from ui.components import sidebar_title, sidebar_label
-
-from tabs.tiger5 import tiger5_tab
-from tabs.scoring_performance import scoring_perf_tab
-from tabs.strokes_gained import strokes_gained_tab
-from tabs.driving import driving_tab
-from tabs.approach import approach_tab
-from tabs.short_game import short_game_tab
-from tabs.putting import putting_tab
-from tabs.coachs_corner import coachs_corner_tab
-from tabs.coaches_table import coaches_table_tab
+from ui.components import sidebar_title, sidebar_label, perf_panel
 
 # ============================================================
 # PAGE CONFIG & GLOBAL CSS
@@ -40,6 +29,10 @@ from tabs.coaches_table import coaches_table_tab
 st.set_page_config(page_title="Golf Analytics Dashboard", layout="wide")
 inject_css()
 
+# Per-step timing of this rerun, on when the sidebar Performance
+# checkbox (rendered below) was ticked; a no-op otherwise
+profile = RerunProfile(st.session_state.get("perf_panel", False))
+
 # ============================================================
 # BENCHMARK SELECTION (must come before data loading so SG
 # can be computed on the full df and cached per benchmark)
@@ -59,16 +52,24 @@ with st.sidebar:
     st.markdown("---")
 
 # ============================================================
-# DATA LOADING — SG computed once per benchmark, then cached
+# DATA LOADING — one dataset version per rerun; SG and the round
+# cube are built once per version and benchmark. New versions are
+# built and swapped in by a background refresher.
 # ============================================================
 
-df = get_df_with_sg(benchmark_choice)
+with profile.step("load dataset", kind="data") as step:
+    dataset = current_dataset()
+    df = dataset.df(benchmark_choice)
+    round_cube = dataset.round_cube(benchmark_choice)
+    step.rows_out = len(df)
 
 # ============================================================
 # SIDEBAR FILTERS (DYNAMIC/CASCADING)
 # ============================================================
 
-with st.sidebar:
+# The "sidebar" step ends when the sidebar is complete, which
+# benchmarks/bench_startup.py tracks as time to first sidebar render
+with st.sidebar, profile.step("sidebar", kind="ui"):
 
     # Initialize session state for filter selections if not exists
     if 'selected_players' not in st.session_state:
@@ -87,33 +88,31 @@ with st.sidebar:
     # Always show all players — no cascading or exclusion tracking
     available_players = sorted(df['Player'].unique())
 
+    # Each filter's rows as a mask over the shared table; options are
+    # read from single columns, so the shot table is never copied
+    in_players = df['Player'].isin(st.session_state.selected_players)
+    in_courses = df['Course'].isin(st.session_state.selected_courses)
+    in_tournaments = df['Tournament'].isin(st.session_state.selected_tournaments)
+    in_dates = (
+        (df['_date'] >= pd.Timestamp(st.session_state.selected_date_range[0]))
+        & (df['_date'] <= pd.Timestamp(st.session_state.selected_date_range[1]))
+    )
+
     # Available courses (filtered by player, tournament, date)
-    temp_df = df[
-        (df['Player'].isin(st.session_state.selected_players))
-        & (df['Tournament'].isin(st.session_state.selected_tournaments))
-        & (df['_date'] >= st.session_state.selected_date_range[0])
-        & (df['_date'] <= st.session_state.selected_date_range[1])
-    ]
-    available_courses = sorted(temp_df['Course'].unique())
+    available_courses = sorted(
+        df.loc[in_players & in_tournaments & in_dates, 'Course'].unique()
+    )
 
     # Available tournaments (filtered by player, course, date)
-    temp_df = df[
-        (df['Player'].isin(st.session_state.selected_players))
-        & (df['Course'].isin(st.session_state.selected_courses))
-        & (df['_date'] >= st.session_state.selected_date_range[0])
-        & (df['_date'] <= st.session_state.selected_date_range[1])
-    ]
-    available_tournaments = sorted(temp_df['Tournament'].unique())
+    available_tournaments = sorted(
+        df.loc[in_players & in_courses & in_dates, 'Tournament'].unique()
+    )
 
     # Available date range (filtered by player, course, tournament)
-    temp_df = df[
-        (df['Player'].isin(st.session_state.selected_players))
-        & (df['Course'].isin(st.session_state.selected_courses))
-        & (df['Tournament'].isin(st.session_state.selected_tournaments))
-    ]
-    if len(temp_df) > 0:
-        min_date_available = temp_df['Date'].min().date()
-        max_date_available = temp_df['Date'].max().date()
+    dates = df.loc[in_players & in_courses & in_tournaments, 'Date']
+    if len(dates) > 0:
+        min_date_available = dates.min().date()
+        max_date_available = dates.max().date()
     else:
         min_date_available = df['Date'].min().date()
         max_date_available = df['Date'].max().date()
@@ -186,6 +185,21 @@ with st.sidebar:
         dr_list = list(date_range)
         st.session_state.selected_date_range = (dr_list[0], dr_list[1])
 
+    # Dataset freshness (served version; refreshes run in the background)
+    st.markdown("---")
+    refresh = get_refresher().status()
+    refresh_note = (
+        f" · last refresh {refresh['last_refresh_ms'] / 1000:.1f}s"
+        if refresh['last_refresh_ms'] is not None else ""
+    )
+    st.caption(
+        f"Data version {refresh['version']} · checked "
+        f"{refresh['staleness_s'] / 60:.0f} min ago{refresh_note}"
+        + (" · refreshing…" if refresh['refreshing'] else "")
+    )
+    st.checkbox("Performance", key="perf_panel",
+                help="Time every step of each rerun and log it to a local JSONL file")
+
 # ============================================================
 # APPLY FILTERS
 # ============================================================
@@ -195,49 +209,25 @@ final_players = players if players else list(df['Player'].unique())
 final_courses = courses if courses else list(df['Course'].unique())
 final_tournaments = tournaments if tournaments else list(df['Tournament'].unique())
 
-filtered_df = df[
-    (df['Player'].isin(final_players))
-    & (df['Course'].isin(final_courses))
-    & (df['Tournament'].isin(final_tournaments))
-    & (df['_date'] >= date_range[0])
-    & (df['_date'] <= date_range[1])
-].copy()
-
-num_rounds = filtered_df['Round ID'].nunique()
-
-# ============================================================
-# HOLE SUMMARY
-# ============================================================
-
-hole_summary = build_hole_summary(filtered_df)
+# The session's filter state is a row-position view of the shared
+# table; frames are taken from it only when an engine or tab needs one
+with profile.step("filter", kind="data", rows_in=len(df)) as step:
+    view = select_shots(
+        df, final_players, final_courses, final_tournaments,
+        (date_range[0], date_range[1]),
+    )
+    step.rows_out = len(view)
 
 # ============================================================
-# ENGINE CALLS
+# ENGINE CALLS (golf_analytics.pipeline: hole summary, shot
+# partition and round rollup once per filter state; each engine runs
+# when a tab first reads its result)
 # ============================================================
 
-driving_results = build_driving_results(filtered_df, num_rounds, hole_summary)
-approach_results = build_approach_results(filtered_df, num_rounds)
-short_game_results = build_short_game_results(filtered_df, num_rounds)
-putting_results = build_putting_results(filtered_df, num_rounds)
-
-tiger5_results, total_tiger5_fails, grit_score = build_tiger5_results(
-    filtered_df, hole_summary
-)
-
-scoring_perf_results = build_scoring_performance(filtered_df, hole_summary)
-
-coachs_corner_results = build_coachs_corner(
-    filtered_df,
-    hole_summary,
-    driving_results,
-    approach_results,
-    short_game_results,
-    putting_results,
-    tiger5_results,
-    scoring_perf_results,
-    grit_score,
-    num_rounds,
+results = build_engine_results(
+    view, round_cube, profile, dataset.partition(benchmark_choice)
 )
+num_rounds = results["num_rounds"]
 
 # ============================================================
 # TABS
@@ -246,36 +236,70 @@ coachs_corner_results = build_coachs_corner(
 tab_tiger5, tab_coach, tab_driving, tab_approach, tab_short_game, \
     tab_putting, tab_sg, tab_coaches_table, tab_scoring_perf = st.tabs(
         ["Tiger 5", "PlayerPath", "Driving", "Approach",
-         "Short Game", "Putting", "Strokes Gained", "Coaches Table", "Scoring Performance"]
+         "Short Game", "Putting", "Strokes Gained", "Coaches Table", "Scoring Performance"],
+        key="main_tab",
+        on_change="rerun",
     )
 
-with tab_tiger5:
-    tiger5_tab(filtered_df, hole_summary, tiger5_results, total_tiger5_fails, num_rounds)
-
-with tab_coach:
-    coachs_corner_tab(coachs_corner_results)
 
-with tab_driving:
-    driving_tab(driving_results, num_rounds, hole_summary)
+def render_tab(tab, label, module, function, args):
+    """
+    Render `tab` if it is the open one: import tabs.<module>, build the
+    engine results `args()` reads, then time function(*args). A module
+    declaring SHOT_COLUMNS also gets the filtered shots projected onto
+    them as its first argument.
+    """
+    with tab:
+        if not tab.open:
+            return
+        module = importlib.import_module(f"tabs.{module}")
+        args = args()
+        with profile.step(f"tab: {label}", kind="tab"):
+            if hasattr(module, "SHOT_COLUMNS"):
+                args = (results.frame(module.SHOT_COLUMNS), *args)
+            getattr(module, function)(*args)
+
+
+render_tab(tab_tiger5, "Tiger 5", "tiger5", "tiger5_tab", lambda: (
+    results["hole_summary"], results["tiger5"],
+    results["total_tiger5_fails"], num_rounds,
+))
+render_tab(tab_coach, "PlayerPath", "coachs_corner", "coachs_corner_tab", lambda: (
+    results["coachs_corner"],
+))
+render_tab(tab_driving, "Driving", "driving", "driving_tab", lambda: (
+    results["driving"], num_rounds, results["hole_summary"],
+))
+render_tab(tab_approach, "Approach", "approach", "approach_tab", lambda: (
+    results["approach"], num_rounds,
+))
+render_tab(tab_short_game, "Short Game", "short_game", "short_game_tab", lambda: (
+    results["short_game"], num_rounds,
+))
+render_tab(tab_putting, "Putting", "putting", "putting_tab", lambda: (
+    results["putting"], num_rounds,
+))
+render_tab(tab_sg, "Strokes Gained", "strokes_gained", "strokes_gained_tab", lambda: (
+    results["hole_summary"], num_rounds,
+    results["driving"], results["approach"], results["short_game"],
+    results["putting"], results["tiger5"], results["shots"], results["rollup"],
+))
+render_tab(tab_coaches_table, "Coaches Table", "coaches_table", "coaches_table_tab", lambda: (
+    results["hole_summary"],
+))
+render_tab(tab_scoring_perf, "Scoring Performance", "scoring_performance", "scoring_perf_tab", lambda: (
+    results["hole_summary"], results["scoring_perf"],
+))
 
-with tab_approach:
-    approach_tab(approach_results, num_rounds)
-
-with tab_short_game:
-    short_game_tab(short_game_results, num_rounds)
-
-with tab_putting:
-    putting_tab(putting_results, num_rounds)
+# ============================================================
+# PERFORMANCE PANEL (opt-in)
+# ============================================================
 
-with tab_sg:
-    strokes_gained_tab(
-        filtered_df, hole_summary, num_rounds,
-        driving_results, approach_results, short_game_results,
-        putting_results, tiger5_results,
+if profile.enabled:
+    profile.finish()
+    profile.write_jsonl(
+        benchmark=benchmark_choice, version=dataset.version,
+        shots=len(df), filtered_shots=len(view), rounds=num_rounds,
     )
-
-with tab_coaches_table:
-    coaches_table_tab(filtered_df, hole_summary)
-
-with tab_scoring_perf:
-    scoring_perf_tab(filtered_df, hole_summary, scoring_perf_results)
+    with st.sidebar:
+        perf_panel(profile)
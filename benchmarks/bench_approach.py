@@ -0,0 +1,75 @@
+"""
+Approach engine benchmark.
+
+Times build_approach_results on a synthetic set of approach shots.
+
+    python benchmarks/bench_approach.py            # 100k shots
+    python benchmarks/bench_approach.py 500000 5   # shots, repeats
+"""
+import gc
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engines.approach import build_approach_results  # noqa: E402
+
+
+def make_approach_shots(n, seed=0):
+    """Synthetic approach shots in the load_data schema."""
+    rng = np.random.default_rng(seed)
+    rounds = max(1, n // 8)
+    round_idx = rng.integers(0, rounds, n)
+    start_lie = rng.choice(['Fairway', 'Tee', 'Rough', 'Sand'], n,
+                           p=[0.5, 0.2, 0.2, 0.1])
+    end_lie = rng.choice(['Green', 'Fairway', 'Rough', 'Sand'], n,
+                         p=[0.6, 0.1, 0.2, 0.1])
+    dates = pd.Timestamp('2025-01-01') + pd.to_timedelta(round_idx % 365, unit='D')
+    return pd.DataFrame({
+        'Player': 'Player ' + pd.Series(round_idx % 20).astype(str),
+        'Course': 'Course ' + pd.Series(round_idx % 12).astype(str),
+        'Date': dates,
+        'Round ID': 'R' + pd.Series(round_idx).astype(str),
+        'Hole': rng.integers(1, 19, n),
+        'Shot': rng.integers(1, 4, n),
+        'Starting Distance': rng.uniform(30, 260, n).round(),
+        'Starting Location': start_lie,
+        'Ending Distance': np.where(end_lie == 'Green',
+                                    rng.uniform(1, 90, n),
+                                    rng.uniform(5, 40, n)).round(),
+        'Ending Location': end_lie,
+        'Penalty': 'No',
+        'Shot Type': 'Approach',
+        'Strokes Gained': rng.normal(-0.1, 0.4, n).round(2),
+    })
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    df = make_approach_shots(n)
+    num_rounds = df['Round ID'].nunique()
+    build_approach_results(df, num_rounds)  # warm-up
+
+    # Like timeit, keep the garbage collector out of the timed calls
+    gc.disable()
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        build_approach_results(df, num_rounds)
+        times.append(time.perf_counter() - start)
+    gc.enable()
+
+    best = min(times)
+    print(f"build_approach_results  shots={n:,}  "
+          f"best={best * 1000:.1f} ms  median={np.median(times) * 1000:.1f} ms  "
+          f"shots/sec={n / best:,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,286 @@
+"""
+Engine micro-benchmark suite.
+
+Times every build_* engine app.py and the tabs call, at several dataset
+sizes and filter selectivities, on synthetic seasons from
+data/synthetic.py. A selectivity is the share of players selected
+(filters select whole rounds). As in app.py, a filter state is a
+select_shots() view of the shared table, its EngineResults build the
+hole summary, shot partition (selected from the table's) and round
+rollup once, and the results a downstream engine consumes are built
+outside its timed call. Each call gets a fresh view of the same rows
+and reads its frame through the engine's <ENGINE>_COLUMNS projection,
+so column takes are timed as on a rerun. Coach's Corner section
+memoization is cleared before every call, so each timing is a cold
+rerun.
+
+Results are written as JSON (best / median ms and shots/sec per engine,
+size and selectivity). Given a baseline JSON from an earlier run, any
+engine whose best time grew by more than the threshold is reported and
+the exit status is 1, so the suite can gate a change:
+
+    python benchmarks/bench_engines.py                          # 2k, 10k
+    python benchmarks/bench_engines.py --sizes 100000 --repeats 1
+    python benchmarks/bench_engines.py --json base.json         # record
+    python benchmarks/bench_engines.py --baseline base.json     # compare
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.synthetic import generate_shots  # noqa: E402
+from engines.strokes_gained import apply_benchmark_sg  # noqa: E402
+from engines.shot_view import ShotView  # noqa: E402
+from engines.hole_summary import build_hole_summary, HOLE_SUMMARY_COLUMNS  # noqa: E402
+from engines.partition import build_shot_partition  # noqa: E402
+from engines.round_cube import build_round_cube  # noqa: E402
+from engines.driving import build_driving_results, DRIVING_COLUMNS  # noqa: E402
+from engines.approach import build_approach_results, APPROACH_COLUMNS  # noqa: E402
+from engines.short_game import build_short_game_results, SHORT_GAME_COLUMNS  # noqa: E402
+from engines.putting import build_putting_results, PUTTING_COLUMNS  # noqa: E402
+from engines.tiger5 import build_tiger5_results, TIGER5_COLUMNS  # noqa: E402
+from engines.scoring_performance import (  # noqa: E402
+    build_scoring_performance, SCORING_PERFORMANCE_COLUMNS,
+)
+from engines.coachs_corner import (  # noqa: E402
+    build_coachs_corner, COACHS_CORNER_COLUMNS, _SECTION_CACHE,
+)
+from engines.coaches_table import build_coaches_table_results, COACHES_TABLE_COLUMNS  # noqa: E402
+from engines.overview import (  # noqa: E402
+    overview_engine, build_sg_separators, build_sg_trend,
+    build_scoring_by_par, build_hole_outcomes,
+    build_sg_by_hole_pivot, build_sg_by_hole_pivot_by_course,
+    build_tiger5_fail_shots, build_shot_detail,
+    OVERVIEW_COLUMNS, SG_SEPARATOR_COLUMNS, SG_TREND_COLUMNS, SG_BY_HOLE_COLUMNS,
+    TIGER5_FAIL_SHOT_COLUMNS, ROUND_DETAIL_COLUMNS,
+)
+from golf_analytics.pipeline import select_shots, build_engine_results  # noqa: E402
+
+# The app's default benchmark
+SG_BENCHMARK = 'Elite College (+3)'
+
+# A team season is a few thousand shots
+DEFAULT_SIZES = [2_000, 10_000]
+DEFAULT_SELECTIVITIES = [1.0, 0.5, 0.1]
+
+# A regression is a best time this much slower than the baseline ...
+DEFAULT_THRESHOLD = 0.25
+# ... and at least this many ms slower (timer noise on tiny engines)
+MIN_REGRESSION_MS = 2.0
+
+
+# ============================================================
+# FILTER STATE
+# ============================================================
+
+# Results built before the timed calls (what the engines consume)
+_UPSTREAM = (
+    'num_rounds', 'hole_summary', 'shots', 'rollup', 'driving', 'approach',
+    'short_game', 'putting', 'tiger5', 'scoring_perf',
+)
+
+
+def _filter_state(df, cube, partition, selectivity):
+    """EngineResults of one filter state, with its upstream results built."""
+    players = df['Player'].cat.categories
+    keep = players[: max(1, round(len(players) * selectivity))]
+    results = build_engine_results(select_shots(df, players=list(keep)), cube, partition=partition)
+    for key in _UPSTREAM:
+        results[key]
+    return results
+
+
+# ============================================================
+# ENGINES — name: call(view, results), with the arguments app.py
+# passes; `view` is a fresh ShotView of the filter state's rows
+# ============================================================
+
+ENGINES = {
+    'build_hole_summary': lambda v, r: build_hole_summary(v.frame(HOLE_SUMMARY_COLUMNS)),
+    'build_shot_partition': lambda v, r: build_shot_partition(v, r.partition),
+    'build_driving_results': lambda v, r: build_driving_results(
+        v.frame(DRIVING_COLUMNS), r['num_rounds'], r['hole_summary'], r['shots']),
+    'build_approach_results': lambda v, r: build_approach_results(
+        v.frame(APPROACH_COLUMNS), r['num_rounds'], r['shots']),
+    'build_short_game_results': lambda v, r: build_short_game_results(
+        v.frame(SHORT_GAME_COLUMNS), r['num_rounds'], r['shots']),
+    'build_putting_results': lambda v, r: build_putting_results(
+        v.frame(PUTTING_COLUMNS), r['num_rounds'], r['shots']),
+    'build_tiger5_results': lambda v, r: build_tiger5_results(
+        v.frame(TIGER5_COLUMNS), r['hole_summary'], r['shots'], r['rollup']),
+    'build_scoring_performance': lambda v, r: build_scoring_performance(
+        v.frame(SCORING_PERFORMANCE_COLUMNS), r['hole_summary']),
+    'build_coachs_corner': lambda v, r: build_coachs_corner(
+        v.frame(COACHS_CORNER_COLUMNS), r['hole_summary'], r['driving'], r['approach'],
+        r['short_game'], r['putting'], r['tiger5'], r['scoring_perf'],
+        r['grit_score'], r['num_rounds'], r['shots'], r['rollup'], selection=v.key),
+    'build_coaches_table_results': lambda v, r: build_coaches_table_results(
+        v.frame(COACHES_TABLE_COLUMNS), r['hole_summary']),
+    'overview_engine': lambda v, r: overview_engine(
+        v.frame(OVERVIEW_COLUMNS), r['hole_summary'], r['driving'], r['approach'],
+        r['short_game'], r['putting'], r['tiger5'], r['shots'], r['rollup']),
+    'build_sg_separators': lambda v, r: build_sg_separators(
+        v.frame(SG_SEPARATOR_COLUMNS), r['num_rounds'], r['shots'], rollup=r['rollup']),
+    'build_sg_trend': lambda v, r: build_sg_trend(v.frame(SG_TREND_COLUMNS), r['shots']),
+    'build_scoring_by_par': lambda v, r: build_scoring_by_par(r['hole_summary'], r['rollup']),
+    'build_hole_outcomes': lambda v, r: build_hole_outcomes(r['hole_summary'], r['rollup']),
+    'build_sg_by_hole_pivot': lambda v, r: build_sg_by_hole_pivot(
+        v.frame(SG_BY_HOLE_COLUMNS), r['hole_summary'], r['shots']),
+    'build_sg_by_hole_pivot_by_course': lambda v, r: build_sg_by_hole_pivot_by_course(
+        v.frame(SG_BY_HOLE_COLUMNS), r['hole_summary'], r['shots']),
+    'build_tiger5_fail_shots': lambda v, r: build_tiger5_fail_shots(
+        v.frame(TIGER5_FAIL_SHOT_COLUMNS), r['tiger5']),
+    'build_shot_detail': lambda v, r: build_shot_detail(v.frame(ROUND_DETAIL_COLUMNS)),
+}
+
+
+def _time(fn, repeats):
+    """Best and median ms of fn() over `repeats` cold calls (after a warm-up)."""
+    _SECTION_CACHE.clear()
+    fn()  # warm-up
+    times = []
+    for _ in range(repeats):
+        _SECTION_CACHE.clear()
+        gc.disable()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+        gc.enable()
+    return min(times) * 1000, float(np.median(times)) * 1000
+
+
+# ============================================================
+# RUN / COMPARE
+# ============================================================
+
+def run_suite(sizes, selectivities, repeats, engines=None, seed=0):
+    """Time each engine at every size and selectivity; returns result rows."""
+    names = engines or list(ENGINES)
+    results = []
+    for size in sizes:
+        df = apply_benchmark_sg(generate_shots(size, players=20, seed=seed), SG_BENCHMARK)
+        cube = build_round_cube(df)
+        partition = build_shot_partition(df)
+        for selectivity in selectivities:
+            state = _filter_state(df, cube, partition, selectivity)
+            rows = state.view.rows
+            n = len(rows)
+            for name in names:
+                best_ms, median_ms = _time(
+                    lambda: ENGINES[name](ShotView(df, rows), state), repeats)
+                results.append({
+                    'engine': name,
+                    'size': size,
+                    'selectivity': selectivity,
+                    'shots': n,
+                    'rounds': state['num_rounds'],
+                    'best_ms': round(best_ms, 3),
+                    'median_ms': round(median_ms, 3),
+                    'shots_per_sec': round(n / (best_ms / 1000)) if best_ms else None,
+                })
+                print(f"  {name:<34} size={size:>9,} sel={selectivity:<4} "
+                      f"best={best_ms:9.1f} ms  shots/sec={n / (best_ms / 1000):>12,.0f}",
+                      flush=True)
+    return results
+
+
+def _key(row):
+    return (row['engine'], row['size'], row['selectivity'])
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD, min_ms=MIN_REGRESSION_MS):
+    """
+    Rows of `results` whose best time regressed against `baseline` (a
+    results list): slower by more than `threshold` (a fraction) and by at
+    least `min_ms`. Each row gains 'baseline_ms' and 'change'.
+    """
+    base = {_key(row): row for row in baseline}
+    regressions = []
+    for row in results:
+        before = base.get(_key(row))
+        if before is None or not before['best_ms']:
+            continue
+        change = row['best_ms'] / before['best_ms'] - 1
+        if change > threshold and row['best_ms'] - before['best_ms'] >= min_ms:
+            regressions.append({**row, 'baseline_ms': before['best_ms'], 'change': round(change, 3)})
+    return regressions
+
+
+def _environment():
+    return {
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def _floats(text):
+    return [float(x) for x in text.split(',')]
+
+
+def _ints(text):
+    return [int(float(x)) for x in text.split(',')]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', type=_ints, default=DEFAULT_SIZES,
+                        help='comma-separated shot counts (default: 2000,10000)')
+    parser.add_argument('--selectivity', type=_floats, default=DEFAULT_SELECTIVITIES,
+                        help='comma-separated shares of players selected (default: 1,0.5,0.1)')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--engines', type=lambda s: s.split(','),
+                        help=f"comma-separated subset of: {', '.join(ENGINES)}")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', metavar='PATH', help='write results JSON here')
+    parser.add_argument('--baseline', metavar='PATH', help='results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed slowdown as a fraction (default: 0.25)')
+    args = parser.parse_args(argv)
+
+    unknown = set(args.engines or []) - set(ENGINES)
+    if unknown:
+        parser.error(f"unknown engines: {', '.join(sorted(unknown))}")
+
+    results = run_suite(args.sizes, args.selectivity, args.repeats, args.engines, args.seed)
+    report = {
+        'environment': _environment(),
+        'repeats': args.repeats,
+        'seed': args.seed,
+        'results': results,
+    }
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)['results']
+        regressions = compare(results, baseline, args.threshold)
+        report['baseline'] = args.baseline
+        report['threshold'] = args.threshold
+        report['regressions'] = regressions
+        for row in regressions:
+            print(f"REGRESSION {row['engine']} size={row['size']:,} sel={row['selectivity']}: "
+                  f"{row['baseline_ms']:.1f} -> {row['best_ms']:.1f} ms ({row['change']:+.0%})")
+        print(f"{len(regressions)} regression(s) over {args.threshold:.0%} vs {args.baseline}")
+        status = 1 if regressions else 0
+
+    if args.json:
+        with open(args.json, 'w') as fh:
+            json.dump(report, fh, indent=2)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
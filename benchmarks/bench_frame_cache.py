@@ -0,0 +1,185 @@
+"""
+Frame cache benchmark: cache-hit latency of pickle versus Arrow IPC.
+
+Stores the get_df_with_sg() frame (the enriched shot table with one
+benchmark's Strokes Gained) in each store, then times get() on a hit:
+
+    pickle         pickle.loads of an in-memory blob (what st.cache_data
+                   did on every hit)
+    pickle-file    golf_analytics.cache.PickleCache, one file per key
+    arrow-mmap     data.frame_store write_frame / read_frame, one
+                   memory-mapped Arrow IPC file per key (how the
+                   warm-start snapshot stores its frames)
+
+and reports, per store and size, the best and median hit time, the
+memory the returned frame holds of its own (what a hit copied rather
+than shared with the store), the time to read every column of the returned frame once
+(mapped pages are faulted in here, not on the hit) and put() time.
+Files are read from the page cache; a cold disk adds its read time to
+the first touch of a mapped frame.
+
+    python benchmarks/bench_frame_cache.py                        # 100k and 5M shots
+    python benchmarks/bench_frame_cache.py --shots 100000 --repeats 10
+    python benchmarks/bench_frame_cache.py --json frame_cache.json
+"""
+import argparse
+import gc
+import json
+import os
+import pickle
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+import pyarrow as pa
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from data.frame_store import arrow_available, read_frame, write_frame  # noqa: E402
+from data.synthetic import generate_shots  # noqa: E402
+from engines.strokes_gained import apply_benchmark_sg  # noqa: E402
+from golf_analytics.cache import PickleCache  # noqa: E402
+
+DEFAULT_SHOTS = [100_000, 5_000_000]
+BENCHMARK = 'PGA Tour'
+KEY = 'df-with-sg'
+
+
+class PickleBlobCache:
+    """Pickled bytes in a dict: an st.cache_data hit without the hashing."""
+
+    def __init__(self):
+        self._blobs = {}
+
+    def get(self, key):
+        if key not in self._blobs:
+            return False, None
+        return True, pickle.loads(self._blobs[key])
+
+    def put(self, key, value):
+        self._blobs[key] = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class ArrowFileCache:
+    """One <key>.arrow file per key, written and memory-mapped by data.frame_store."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.arrow')
+
+    def get(self, key):
+        if not os.path.exists(self._path(key)):
+            return False, None
+        return True, read_frame(self._path(key))
+
+    def put(self, key, df):
+        write_frame(df, self._path(key))
+
+
+def _stores(directory):
+    return {
+        'pickle': PickleBlobCache(),
+        'pickle-file': PickleCache(os.path.join(directory, 'pickle')),
+        'arrow-mmap': ArrowFileCache(os.path.join(directory, 'arrow')),
+    }
+
+
+def _touch(df):
+    """Read every value of every column once."""
+    for name in df.columns:
+        values = df[name]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            values.array.codes.sum()
+        elif values.dtype.kind in 'iufMb':
+            values.to_numpy().view('u1').sum()
+        else:
+            values.nunique()
+
+
+def _copied_mb(store):
+    """Memory held by the frame a hit returns (Python/NumPy and Arrow allocations)."""
+    gc.collect()
+    arrow_before = pa.total_allocated_bytes()
+    tracemalloc.start()
+    try:
+        _, frame = store.get(KEY)
+        held = tracemalloc.get_traced_memory()[0] + pa.total_allocated_bytes() - arrow_before
+    finally:
+        tracemalloc.stop()
+    del frame
+    return held / 1e6
+
+
+def bench_store(store, df, repeats):
+    start = time.perf_counter()
+    store.put(KEY, df)
+    put_ms = (time.perf_counter() - start) * 1000
+
+    hits = []
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        hit, frame = store.get(KEY)
+        hits.append((time.perf_counter() - start) * 1000)
+        assert hit
+        del frame
+    hit, frame = store.get(KEY)
+    if not frame.equals(df):
+        raise AssertionError(f"{type(store).__name__} returned a different frame")
+    start = time.perf_counter()
+    _touch(frame)
+    touch_ms = (time.perf_counter() - start) * 1000
+    del frame
+    return {
+        'hit_best_ms': round(min(hits), 2),
+        'hit_median_ms': round(statistics.median(hits), 2),
+        'copied_mb': round(_copied_mb(store), 2),
+        'touch_ms': round(touch_ms, 1),
+        'put_ms': round(put_ms, 1),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--shots', default=','.join(map(str, DEFAULT_SHOTS)),
+                        help='comma-separated shot counts (default: 100000,5000000)')
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--json', metavar='PATH', help='write results JSON here')
+    args = parser.parse_args(argv)
+
+    if not arrow_available():
+        print("pyarrow is not installed; Arrow frame stores are unavailable")
+        return 1
+
+    print(f"{'shots':>10} {'store':<12} {'hit best':>10} {'hit median':>11} "
+          f"{'copied':>10} {'touch':>9} {'put':>9}")
+    results = []
+    for shots in (int(n) for n in args.shots.split(',')):
+        df = apply_benchmark_sg(generate_shots(shots, seed=0), BENCHMARK)
+        frame_mb = df.memory_usage(deep=True).sum() / 1e6
+        with tempfile.TemporaryDirectory() as directory:
+            for name, store in _stores(directory).items():
+                row = {'shots': len(df), 'frame_mb': round(frame_mb, 1), 'store': name,
+                       **bench_store(store, df, args.repeats)}
+                results.append(row)
+                print(f"{len(df):>10,} {name:<12} {row['hit_best_ms']:>8,.2f}ms "
+                      f"{row['hit_median_ms']:>9,.2f}ms {row['copied_mb']:>8,.1f}MB "
+                      f"{row['touch_ms']:>7,.1f}ms {row['put_ms']:>7,.0f}ms")
+        del df
+        gc.collect()
+
+    if args.json:
+        with open(args.json, 'w') as fh:
+            json.dump({'benchmark': BENCHMARK, 'results': results}, fh, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
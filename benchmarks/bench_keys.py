@@ -0,0 +1,65 @@
+"""
+Surrogate key benchmark.
+
+Times the per-hole groupby and the hole-level merge that engines run,
+keyed on the (Player, Round ID, Hole) string labels versus the packed
+int64 Hole Key from data.schema.add_surrogate_keys.
+
+    python benchmarks/bench_keys.py            # 500k shots
+    python benchmarks/bench_keys.py 2000000 5  # shots, repeats
+"""
+import gc
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_memory import make_raw_shots  # noqa: E402
+from data.schema import apply_shot_schema, add_surrogate_keys  # noqa: E402
+
+LABEL_KEYS = ['Player', 'Round ID', 'Hole']
+
+
+def _best_ms(fn, repeats):
+    fn()  # warm-up
+    gc.disable()
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    gc.enable()
+    return min(times) * 1000
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    raw = make_raw_shots(n)
+    typed = add_surrogate_keys(apply_shot_schema(raw.drop(columns='Shot ID')))
+
+    holes_raw = raw.groupby(LABEL_KEYS, as_index=False).agg(Score=('Shot', 'count'))
+    holes_key = typed.groupby('Hole Key', as_index=False).agg(Score=('Shot', 'count'))
+
+    cases = [
+        ("groupby sum   str (Player, Round ID, Hole)",
+         lambda: raw.groupby(LABEL_KEYS)['Strokes Gained'].sum()),
+        ("groupby sum   int64 Hole Key",
+         lambda: typed.groupby('Hole Key')['Strokes Gained'].sum()),
+        ("merge holes   str (Player, Round ID, Hole)",
+         lambda: raw[LABEL_KEYS].merge(holes_raw, on=LABEL_KEYS, how='left')),
+        ("merge holes   int64 Hole Key",
+         lambda: typed[['Hole Key']].merge(holes_key, on='Hole Key', how='left')),
+    ]
+
+    print(f"shots={n:,}  holes={len(holes_key):,}")
+    for label, fn in cases:
+        print(f"  {label:<45} best={_best_ms(fn, repeats):8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
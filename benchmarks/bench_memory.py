@@ -0,0 +1,70 @@
+"""
+Shot table memory benchmark.
+
+Builds a synthetic shot table in the pre-schema layout (string labels,
+int64 / float64 numerics, 'Yes'/'No' Penalty, datetime.date _date, a
+string Shot ID) and prints the per-column memory report after
+apply_shot_schema and add_surrogate_keys.
+
+    python benchmarks/bench_memory.py            # 100k shots
+    python benchmarks/bench_memory.py 1000000    # shots
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.schema import apply_shot_schema, add_surrogate_keys, memory_report  # noqa: E402
+
+
+def make_raw_shots(n, seed=0):
+    """Synthetic shots typed as load_data produced them before the schema."""
+    rng = np.random.default_rng(seed)
+    rounds = max(1, n // 70)
+    round_idx = rng.integers(0, rounds, n)
+    hole = rng.integers(1, 19, n)
+    shot = rng.integers(1, 7, n)
+    dates = pd.Timestamp('2025-01-01') + pd.to_timedelta(round_idx % 365, unit='D')
+    round_id = 'R' + pd.Series(round_idx).astype(str)
+    lies = ['Tee', 'Fairway', 'Rough', 'Sand', 'Recovery', 'Green']
+    df = pd.DataFrame({
+        'Player': 'Player ' + pd.Series(round_idx % 20).astype(str),
+        'Course': 'Course ' + pd.Series(round_idx % 12).astype(str),
+        'Tournament': 'Tourney ' + pd.Series(round_idx % 30).astype(str),
+        'Date': dates,
+        'Round ID': round_id,
+        'Hole': hole,
+        'Shot': shot,
+        'Starting Distance': rng.integers(1, 500, n).astype(float),
+        'Starting Location': rng.choice(lies, n),
+        'Ending Distance': rng.integers(0, 300, n).astype(float),
+        'Ending Location': rng.choice(lies, n),
+        'Penalty': rng.choice(['No', 'Yes'], n, p=[0.97, 0.03]),
+        'Par': rng.choice([3, 4, 5], n),
+        'Shot Type': rng.choice(
+            ['Driving', 'Approach', 'Short Game', 'Putt', 'Recovery', 'Other'], n
+        ),
+        'Strokes Gained': rng.normal(0, 0.5, n).round(4),
+    })
+    df['Shot ID'] = round_id + '-H' + df['Hole'].astype(str) + '-S' + df['Shot'].astype(str)
+    df['_date'] = df['Date'].dt.date
+    return df
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    before = make_raw_shots(n)
+    after = add_surrogate_keys(apply_shot_schema(before.drop(columns='Shot ID')))
+    report = memory_report(before, after)
+
+    with pd.option_context('display.width', 120, 'display.max_rows', 50):
+        print(f"shots={n:,}")
+        print(report.to_string())
+
+
+if __name__ == '__main__':
+    main()
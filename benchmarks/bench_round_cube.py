@@ -0,0 +1,79 @@
+"""
+Round cube benchmark.
+
+Times the whole-round metrics of one filter state (half the players)
+computed by scanning the filtered shots and holes, versus summing the
+selected rows of the per-round cube (engines.round_cube). The hole
+summary and shot partition are built once, outside the timed calls,
+as in app.py; the cube is built once per benchmark at ingest.
+
+    python benchmarks/bench_round_cube.py            # 20k shots
+    python benchmarks/bench_round_cube.py 100000 1   # shots, repeats
+"""
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.synthetic import generate_shots  # noqa: E402
+from engines.strokes_gained import apply_benchmark_sg, BENCHMARK_FILES  # noqa: E402
+from engines.hole_summary import build_hole_summary  # noqa: E402
+from engines.partition import build_shot_partition  # noqa: E402
+from engines.overview import (  # noqa: E402
+    overview_engine, build_sg_separators, build_hole_outcomes, build_scoring_by_par,
+)
+from engines.tiger5 import build_tiger5_results  # noqa: E402
+from engines.round_cube import build_round_cube  # noqa: E402
+
+
+def _best_ms(fn, repeats):
+    fn()  # warm-up
+    gc.disable()
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    gc.enable()
+    return min(times) * 1000
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    df = apply_benchmark_sg(generate_shots(n, players=12), next(iter(BENCHMARK_FILES)))
+
+    start = time.perf_counter()
+    cube = build_round_cube(df)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    players = df['Player'].cat.categories
+    filtered = df[df['Player'].isin(players[: len(players) // 2])]
+    num_rounds = filtered['Round ID'].nunique()
+    hole_summary = build_hole_summary(filtered)
+    shots = build_shot_partition(filtered)
+
+    def metrics(rollup=None):
+        t5, _, _ = build_tiger5_results(filtered, hole_summary, shots, rollup)
+        overview_engine(filtered, hole_summary, {}, {}, {}, {}, t5, shots, rollup)
+        build_sg_separators(filtered, num_rounds, shots, rollup=rollup)
+        build_hole_outcomes(hole_summary, rollup)
+        build_scoring_by_par(hole_summary, rollup)
+
+    keys = filtered['Round Key'].unique()
+    scan_ms = _best_ms(metrics, repeats)
+    cube_ms = _best_ms(lambda: metrics(cube.select(keys)), repeats)
+    select_ms = _best_ms(lambda: cube.select(keys), repeats)
+
+    print(f"shots={n:,}  rounds={len(cube):,}  selected={num_rounds:,}  "
+          f"cube build={build_ms:.0f} ms (once per benchmark)")
+    print(f"  {'scan filtered shots':<30} best={scan_ms:8.1f} ms")
+    print(f"  {'round cube rollup':<30} best={cube_ms:8.1f} ms  "
+          f"(select={select_ms:.1f} ms, {scan_ms / cube_ms:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,258 @@
+"""
+Concurrent session load test.
+
+Drives app.py with N simultaneous sessions in one process, the way one
+Streamlit server serves a coaching staff: each session is an AppTest
+(its own session state) run on its own thread, so reruns contend for the
+GIL and share the process-wide dataset and caches. Every session plays
+a seeded interaction script: first load, then random steps that change
+the SG benchmark, narrow or reset the players, or flip a widget inside
+a tab (moving averages, the rank column; switching to that tab first
+when another is open, timed as 'tab switch'), each of which reruns the
+script.
+
+Reports rerun latency percentiles (p50/p95/p99), rerun throughput and
+resident memory (start / peak / end) for each session count. The data
+comes from GOLF_DATA_SOURCE (default: a synthetic season), so no
+network is needed. Snapshots are off, and the background refresh only
+runs during the untimed warm-up.
+
+    python benchmarks/bench_sessions.py                        # 1, 2, 4 sessions
+    python benchmarks/bench_sessions.py --sessions 1,4,8 --steps 6
+    python benchmarks/bench_sessions.py --source data.csv --json load.json
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import sys
+import threading
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, 'app.py')
+sys.path.insert(0, ROOT)
+
+DEFAULT_SOURCE = 'synthetic:4000'
+
+
+# ============================================================
+# RESIDENT MEMORY
+# ============================================================
+
+def rss_mb():
+    """Current resident set size in MB (peak RSS where /proc is missing)."""
+    try:
+        with open('/proc/self/status') as fh:
+            for line in fh:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+class RssSampler(threading.Thread):
+    """Samples RSS every `interval` seconds until stopped; keeps the peak."""
+
+    def __init__(self, interval=0.1):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = rss_mb()
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.wait(self.interval):
+            self.peak = max(self.peak, rss_mb())
+
+    def stop(self):
+        self._done.set()
+        self.join()
+        self.peak = max(self.peak, rss_mb())
+        return self.peak
+
+
+# ============================================================
+# INTERACTION SCRIPT
+# ============================================================
+
+def _change_benchmark(at, rng, rerun):
+    box = at.sidebar.selectbox[0]
+    box.set_value(rng.choice([o for o in box.options if o != box.value]))
+
+
+def _narrow_players(at, rng, rerun):
+    select = at.multiselect(key='player_select')
+    options = list(select.options)
+    select.set_value(rng.sample(options, max(1, len(options) // 3)))
+
+
+def _all_players(at, rng, rerun):
+    select = at.multiselect(key='player_select')
+    select.set_value(list(select.options))
+
+
+# Widgets inside tabs, with the tab each lives in. Only the open tab
+# renders (st.tabs(key="main_tab", on_change="rerun")), so flipping one
+# first switches to its tab, which is itself a rerun
+_TAB_CHECKBOXES = [
+    ('Approach', 'approach_ma'),
+    ('Putting', 'putting_ma'),
+    ('Short Game', 'sg_ma'),
+    ('Strokes Gained', 'overview_sg_trend_ma'),
+    ('Coaches Table', 'coaches_table_show_rank'),
+]
+
+
+def _open_tab(at, label):
+    return 'main_tab' in at.session_state and at.session_state['main_tab'] == label
+
+
+def _flip_tab_widget(at, rng, rerun):
+    tab, key = rng.choice(_TAB_CHECKBOXES)
+    if not _open_tab(at, tab):
+        at.session_state['main_tab'] = tab
+        rerun('tab switch')
+    box = at.checkbox(key=key)
+    box.set_value(not box.value)
+
+
+ACTIONS = {
+    'benchmark': _change_benchmark,
+    'narrow players': _narrow_players,
+    'all players': _all_players,
+    'tab widget': _flip_tab_widget,
+}
+
+
+class Session(threading.Thread):
+    """One simulated user: a first load, then `steps` random interactions."""
+
+    def __init__(self, index, steps, seed, start, timeout):
+        super().__init__(name=f'session-{index}', daemon=True)
+        self.steps = steps
+        self.rng = random.Random(seed * 1000 + index)
+        self.start_barrier = start
+        self.timeout = timeout
+        self.reruns = []  # (action, ms)
+        self.errors = []
+
+    def _rerun(self, at, action):
+        start = time.perf_counter()
+        at.run()
+        self.reruns.append((action, (time.perf_counter() - start) * 1000))
+        self.errors.extend(str(e.value) for e in at.exception)
+
+    def run(self):
+        from streamlit.testing.v1 import AppTest
+        try:
+            at = AppTest.from_file(APP, default_timeout=self.timeout)
+            self.start_barrier.wait()
+            self._rerun(at, 'load')
+            for _ in range(self.steps):
+                action = self.rng.choice(list(ACTIONS))
+                ACTIONS[action](at, self.rng, lambda name: self._rerun(at, name))
+                self._rerun(at, action)
+        except Exception as exc:  # keep the other sessions running
+            self.errors.append(repr(exc))
+
+
+# ============================================================
+# RUN
+# ============================================================
+
+def run_level(sessions, steps, seed, timeout):
+    """Run `sessions` concurrent sessions; returns latency and RSS stats."""
+    from streamlit import config
+    # AppTest turns global.appTest on for each run and restores it after;
+    # with runs overlapping, one session's restore would turn it off under
+    # another's script, whose widgets that render for the first time (a
+    # newly opened tab's) then can't be set. Keep it on for the whole level.
+    config.set_option('global.appTest', True)
+    start = threading.Barrier(sessions)
+    users = [Session(i, steps, seed, start, timeout) for i in range(sessions)]
+    rss_start = rss_mb()
+    sampler = RssSampler()
+    sampler.start()
+    began = time.perf_counter()
+    for user in users:
+        user.start()
+    for user in users:
+        user.join()
+    wall = time.perf_counter() - began
+    rss_peak = sampler.stop()
+
+    ms = np.array([t for user in users for _, t in user.reruns])
+    by_action = {}
+    for user in users:
+        for action, t in user.reruns:
+            by_action.setdefault(action, []).append(t)
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99]) if len(ms) else (np.nan,) * 3
+    return {
+        'sessions': sessions,
+        'reruns': int(len(ms)),
+        'wall_s': round(wall, 2),
+        'reruns_per_s': round(len(ms) / wall, 3),
+        'p50_ms': round(float(p50), 1),
+        'p95_ms': round(float(p95), 1),
+        'p99_ms': round(float(p99), 1),
+        'max_ms': round(float(ms.max()), 1) if len(ms) else None,
+        'p50_ms_by_action': {a: round(float(np.median(t)), 1) for a, t in by_action.items()},
+        'rss_start_mb': round(rss_start, 1),
+        'rss_peak_mb': round(rss_peak, 1),
+        'rss_end_mb': round(rss_mb(), 1),
+        'errors': [e for user in users for e in user.errors],
+    }
+
+
+def _ints(text):
+    return [int(x) for x in text.split(',')]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sessions', type=_ints, default=[1, 2, 4],
+                        help='comma-separated concurrent session counts (default: 1,2,4)')
+    parser.add_argument('--steps', type=int, default=4, help='interactions per session')
+    parser.add_argument('--source', default=None,
+                        help=f'GOLF_DATA_SOURCE to load (default: {DEFAULT_SOURCE})')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--timeout', type=float, default=600, help='per-rerun timeout (s)')
+    parser.add_argument('--json', metavar='PATH', help='write results JSON here')
+    args = parser.parse_args(argv)
+
+    # Local data, no snapshot writes, no refresh during the run; set
+    # before app.py first imports data.load_data
+    os.environ['GOLF_DATA_SOURCE'] = args.source or os.environ.get('GOLF_DATA_SOURCE') or DEFAULT_SOURCE
+    os.environ['GOLF_SNAPSHOT_DIR'] = ''
+    os.environ['GOLF_REFRESH_SECONDS'] = str(24 * 3600)
+
+    # One untimed session loads the dataset and warms the shared caches,
+    # as an already running server would have
+    print(f"source={os.environ['GOLF_DATA_SOURCE']}  warming up ...", flush=True)
+    run_level(1, 0, args.seed, args.timeout)
+
+    levels = []
+    print(f"  {'sessions':>8} {'reruns':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+          f"{'rerun/s':>8} {'RSS peak':>9} {'RSS end':>8}")
+    for sessions in args.sessions:
+        level = run_level(sessions, args.steps, args.seed, args.timeout)
+        levels.append(level)
+        print(f"  {sessions:>8} {level['reruns']:>7} {level['p50_ms']:>9.0f} "
+              f"{level['p95_ms']:>9.0f} {level['p99_ms']:>9.0f} {level['reruns_per_s']:>8.2f} "
+              f"{level['rss_peak_mb']:>7.0f}MB {level['rss_end_mb']:>6.0f}MB", flush=True)
+        for error in level['errors'][:3]:
+            print(f"           error: {error[:200]}")
+
+    if args.json:
+        with open(args.json, 'w') as fh:
+            json.dump({'source': os.environ['GOLF_DATA_SOURCE'], 'steps': args.steps,
+                       'seed': args.seed, 'levels': levels}, fh, indent=2)
+
+
+if __name__ == '__main__':
+    main()
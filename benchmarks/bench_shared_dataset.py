@@ -0,0 +1,137 @@
+"""
+Shared dataset memory benchmark: copies vs row-index views per session.
+
+Holds the per-rerun shot state of N concurrent sessions at once in one
+process, the way a Streamlit server does while N coaches rerun, and
+reports resident memory. The dataset (SG shot table, round cube and
+shot partition) is built once and shared in both modes:
+
+    copy   each session filters with df[mask].copy() and sorts its own
+           ShotPartition (the pipeline before ShotView)
+    view   each session holds a ShotView (the shared table and its row
+           positions) and selects its partition from the shared one;
+           a frame is taken only for partial selections
+
+Sessions cycle through four filter states: every player (the sidebar
+default), half the players, one player and one tournament. Each
+(mode, sessions) pair runs in a fresh process so RSS starts clean.
+
+    python benchmarks/bench_shared_dataset.py                   # 100k shots; 1, 10, 50 sessions
+    python benchmarks/bench_shared_dataset.py --shots 1000000 --sessions 1,10
+    python benchmarks/bench_shared_dataset.py --json memory.json
+"""
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+
+from bench_sessions import rss_mb
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DEFAULT_SHOTS = 100_000
+DEFAULT_SESSIONS = [1, 10, 50]
+MODES = ('copy', 'view')
+BENCHMARK = 'PGA Tour'
+
+
+def _filters(df):
+    """The filter states sessions cycle through, as select_shots kwargs."""
+    players = sorted(df['Player'].unique())
+    return [
+        {},
+        {'players': players[:max(1, len(players) // 2)]},
+        {'players': players[:1]},
+        {'tournaments': sorted(df['Tournament'].unique())[:1]},
+    ]
+
+
+def _session_state(mode, df, partition, filters):
+    """What one session holds through a rerun: its shots and their partition."""
+    from engines.partition import build_shot_partition
+    from golf_analytics.pipeline import select_shots
+
+    view = select_shots(df, **filters)
+    if mode == 'copy':
+        filtered_df = view.frame().copy()
+        return filtered_df, build_shot_partition(filtered_df)
+    return view, view.frame(), build_shot_partition(view, partition)
+
+
+def _child(mode, shots, sessions):
+    from data.synthetic import generate_shots
+    from data.refresh import DatasetVersion, source_digest
+
+    start = rss_mb()
+    table = generate_shots(shots, seed=0)
+    dataset = DatasetVersion(table, source_digest(table))
+    df = dataset.df(BENCHMARK)
+    partition = dataset.partition(BENCHMARK)
+    del table
+    gc.collect()
+    shared = rss_mb()
+
+    filters = _filters(df)
+    held = [
+        _session_state(mode, df, partition, filters[i % len(filters)])
+        for i in range(sessions)
+    ]
+    gc.collect()
+    end = rss_mb()
+    print(json.dumps({
+        'mode': mode,
+        'sessions': len(held),
+        'shots': len(df),
+        'shared_mb': round(shared - start, 1),
+        'sessions_mb': round(end - shared, 1),
+        'per_session_mb': round((end - shared) / len(held), 2),
+        'rss_mb': round(end, 1),
+    }))
+
+
+def run(mode, shots, sessions):
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child', mode,
+         '--shots', str(shots), '--sessions', str(sessions)],
+        capture_output=True, text=True,
+    )
+    if proc.returncode:
+        raise RuntimeError(proc.stderr[-2000:])
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--shots', type=int, default=DEFAULT_SHOTS)
+    parser.add_argument('--sessions', default=','.join(map(str, DEFAULT_SESSIONS)),
+                        help='comma-separated session counts (default: 1,10,50)')
+    parser.add_argument('--json', metavar='PATH', help='write results JSON here')
+    parser.add_argument('--child', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _child(args.child, args.shots, int(args.sessions))
+        return 0
+
+    counts = [int(n) for n in args.sessions.split(',')]
+    print(f"{'sessions':>8} {'mode':<5} {'shared MB':>10} {'sessions MB':>12} "
+          f"{'per session':>12} {'RSS MB':>8}")
+    results = []
+    for sessions in counts:
+        for mode in MODES:
+            row = run(mode, args.shots, sessions)
+            results.append(row)
+            print(f"{sessions:>8} {mode:<5} {row['shared_mb']:>10,.1f} {row['sessions_mb']:>12,.1f} "
+                  f"{row['per_session_mb']:>12,.2f} {row['rss_mb']:>8,.0f}")
+
+    if args.json:
+        with open(args.json, 'w') as fh:
+            json.dump({'shots': args.shots, 'results': results}, fh, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Short game engine benchmark.
+
+Times build_short_game_results on a synthetic season of short game shots
+(about 2,000 shots: 120 rounds at ~17 short game shots each). As in app.py
+the shot partition is built once per filter state, outside the timed call.
+The engine should stay under 10 ms at this size.
+
+    python benchmarks/bench_short_game.py            # 2,000 shots
+    python benchmarks/bench_short_game.py 50000 20   # shots, repeats
+"""
+import gc
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engines.partition import build_shot_partition  # noqa: E402
+from engines.short_game import build_short_game_results  # noqa: E402
+
+TARGET_MS = 10.0
+
+
+def make_short_game_shots(n, rounds=120, seed=0):
+    """Synthetic short game shots in the load_data schema."""
+    rng = np.random.default_rng(seed)
+    round_idx = rng.integers(0, rounds, n)
+    start_lie = rng.choice(['Fairway', 'Rough', 'Sand'], n, p=[0.3, 0.45, 0.25])
+    end_lie = rng.choice(['Green', 'Fringe', 'Rough', 'Sand'], n,
+                         p=[0.85, 0.05, 0.07, 0.03])
+    dates = pd.Timestamp('2025-01-01') + pd.to_timedelta(round_idx % 365, unit='D')
+    return pd.DataFrame({
+        'Player': 'Player ' + pd.Series(round_idx % 6).astype(str),
+        'Course': 'Course ' + pd.Series(round_idx % 12).astype(str),
+        'Date': dates,
+        'Round ID': 'R' + pd.Series(round_idx).astype(str),
+        'Hole': rng.integers(1, 19, n),
+        'Shot': rng.integers(2, 5, n),
+        'Starting Distance': rng.uniform(1, 50, n).round(),
+        'Starting Location': start_lie,
+        'Ending Distance': rng.exponential(7, n).round(),
+        'Ending Location': end_lie,
+        'Penalty': 'No',
+        'Shot Type': 'Short Game',
+        'Strokes Gained': rng.normal(-0.05, 0.3, n).round(2),
+    })
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    df = make_short_game_shots(n)
+    num_rounds = df['Round ID'].nunique()
+    build_short_game_results(df, num_rounds, build_shot_partition(df))  # warm-up
+
+    # Like timeit, keep the garbage collector out of the timed calls
+    gc.disable()
+    times = []
+    for _ in range(repeats):
+        shots = build_shot_partition(df)
+        start = time.perf_counter()
+        build_short_game_results(df, num_rounds, shots)
+        times.append(time.perf_counter() - start)
+    gc.enable()
+
+    median_ms = np.median(times) * 1000
+    status = "ok" if median_ms < TARGET_MS else f"OVER {TARGET_MS:.0f} ms target"
+    print(f"build_short_game_results  shots={n:,}  "
+          f"best={min(times) * 1000:.2f} ms  median={median_ms:.2f} ms  "
+          f"shots/sec={n / min(times):,.0f}  [{status}]")
+
+
+if __name__ == '__main__':
+    main()
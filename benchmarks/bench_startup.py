@@ -0,0 +1,270 @@
+"""
+Cold-start benchmark: process start to first sidebar render.
+
+Each run is a fresh Python process that renders app.py once with
+Streamlit's AppTest, the way a new server process serves its first
+session, and records:
+
+    sidebar_ms        process start -> sidebar complete (the "sidebar"
+                      profile step in app.py); the tracked metric
+    first_render_ms   process start -> the whole first page (the open
+                      Tiger 5 tab and the engines it reads)
+    harness_ms        process start -> AppTest imported (interpreter,
+                      Streamlit and pandas; a server pays this too)
+
+Two scenarios: 'cold' starts with an empty snapshot directory (SG and
+the round cube are built from the source) and 'warm' maps the snapshot
+the cold run wrote. A separate run under `python -X importtime` breaks
+import time down by top-level package and lists which app modules
+(tabs/, engines/, Plotly) were loaded by the sidebar and by the end of
+the first render; with lazy tabs only the open tab's are.
+
+    python benchmarks/bench_startup.py                          # synthetic:20000
+    python benchmarks/bench_startup.py --source data.csv --repeats 5
+    python benchmarks/bench_startup.py --json base.json         # record
+    python benchmarks/bench_startup.py --baseline base.json     # compare
+
+Timings exclude the Streamlit server itself (Tornado, the websocket);
+they cover what its first script run does.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+APP = os.path.join(ROOT, 'app.py')
+DEFAULT_SOURCE = 'synthetic:20000'
+SCENARIOS = ('cold', 'warm')
+METRICS = ('sidebar_ms', 'first_render_ms', 'harness_ms')
+
+# Regressions: slower by more than this fraction and by at least MIN_MS
+DEFAULT_THRESHOLD = 0.25
+MIN_REGRESSION_MS = 50.0
+
+# Modules whose loading is reported (prefix match)
+WATCHED = ('tabs.', 'engines.', 'golf_analytics.', 'plotly.express', 'plotly.graph_objects')
+
+
+# ============================================================
+# CHILD — ONE FRESH PROCESS, ONE FIRST RENDER
+# ============================================================
+
+def _watched_modules():
+    return sorted(m for m in sys.modules if m.startswith(WATCHED))
+
+
+def _child(out_path):
+    t0 = float(os.environ['BENCH_T0'])
+    elapsed = lambda: (time.time() - t0) * 1000  # noqa: E731
+    marks = {}
+
+    # Note when app.py's "sidebar" step (run with the profile off too) ends
+    from engines.rerun_profile import RerunProfile
+    step = RerunProfile.step
+
+    @contextmanager
+    def marking_step(self, name, *args, **kwargs):
+        with step(self, name, *args, **kwargs) as record:
+            yield record
+        if name == 'sidebar' and 'sidebar_ms' not in marks:
+            marks['sidebar_ms'] = elapsed()
+            marks['modules_at_sidebar'] = _watched_modules()
+
+    RerunProfile.step = marking_step
+
+    from streamlit.testing.v1 import AppTest
+    marks['harness_ms'] = elapsed()
+    at = AppTest.from_file(APP, default_timeout=600)
+    at.run()
+    marks['first_render_ms'] = elapsed()
+    marks['modules_at_render'] = _watched_modules()
+    marks['exceptions'] = [e.value for e in at.exception]
+
+    with open(out_path, 'w') as fh:
+        json.dump(marks, fh)
+    sys.stdout.flush()
+    # The dataset refresher thread would otherwise keep the process alive
+    os._exit(0)
+
+
+# ============================================================
+# PARENT — RUNS, IMPORT-TIME BREAKDOWN, BASELINE
+# ============================================================
+
+def run_once(source, snapshot_dir, importtime=False):
+    """Marks of one fresh-process first render (plus stderr)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, 'marks.json')
+        cmd = [sys.executable] + (['-X', 'importtime'] if importtime else [])
+        cmd += [os.path.abspath(__file__), '--child', out]
+        env = {
+            **os.environ,
+            'GOLF_DATA_SOURCE': source,
+            'GOLF_SNAPSHOT_DIR': snapshot_dir,
+            'GOLF_PERF_LOG': os.path.join(tmp, 'perf.jsonl'),
+            'BENCH_T0': repr(time.time()),
+        }
+        proc = subprocess.run(cmd, env=env, cwd=ROOT, capture_output=True, text=True)
+        if not os.path.exists(out):
+            raise RuntimeError(f"app run failed:\n{proc.stderr[-2000:]}")
+        with open(out) as fh:
+            marks = json.load(fh)
+    if marks['exceptions']:
+        raise RuntimeError(f"app raised: {marks['exceptions']}")
+    return marks, proc.stderr
+
+
+def parse_importtime(stderr):
+    """[(module, self_us, cumulative_us)] from `-X importtime` output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def by_package(rows):
+    """Self import time (ms) and module count per top-level package, largest first."""
+    totals = defaultdict(lambda: [0.0, 0])
+    for name, self_us, _ in rows:
+        total = totals[name.split('.')[0]]
+        total[0] += self_us / 1000
+        total[1] += 1
+    return sorted(
+        ({'package': p, 'self_ms': round(ms, 1), 'modules': n} for p, (ms, n) in totals.items()),
+        key=lambda row: -row['self_ms'],
+    )
+
+
+def run_suite(source, repeats):
+    """Best/median of each metric per scenario, plus one importtime run."""
+    results = []
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        runs = {scenario: [] for scenario in SCENARIOS}
+        for _ in range(repeats):
+            # cold: no snapshot yet; the run writes one for warm
+            shutil.rmtree(snapshot_dir)
+            os.makedirs(snapshot_dir)
+            runs['cold'].append(run_once(source, snapshot_dir)[0])
+            runs['warm'].append(run_once(source, snapshot_dir)[0])
+        for scenario in SCENARIOS:
+            for metric in METRICS:
+                values = [marks[metric] for marks in runs[scenario]]
+                results.append({
+                    'scenario': scenario,
+                    'metric': metric,
+                    'best_ms': round(min(values), 1),
+                    'median_ms': round(statistics.median(values), 1),
+                })
+        marks, stderr = run_once(source, snapshot_dir, importtime=True)
+
+    rows = parse_importtime(stderr)
+    imports = {
+        'total_ms': round(sum(r[1] for r in rows) / 1000, 1),
+        'modules': len(rows),
+        'packages': by_package(rows),
+        'slowest': [
+            {'module': name, 'self_ms': round(us / 1000, 1)}
+            for name, us, _ in sorted(rows, key=lambda r: -r[1])[:15]
+        ],
+        'loaded_by_sidebar': marks['modules_at_sidebar'],
+        'loaded_by_first_render': marks['modules_at_render'],
+    }
+    return results, imports
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD, min_ms=MIN_REGRESSION_MS):
+    """
+    Rows of `results` whose best time regressed against `baseline`:
+    slower by more than `threshold` (a fraction) and by at least
+    `min_ms`. Each row gains 'baseline_ms' and 'change'.
+    """
+    base = {(row['scenario'], row['metric']): row for row in baseline}
+    regressions = []
+    for row in results:
+        before = base.get((row['scenario'], row['metric']))
+        if before is None or not before['best_ms']:
+            continue
+        change = row['best_ms'] / before['best_ms'] - 1
+        if change > threshold and row['best_ms'] - before['best_ms'] >= min_ms:
+            regressions.append({**row, 'baseline_ms': before['best_ms'], 'change': round(change, 3)})
+    return regressions
+
+
+def _print(results, imports):
+    print(f"{'scenario':<8} {'metric':<16} {'best ms':>10} {'median ms':>10}")
+    for row in results:
+        print(f"{row['scenario']:<8} {row['metric']:<16} {row['best_ms']:>10,.0f} {row['median_ms']:>10,.0f}")
+    print(f"\nimports: {imports['modules']} modules, {imports['total_ms']:,.0f} ms (self, under importtime)")
+    for row in imports['packages'][:12]:
+        print(f"  {row['package']:<24} {row['self_ms']:>8,.0f} ms  {row['modules']:>4} modules")
+    at_sidebar = set(imports['loaded_by_sidebar'])
+    later = [m for m in imports['loaded_by_first_render'] if m not in at_sidebar]
+    print(f"\napp modules by sidebar: {', '.join(imports['loaded_by_sidebar'])}")
+    print(f"then by first render:  {', '.join(later)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--source', default=DEFAULT_SOURCE,
+                        help='CSV path/URL or synthetic:<shots> (default: %(default)s)')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--json', metavar='PATH', help='write results JSON here')
+    parser.add_argument('--baseline', metavar='PATH', help='results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed slowdown as a fraction (default: 0.25)')
+    parser.add_argument('--child', metavar='PATH', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _child(args.child)
+
+    results, imports = run_suite(args.source, args.repeats)
+    _print(results, imports)
+    report = {
+        'environment': {
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'source': args.source,
+        'repeats': args.repeats,
+        'results': results,
+        'imports': imports,
+    }
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)['results']
+        regressions = compare(results, baseline, args.threshold)
+        report['baseline'] = args.baseline
+        report['threshold'] = args.threshold
+        report['regressions'] = regressions
+        for row in regressions:
+            print(f"REGRESSION {row['scenario']} {row['metric']}: "
+                  f"{row['baseline_ms']:.0f} -> {row['best_ms']:.0f} ms ({row['change']:+.0%})")
+        print(f"{len(regressions)} regression(s) over {args.threshold:.0%} vs {args.baseline}")
+        status = 1 if regressions else 0
+
+    if args.json:
+        with open(args.json, 'w') as fh:
+            json.dump(report, fh, indent=2)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,46 @@
+"""
+Synthetic data generator benchmark.
+
+Times data/synthetic.py from 1k to 10M shots: simulating the sheet
+(generate_sheet) and enriching it into the load_data schema (enrich),
+and prints per-round realism checks (shots, score to par, putts).
+
+    python benchmarks/bench_synthetic.py                  # 1k .. 1M
+    python benchmarks/bench_synthetic.py 10000000         # up to 10M
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.synthetic import generate_sheet  # noqa: E402
+from data.load_data import enrich  # noqa: E402
+
+
+def main():
+    top = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    sizes = [n for n in (1_000, 10_000, 100_000, 1_000_000, 10_000_000) if n <= top]
+
+    print(f"  {'shots':>12} {'sheet ms':>10} {'enrich ms':>10} {'MB':>8} "
+          f"{'shots/rd':>9} {'to par':>7} {'putts/rd':>9}")
+    for n in sizes:
+        start = time.perf_counter()
+        sheet = generate_sheet(shots=n, players=max(6, n // 20_000))
+        sheet_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        df = enrich(sheet)
+        enrich_ms = (time.perf_counter() - start) * 1000
+
+        rounds = df['Round ID'].nunique()
+        holes = df.drop_duplicates(['Round ID', 'Hole'])
+        to_par = (len(df) - holes['Par'].sum()) / rounds
+        putts = (df['Shot Type'] == 'Putt').sum() / rounds
+        mb = df.memory_usage(deep=True).sum() / 1e6
+        print(f"  {len(df):>12,} {sheet_ms:>10.0f} {enrich_ms:>10.0f} {mb:>8.1f} "
+              f"{len(df) / rounds:>9.1f} {to_par:>+7.1f} {putts:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Warm-start snapshot benchmark.
+
+Times what a fresh worker does before the first render, for every
+benchmark: the cold path (SG for each benchmark plus its round cube,
+from an already enriched frame, so the sheet download is not even
+counted) versus reading the warm-start snapshot (data/snapshot.py).
+Also times writing the snapshot, which runs in the background.
+
+    python benchmarks/bench_warm_start.py            # 100k shots
+    python benchmarks/bench_warm_start.py 1000000    # shots
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data import snapshot  # noqa: E402
+from data.synthetic import generate_shots  # noqa: E402
+from engines.strokes_gained import apply_benchmark_sg, BENCHMARK_FILES  # noqa: E402
+from engines.round_cube import build_round_cube  # noqa: E402
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    if not snapshot.snapshots_enabled():
+        print("pyarrow is not installed; snapshots are disabled")
+        return
+
+    shots = generate_shots(n)
+
+    start = time.perf_counter()
+    sg, cubes = {}, {}
+    for name in BENCHMARK_FILES:
+        with_sg = apply_benchmark_sg(shots, name)
+        sg[name] = with_sg['Strokes Gained'].to_numpy()
+        cubes[name] = build_round_cube(with_sg)
+    cold_ms = (time.perf_counter() - start) * 1000
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        snapshot.write_snapshot(shots, sg, cubes, 'bench', directory)
+        write_ms = (time.perf_counter() - start) * 1000
+        size = sum(
+            os.path.getsize(os.path.join(root, f))
+            for root, _, files in os.walk(directory) for f in files
+        )
+
+        snapshot._loaded.clear()  # time a fresh process's first read
+        start = time.perf_counter()
+        snap = snapshot.read_snapshot(directory)
+        for name in BENCHMARK_FILES:
+            snap.benchmark_df(name)
+            snap.round_cube(name)
+        warm_ms = (time.perf_counter() - start) * 1000
+
+    print(f"shots={n:,}  benchmarks={len(BENCHMARK_FILES)}  snapshot={size / 1e6:.1f} MB")
+    print(f"  {'cold: SG + round cube':<28} {cold_ms:9.1f} ms")
+    print(f"  {'warm: read snapshot':<28} {warm_ms:9.1f} ms  ({cold_ms / warm_ms:.1f}x)")
+    print(f"  {'write snapshot (background)':<28} {write_ms:9.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
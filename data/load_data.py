@@ -1,5 +1,14 @@
+import logging
+import os
+import threading
+
+import numpy as np
 import pandas as pd
-import streamlit as st
+
+from data.schema import apply_shot_schema, add_surrogate_keys
+from data.refresh import DatasetRefresher
+
+logger = logging.getLogger(__name__)
 
 # ============================================================
 # CONFIG
@@ -7,49 +16,66 @@ import streamlit as st
 
 SHEET_URL = "https://docs.google.com/spreadsheets/d/e/2PACX-1vTZZ8-dHrvrfl8YQnRSLpCYS6GjTHpXQm2uVuqS0X5t3yOxhciFnvxlLSSMX_gplveVmlP5Uz8nOmJF/pub?gid=0&single=true&output=csv"
 
+# Where the sheet is read from: the published sheet, a local CSV export,
+# or 'synthetic:<shots>' (data/synthetic.py) for offline runs
+DATA_SOURCE = os.environ.get('GOLF_DATA_SOURCE') or SHEET_URL
+
 
 # ============================================================
 # HELPER FUNCTIONS (LOCAL TO DATA LOADING)
 # ============================================================
 
 def determine_par(distance):
-    """Assign par based on starting distance of tee shot."""
-    if distance <= 245:
-        return 3
-    elif distance <= 475:
-        return 4
-    return 5
+    """Assign par based on starting distance of tee shot (vectorized)."""
+    distance = np.asarray(distance, dtype=float)
+    return np.select([distance <= 245, distance <= 475], [3, 4], default=5)
 
 
 def determine_shot_type(start_location, start_distance, par):
-    """Unified shot type logic."""
-    if start_distance is None:
-        return 'Other'
-    if start_location == 'Green':
-        return 'Putt'
-    if start_location == 'Tee':
-        return 'Approach' if par == 3 else 'Driving'
-    if start_location == 'Recovery':
-        return 'Recovery'
-    if start_distance < 50:
-        return 'Short Game'
-    if start_location in ['Fairway', 'Rough', 'Sand'] and 50 <= start_distance <= 245:
-        return 'Approach'
-    return 'Other'
+    """Unified shot type logic, vectorized over shots (first match wins)."""
+    loc = pd.Series(start_location)
+    dist = np.asarray(start_distance, dtype=float)
+    tee = (loc == 'Tee').to_numpy()
+    return np.select(
+        [
+            (loc == 'Green').to_numpy(),
+            tee & (np.asarray(par, dtype=float) == 3),
+            tee,
+            (loc == 'Recovery').to_numpy(),
+            dist < 50,
+            loc.isin(['Fairway', 'Rough', 'Sand']).to_numpy() & (dist >= 50) & (dist <= 245),
+        ],
+        ['Putt', 'Approach', 'Driving', 'Recovery', 'Short Game', 'Approach'],
+        default='Other',
+    )
 
 
 # ============================================================
 # MAIN DATA LOADER
 # ============================================================
 
-@st.cache_data(ttl=300)
-def load_data():
+def read_source(source=None):
+    """The raw sheet from DATA_SOURCE (or `source`)."""
+    source = source or DATA_SOURCE
+    if source.startswith('synthetic:'):
+        from data.synthetic import generate_sheet
+        return generate_sheet(shots=int(source.split(':', 1)[1]))
+    return pd.read_csv(source)
+
+
+def fetch_and_enrich():
     """
-    Load, clean, and enrich the dataset.
+    Download, clean, and enrich the dataset.
     This function is shared across all colleges.
     """
-    df = pd.read_csv(SHEET_URL)
+    return enrich(read_source())
+
 
+def enrich(df):
+    """
+    Clean and enrich a frame in the published sheet's layout (as read by
+    read_csv, or from data.synthetic) into the load_data schema.
+    """
     # Clean strings
     df['Player'] = df['Player'].str.strip().str.title()
     df['Course'] = df['Course'].str.strip().str.title()
@@ -60,9 +86,20 @@ def load_data():
         'Ending Lie': 'Ending Location',
     })
 
-    # Compute par from first shot
-    first_shots = df[df['Shot'] == 1].copy()
-    first_shots['Par'] = first_shots['Starting Distance'].apply(determine_par)
+    # Hole and Shot place a shot on a hole; rows where either is blank or
+    # not a number can't be used by any engine and are dropped
+    for col in ('Hole', 'Shot'):
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    unplaced = df['Hole'].isna() | df['Shot'].isna()
+    if unplaced.any():
+        logger.warning("dropping %d shot(s) without a Hole or Shot number", unplaced.sum())
+        df = df[~unplaced].reset_index(drop=True)
+
+    # Compute par from first shot (the tee shot; a hole whose tee shot
+    # is missing uses its first recorded shot, so every hole has a par)
+    first_shot = df.groupby(['Round ID', 'Hole'], dropna=False)['Shot'].transform('min')
+    first_shots = df[df['Shot'] == first_shot].copy()
+    first_shots['Par'] = determine_par(first_shots['Starting Distance'])
 
     df = df.merge(
         first_shots[['Round ID', 'Hole', 'Par']],
@@ -71,40 +108,69 @@ def load_data():
     )
 
     # Shot type
-    df['Shot Type'] = df.apply(
-        lambda row: determine_shot_type(
-            row['Starting Location'],
-            row['Starting Distance'],
-            row['Par']
-        ),
-        axis=1
+    df['Shot Type'] = determine_shot_type(
+        df['Starting Location'], df['Starting Distance'], df['Par']
     )
 
-    # Unique shot ID
-    df['Shot ID'] = (
-        df['Round ID'] +
-        '-H' + df['Hole'].astype(str) +
-        '-S' + df['Shot'].astype(str)
-    )
+    # Compact typed schema (categoricals, int8/float32, bool Penalty,
+    # datetime64 Date/_date) — engines rely on these types
+    df = apply_shot_schema(df)
+
+    # Integer surrogate keys (Player/Round/Hole/Shot Key) for joins and
+    # groupbys; the string labels are kept for display only
+    return add_surrogate_keys(df)
+
+
+# ============================================================
+# DATASET ACCESS — SERVED FROM THE BACKGROUND REFRESHER
+# ============================================================
+# The dataset lives in a process-wide DatasetRefresher (data/refresh.py):
+# it is loaded once (warm-start snapshot, else the sheet), then
+# revalidated and swapped in the background, so no rerun blocks on a
+# download after the first one.
+# ============================================================
+
+_refresher = None
+_refresher_lock = threading.Lock()
+
+
+def get_refresher():
+    """Process-wide DatasetRefresher, loaded and started on first use."""
+    global _refresher
+    if _refresher is None:
+        with _refresher_lock:
+            if _refresher is None:
+                refresher = DatasetRefresher(fetch_and_enrich)
+                refresher.current  # first load happens on this request
+                _refresher = refresher.start()
+    return _refresher
 
-    # Date conversion
-    df['Date'] = pd.to_datetime(df['Date'])
 
-    # Normalize distance fields to numeric (do once instead of per-engine)
-    df['Starting Distance'] = pd.to_numeric(df['Starting Distance'], errors='coerce')
-    df['Ending Distance'] = pd.to_numeric(df['Ending Distance'], errors='coerce')
+def current_dataset():
+    """
+    The DatasetVersion to serve. Take it once per rerun so every frame of
+    the rerun comes from the same version.
+    """
+    return get_refresher().current
 
-    # Pre-compute date column for fast filter comparisons (avoids repeated .dt.date calls)
-    df['_date'] = df['Date'].dt.date
 
-    return df
+def load_data():
+    """The enriched dataset of the current version."""
+    return current_dataset().shots
 
 
-@st.cache_data(ttl=300)
 def get_df_with_sg(benchmark_name: str) -> pd.DataFrame:
     """
-    Load data and compute Strokes Gained for the selected benchmark.
-    Cached per benchmark — filter changes never trigger SG recalculation.
+    Data with Strokes Gained for the selected benchmark (current version).
+    Built once per version and benchmark — filter changes never trigger SG
+    recalculation.
+    """
+    return current_dataset().df(benchmark_name)
+
+
+def get_round_cube(benchmark_name: str):
+    """
+    Per-round rollup (engines.round_cube.RoundCube) of the SG table for
+    the selected benchmark (current version).
     """
-    from engines.strokes_gained import apply_benchmark_sg
-    return apply_benchmark_sg(load_data(), benchmark_name)
+    return current_dataset().round_cube(benchmark_name)
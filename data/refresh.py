@@ -0,0 +1,211 @@
+import logging
+import os
+import threading
+import time
+
+from data.snapshot import read_snapshot, write_snapshot
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# DATASET REFRESH — STALE-WHILE-REVALIDATE
+# ============================================================
+# The dataset is served from an immutable DatasetVersion. A background
+# thread polls the source every REFRESH_SECONDS, and when the content
+# changed it builds the next version completely (SG and round cube for
+# every benchmark) off the request path, then swaps it in with a single
+# reference assignment. Reruns keep serving the previous version until
+# the swap; no request ever waits on a download once one version exists.
+# ============================================================
+
+REFRESH_SECONDS = float(os.environ.get('GOLF_REFRESH_SECONDS', 300))
+
+
+def source_digest(shots):
+    """Content digest of an enriched shot table (detects source changes)."""
+    from engines.section_cache import fingerprint
+    return fingerprint(shots)
+
+
+class DatasetVersion:
+    """
+    One immutable version of the dataset.
+
+    Attributes:
+        version: version id
+        source: content digest of the shot table
+        shots: the enriched shot table (load_data() output)
+        created: time.time() when this version was built or read
+
+    Per-benchmark SG frames and round cubes are built on first use (or
+    all at once by prebuild()) and kept for the life of the version, as
+    are shot partitions (first use only). They are shared by every
+    session: callers must treat them as read-only and select rows
+    through a ShotView instead of copying them.
+    """
+
+    def __init__(self, shots, source, version=None, frames=None, cubes=None):
+        self.shots = shots
+        self.source = source
+        self.version = version or f"{time.strftime('%Y%m%dT%H%M%S')}-{source[:12]}"
+        self.created = time.time()
+        self._frames = dict(frames or {})
+        self._cubes = dict(cubes or {})
+        self._partitions = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        from engines.strokes_gained import BENCHMARK_FILES
+        frames, cubes = {}, {}
+        for name in BENCHMARK_FILES:
+            df = snapshot.benchmark_df(name)
+            cube = snapshot.round_cube(name)
+            if df is not None and cube is not None:
+                frames[name], cubes[name] = df, cube
+        return cls(snapshot.shots, snapshot.source, snapshot.version, frames, cubes)
+
+    def df(self, benchmark_name):
+        """Shot table with Strokes Gained for one benchmark."""
+        with self._lock:
+            if benchmark_name not in self._frames:
+                from engines.strokes_gained import apply_benchmark_sg
+                self._frames[benchmark_name] = apply_benchmark_sg(self.shots, benchmark_name)
+            return self._frames[benchmark_name]
+
+    def round_cube(self, benchmark_name):
+        """RoundCube of one benchmark's shot table."""
+        df = self.df(benchmark_name)
+        with self._lock:
+            if benchmark_name not in self._cubes:
+                from engines.round_cube import build_round_cube
+                self._cubes[benchmark_name] = build_round_cube(df)
+            return self._cubes[benchmark_name]
+
+    def partition(self, benchmark_name):
+        """ShotPartition of one benchmark's whole shot table."""
+        df = self.df(benchmark_name)
+        with self._lock:
+            if benchmark_name not in self._partitions:
+                from engines.partition import build_shot_partition
+                self._partitions[benchmark_name] = build_shot_partition(df)
+            return self._partitions[benchmark_name]
+
+    def prebuild(self):
+        """Build the SG frame and round cube of every benchmark."""
+        from engines.strokes_gained import BENCHMARK_FILES
+        for name in BENCHMARK_FILES:
+            self.round_cube(name)
+
+    def write_snapshot(self):
+        """Persist this version as the warm-start snapshot."""
+        from engines.strokes_gained import BENCHMARK_FILES
+        sg = {name: self.df(name)['Strokes Gained'].to_numpy() for name in BENCHMARK_FILES}
+        cubes = {name: self.round_cube(name) for name in BENCHMARK_FILES}
+        return write_snapshot(self.shots, sg, cubes, self.source)
+
+
+class DatasetRefresher:
+    """
+    Holds the current DatasetVersion and refreshes it in the background.
+
+    The first access to `current` loads synchronously (from the warm-start
+    snapshot when there is one, else by calling fetch). start() then runs
+    refresh() every `interval` seconds on a daemon thread, the first time
+    straight away so a snapshot is revalidated (or written) at startup.
+    """
+
+    def __init__(self, fetch, interval=REFRESH_SECONDS):
+        self.fetch = fetch
+        self.interval = interval
+        self._current = None
+        self._load_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._needs_snapshot = False
+        self.last_checked = None
+        self.last_refresh_ms = None
+        self.last_error = None
+
+    @property
+    def current(self):
+        version = self._current
+        if version is not None:
+            return version
+        with self._load_lock:
+            if self._current is None:
+                snapshot = read_snapshot()
+                if snapshot is not None:
+                    self._current = DatasetVersion.from_snapshot(snapshot)
+                else:
+                    shots = self.fetch()
+                    self._current = DatasetVersion(shots, source_digest(shots))
+                    self._needs_snapshot = True
+                    self.last_checked = time.time()
+            return self._current
+
+    def refresh(self):
+        """
+        Fetch the source and, when it changed, build and swap in a new
+        version and snapshot it. Returns True if a new version was swapped.
+        """
+        with self._refresh_lock:
+            start = time.perf_counter()
+            swapped = False
+            try:
+                shots = self.fetch()
+                source = source_digest(shots)
+                current = self.current
+                if source != current.source:
+                    version = DatasetVersion(shots, source)
+                    version.prebuild()
+                    self._current = version  # atomic swap
+                    self._needs_snapshot = True
+                    swapped = True
+                if self._needs_snapshot:
+                    self._current.write_snapshot()
+                    self._needs_snapshot = False
+                self.last_checked = time.time()
+                self.last_error = None
+            except Exception as exc:
+                logger.exception("dataset refresh failed")
+                self.last_error = repr(exc)
+            self.last_refresh_ms = (time.perf_counter() - start) * 1000
+            return swapped
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.refresh()
+            self._stop.wait(self.interval)
+
+    def start(self):
+        """Start the background refresh thread (once)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name='dataset-refresh', daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def status(self):
+        """
+        Version id, age and staleness (seconds since the source was last
+        confirmed unchanged, or since the version was loaded), last refresh
+        duration and error, for display.
+        """
+        version = self.current
+        now = time.time()
+        checked = self.last_checked or version.created
+        return {
+            "version": version.version,
+            "version_age_s": now - version.created,
+            "staleness_s": now - checked,
+            "last_refresh_ms": self.last_refresh_ms,
+            "refreshing": self._refresh_lock.locked(),
+            "last_error": self.last_error,
+        }
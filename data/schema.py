@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+
+# ============================================================
+# SHOT TABLE SCHEMA — COMPACT COLUMN TYPES
+# ============================================================
+# Applied once at load time so every cached copy of the shot table is
+# stored compactly, and engines can rely on the column types below
+# instead of coercing them again.
+# ============================================================
+
+# Low-cardinality labels
+CATEGORY_COLUMNS = [
+    'Player', 'Course', 'Tournament', 'Round ID',
+    'Starting Location', 'Ending Location', 'Shot Type',
+]
+
+# Narrow numerics. Strokes Gained stays float64: its 4-decimal values
+# are compared against thresholds (-0.15, -0.25, -0.5, ...) and float32
+# rounding would move shots across them. Distances are recorded in
+# whole feet / yards and only compared against whole-number bounds.
+NUMERIC_COLUMNS = {
+    'Hole': 'int8',
+    'Shot': 'int8',
+    'Par': 'int8',
+    'Starting Distance': 'float32',
+    'Ending Distance': 'float32',
+    'Strokes Gained': 'float64',
+}
+
+
+def apply_shot_schema(df):
+    """
+    Cast the shot table to the compact schema, replacing df's columns:
+    categoricals for labels, int8 hole/shot/par, float32 distances,
+    bool Penalty ('Yes' -> True) and datetime64 Date / _date.
+    Columns that are missing are skipped. Hole, Shot and Par must be set
+    on every row (enrich() drops shots without a Hole or Shot number).
+    """
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+    for col, dtype in NUMERIC_COLUMNS.items():
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype(dtype)
+
+    if 'Penalty' in df.columns and df['Penalty'].dtype != bool:
+        df['Penalty'] = df['Penalty'].astype(str).str.strip().str.lower() == 'yes'
+
+    if 'Date' in df.columns:
+        df['Date'] = pd.to_datetime(df['Date'])
+        # Day-level copy of Date for the sidebar date filter
+        df['_date'] = df['Date'].dt.normalize()
+
+    return df
+
+
+# ------------------------------------------------------------
+# INTEGER SURROGATE KEYS
+# ------------------------------------------------------------
+# Player Key / Round Key are the category codes of Player / Round ID.
+# Hole Key packs (player, round, hole) into one int64 and Shot Key adds
+# the shot number, so joins and groupbys use a single integer column:
+#
+#     Hole Key = player << 40 | round << 8 | hole
+#     Shot Key = Hole Key << 8 | shot
+#
+# Categories are sorted, so Hole Key order matches sorting by
+# (Player, Round ID, Hole).
+
+def pack_hole_key(player_key, round_key, hole):
+    """int64 Hole Key from player / round codes and hole number."""
+    return (
+        (np.asarray(player_key, dtype=np.int64) << 40)
+        | (np.asarray(round_key, dtype=np.int64) << 8)
+        | np.asarray(hole, dtype=np.int64)
+    )
+
+
+def add_surrogate_keys(df):
+    """
+    Add Player Key, Round Key, Hole Key and Shot Key integer columns.
+    Expects the categorical Player / Round ID of apply_shot_schema.
+    """
+    df['Player Key'] = df['Player'].cat.codes.astype('int16')
+    df['Round Key'] = df['Round ID'].cat.codes.astype('int32')
+    df['Hole Key'] = pack_hole_key(df['Player Key'], df['Round Key'], df['Hole'])
+    df['Shot Key'] = (df['Hole Key'].to_numpy() << 8) | df['Shot'].to_numpy(dtype=np.int64)
+    return df
+
+
+def memory_report(before, after):
+    """
+    Per-column dtype and deep memory of two versions of the same frame,
+    with a TOTAL row. Bytes are as reported by memory_usage(deep=True).
+    """
+    before_mem = before.memory_usage(deep=True, index=False)
+    after_mem = after.memory_usage(deep=True, index=False)
+    columns = list(dict.fromkeys([*before.columns, *after.columns]))
+
+    report = pd.DataFrame({
+        'dtype_before': [str(before[c].dtype) if c in before else '' for c in columns],
+        'dtype_after': [str(after[c].dtype) if c in after else '' for c in columns],
+        'bytes_before': [int(before_mem.get(c, 0)) for c in columns],
+        'bytes_after': [int(after_mem.get(c, 0)) for c in columns],
+    }, index=columns)
+
+    total = report[['bytes_before', 'bytes_after']].sum()
+    report.loc['TOTAL'] = ['', '', int(total['bytes_before']), int(total['bytes_after'])]
+    before_bytes = report['bytes_before'].replace(0, np.nan)
+    report['saved_pct'] = ((1 - report['bytes_after'] / before_bytes) * 100).fillna(0).round(1)
+    return report
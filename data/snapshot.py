@@ -0,0 +1,196 @@
+import json
+import os
+import shutil
+import time
+
+import pandas as pd
+
+# Without pyarrow arrow_available() is False and warm start is skipped
+from data.frame_store import arrow_available, write_frame, read_frame
+
+# ============================================================
+# WARM-START SNAPSHOT — PROCESSED DATA PERSISTED TO DISK
+# ============================================================
+# After a successful load the enriched shot table, the Strokes Gained
+# column of every benchmark and each benchmark's round cube are written
+# to disk as uncompressed Feather files, so a restarted server or a new
+# worker can memory-map them instead of re-downloading the sheet and
+# recomputing SG before the first page renders. Files are written and
+# read through data/frame_store.py: the frames a reader gets are views
+# of the mapped files, not copies.
+#
+# Layout (one directory per version; CURRENT names the live one):
+#
+#     <SNAPSHOT_DIR>/CURRENT
+#     <SNAPSHOT_DIR>/<version>/manifest.json
+#     <SNAPSHOT_DIR>/<version>/shots.feather   load_data() output
+#     <SNAPSHOT_DIR>/<version>/sg.feather      one column per benchmark
+#     <SNAPSHOT_DIR>/<version>/cube-<i>.feather round cube rows, manifest order
+#
+# A version is written to a temporary directory, renamed into place and
+# only then published by atomically replacing CURRENT, so readers never
+# see a partial snapshot.
+# ============================================================
+
+SNAPSHOT_DIR = os.environ.get(
+    'GOLF_SNAPSHOT_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache', 'snapshot'),
+)
+
+# Bumped when the stored layout or the load_data schema changes; older
+# snapshots are then ignored
+SNAPSHOT_FORMAT = 1
+
+# Versions kept on disk (the live one and the one before it, which
+# readers may still have memory-mapped)
+_KEEP_VERSIONS = 2
+
+
+def snapshots_enabled(directory=SNAPSHOT_DIR):
+    """Snapshots need pyarrow and a directory (GOLF_SNAPSHOT_DIR='' disables them)."""
+    return arrow_available() and bool(directory)
+
+
+class Snapshot:
+    """
+    One warm-start version read from disk.
+
+    Attributes:
+        version: version id (also the directory name)
+        manifest: dict with source digest, creation time and benchmarks
+        shots: the load_data() shot table
+        sg: DataFrame with one Strokes Gained column per benchmark
+    """
+
+    def __init__(self, version, manifest, shots, sg, cube_rows):
+        self.version = version
+        self.manifest = manifest
+        self.shots = shots
+        self.sg = sg
+        self._cube_rows = cube_rows
+
+    @property
+    def source(self):
+        return self.manifest['source']
+
+    def benchmark_df(self, benchmark_name):
+        """The get_df_with_sg() frame for one benchmark, or None if not stored."""
+        if benchmark_name not in self.sg.columns:
+            return None
+        # Shallow: every benchmark's frame shares the mapped shot columns
+        df = self.shots.copy(deep=False)
+        df['Strokes Gained'] = self.sg[benchmark_name].to_numpy()
+        return df
+
+    def round_cube(self, benchmark_name):
+        """The RoundCube of one benchmark, or None if not stored."""
+        rows = self._cube_rows.get(benchmark_name)
+        if rows is None:
+            return None
+        from engines.round_cube import RoundCube
+        return RoundCube(rows)
+
+
+def write_snapshot(shots, sg_by_benchmark, cubes, source, directory=SNAPSHOT_DIR):
+    """
+    Write and publish a new snapshot version; returns its version id.
+
+    Args:
+        shots: load_data() output
+        sg_by_benchmark: {benchmark name: Strokes Gained array}
+        cubes: {benchmark name: RoundCube}
+        source: content digest of the source data (used to revalidate)
+    """
+    if not snapshots_enabled(directory):
+        return None
+
+    os.makedirs(directory, exist_ok=True)
+    version = f"{time.strftime('%Y%m%dT%H%M%S')}-{source[:12]}"
+    tmp = os.path.join(directory, f'.tmp-{version}-{os.getpid()}')
+    os.makedirs(tmp)
+    try:
+        benchmarks = list(sg_by_benchmark)
+        write_frame(shots.reset_index(drop=True), os.path.join(tmp, 'shots.feather'))
+        write_frame(pd.DataFrame(sg_by_benchmark), os.path.join(tmp, 'sg.feather'))
+        for i, name in enumerate(benchmarks):
+            rows = cubes[name].rounds.reset_index(drop=True)
+            rows['bogey_trains'] = rows['bogey_trains'].map(list)
+            write_frame(rows, os.path.join(tmp, f'cube-{i}.feather'))
+
+        manifest = {
+            'version': version,
+            'source': source,
+            'created': time.time(),
+            'benchmarks': benchmarks,
+            'rows': len(shots),
+            'format': SNAPSHOT_FORMAT,
+        }
+        with open(os.path.join(tmp, 'manifest.json'), 'w') as fh:
+            json.dump(manifest, fh)
+
+        final = os.path.join(directory, version)
+        if os.path.exists(final):
+            shutil.rmtree(final)
+        os.rename(tmp, final)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+    # Publish: CURRENT is swapped in one rename
+    pointer = os.path.join(directory, f'.CURRENT-{os.getpid()}')
+    with open(pointer, 'w') as fh:
+        fh.write(version)
+    os.replace(pointer, os.path.join(directory, 'CURRENT'))
+
+    _prune(directory, version)
+    return version
+
+
+def _prune(directory, current):
+    versions = sorted(
+        name for name in os.listdir(directory)
+        if not name.startswith('.') and name != 'CURRENT'
+        and os.path.isdir(os.path.join(directory, name))
+    )
+    for name in versions[:-_KEEP_VERSIONS]:
+        if name != current:
+            shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
+
+
+# Last snapshot read per directory: {directory: Snapshot}
+_loaded = {}
+
+
+def read_snapshot(directory=SNAPSHOT_DIR):
+    """
+    The live Snapshot, or None when there is none (or it can't be read).
+    The last version read is kept in memory, so repeated calls only read
+    CURRENT; callers must not modify the returned frames.
+    """
+    if not snapshots_enabled(directory):
+        return None
+    try:
+        with open(os.path.join(directory, 'CURRENT')) as fh:
+            version = fh.read().strip()
+        loaded = _loaded.get(directory)
+        if loaded is not None and loaded.version == version:
+            return loaded
+
+        path = os.path.join(directory, version)
+        with open(os.path.join(path, 'manifest.json')) as fh:
+            manifest = json.load(fh)
+        if manifest.get('format') != SNAPSHOT_FORMAT:
+            return None
+
+        shots = read_frame(os.path.join(path, 'shots.feather'))
+        sg = read_frame(os.path.join(path, 'sg.feather'))
+        cube_rows = {}
+        for i, name in enumerate(manifest['benchmarks']):
+            rows = read_frame(os.path.join(path, f'cube-{i}.feather'))
+            rows.index = pd.RangeIndex(len(rows), name='Round Key')
+            rows['bogey_trains'] = [tuple(int(x) for x in t) for t in rows['bogey_trains']]
+            cube_rows[name] = rows
+    except (OSError, ValueError, KeyError):
+        return None
+    _loaded[directory] = Snapshot(version, manifest, shots, sg, cube_rows)
+    return _loaded[directory]
@@ -0,0 +1,221 @@
+import numpy as np
+import pandas as pd
+
+# ============================================================
+# SYNTHETIC SHOT DATA — SCALE TESTING WITHOUT THE SHEET
+# ============================================================
+# Generates shot-level data in the published sheet's layout. Every hole
+# is played out as a coherent shot sequence: tee shot → fairway /
+# rough / sand / recovery → green → putts until holed, with penalties,
+# out-of-bounds re-tees and chip-ins. Each shot starts where the last
+# one ended. All holes are simulated together one stroke at a time, so
+# 10M shots take seconds.
+#
+#     generate_sheet(shots=100_000, seed=0)   # raw sheet columns
+#     generate_shots(shots=100_000, seed=0)   # load_data schema (enriched)
+#
+# Distances follow the sheet: yards off the green, feet on it; an
+# Ending Distance of 0 means holed.
+# ============================================================
+
+LIES = np.array(['Tee', 'Fairway', 'Rough', 'Sand', 'Recovery', 'Green'])
+TEE, FAIRWAY, ROUGH, SAND, RECOVERY, GREEN = range(len(LIES))
+
+# Tee-to-pin yardage range by par
+_HOLE_LENGTHS = {3: (130, 235), 4: (330, 470), 5: (490, 590)}
+# Pars of one course's 18 holes, shuffled per course
+_PAR_LAYOUT = [3] * 4 + [4] * 10 + [5] * 4
+
+# A hole is picked up (last shot holed) after this many strokes
+MAX_SHOTS = 12
+
+# Average shots per round, used to size a target shot count
+_SHOTS_PER_ROUND = 80
+
+
+def _course_layouts(rng, courses):
+    """(courses x 18) par and tee yardage arrays."""
+    pars = np.array([rng.permutation(_PAR_LAYOUT) for _ in range(courses)])
+    bounds = np.array([_HOLE_LENGTHS[p] for p in pars.ravel()]).reshape(courses, 18, 2)
+    yards = rng.integers(bounds[..., 0], bounds[..., 1] + 1)
+    return pars, yards
+
+
+def _choice(rng, options, p, size):
+    return rng.choice(np.asarray(options), size=size, p=p)
+
+
+def _play_stroke(rng, loc, dist, par, shot, skill):
+    """
+    One stroke for every active hole. Returns (end_loc, end_dist, penalty)
+    arrays; end_dist is 0 when the ball is holed.
+    """
+    n = len(loc)
+    end_loc = np.full(n, GREEN)
+    end_dist = np.zeros(n)
+    penalty = np.zeros(n, dtype=bool)
+    u = rng.random(n)
+
+    # --- Tee shots on par 4/5: drives ---------------------------------
+    drive = (loc == TEE) & (par > 3)
+    if drive.any():
+        k = drive.sum()
+        carry = rng.normal(265, 25, k) + 10 * skill[drive]
+        left = np.maximum(dist[drive] - carry, 25)
+        lie = _choice(rng, [FAIRWAY, ROUGH, SAND, RECOVERY], [0.56, 0.3, 0.08, 0.06], k)
+        ob = u[drive] < 0.025
+        water = ~ob & (u[drive] < 0.045)
+        end_loc[drive] = np.where(ob, TEE, np.where(water, ROUGH, lie))
+        end_dist[drive] = np.where(ob, dist[drive], left)
+        penalty[drive] = ob | water
+
+    # --- Long shots still out of reach (par 5 seconds, punch outs) -----
+    layup = (loc != GREEN) & (loc != TEE) & (dist > 250)
+    if layup.any():
+        k = layup.sum()
+        advance = np.where(loc[layup] == RECOVERY, rng.uniform(60, 140, k),
+                           rng.normal(215, 25, k))
+        end_loc[layup] = _choice(rng, [FAIRWAY, ROUGH, SAND], [0.6, 0.3, 0.1], k)
+        end_dist[layup] = np.maximum(dist[layup] - advance, 20)
+
+    # --- Approaches (par 3 tee shots and 50–250 yds) -------------------
+    approach = ((loc == TEE) & (par == 3)) | (
+        (loc != GREEN) & (loc != TEE) & (dist >= 50) & (dist <= 250)
+    )
+    if approach.any():
+        k = approach.sum()
+        d = dist[approach]
+        lie_penalty = np.select(
+            [loc[approach] == ROUGH, loc[approach] == SAND, loc[approach] == RECOVERY],
+            [0.12, 0.2, 0.35], default=0.0,
+        )
+        p_green = np.clip(0.92 - d / 380 - lie_penalty + 0.05 * skill[approach], 0.1, 0.95)
+        on = u[approach] < p_green
+        feet = np.maximum(1, d * rng.lognormal(-1.6, 0.6, k))
+        miss_lie = _choice(rng, [FAIRWAY, ROUGH, SAND, RECOVERY], [0.15, 0.5, 0.27, 0.08], k)
+        water = ~on & (rng.random(k) < 0.04)
+        end_loc[approach] = np.where(on, GREEN, np.where(water, ROUGH, miss_lie))
+        end_dist[approach] = np.where(on, feet, rng.uniform(4, 45, k))
+        penalty[approach] = water
+
+    # --- Short game (under 50 yds, off the green) -----------------------
+    short = (loc != GREEN) & (loc != TEE) & (dist < 50)
+    if short.any():
+        k = short.sum()
+        d = dist[short]
+        p_green = np.where(loc[short] == SAND, 0.78, 0.88) + 0.03 * skill[short]
+        on = u[short] < p_green
+        holed = on & (rng.random(k) < np.clip(0.08 - d / 800, 0.01, 0.08))
+        feet = np.maximum(1, 3 * d * rng.uniform(0.05, 0.35, k))
+        end_loc[short] = np.where(on, GREEN, _choice(rng, [ROUGH, SAND], [0.75, 0.25], k))
+        end_dist[short] = np.where(holed, 0, np.where(on, feet, np.maximum(2, d * rng.uniform(0.2, 0.7, k))))
+
+    # --- Putts -----------------------------------------------------------
+    putt = loc == GREEN
+    if putt.any():
+        k = putt.sum()
+        ft = dist[putt]
+        p_make = 1 / (1 + (ft / (8 + skill[putt])) ** 1.8)
+        made = u[putt] < p_make
+        leave = np.maximum(1, ft * rng.uniform(0.03, 0.25, k) + rng.exponential(1.0, k))
+        end_loc[putt] = GREEN
+        end_dist[putt] = np.where(made, 0, leave)
+
+    # Pick the hole up after MAX_SHOTS strokes
+    last = shot >= MAX_SHOTS
+    end_loc[last] = GREEN
+    end_dist[last] = 0
+    # Whole feet / yards; every ball not holed is at least 1 away
+    return end_loc, np.round(end_dist), penalty
+
+
+def _take(labels, codes):
+    """String column of labels[codes] (one Arrow take, no per-row strings)."""
+    return pd.array(list(labels), dtype='str').take(codes)
+
+
+def _rounds_plan(rng, rounds, players, courses, tournaments, start_date):
+    """Per-round player, course, tournament and date (rounds split over players)."""
+    player = np.arange(rounds) % players
+    round_no = np.arange(rounds) // players
+    course = (round_no + player) % courses
+    tournament = round_no // 2 % tournaments
+    # Weekly rounds, wrapping within one season
+    date = (pd.Timestamp(start_date)
+            + pd.to_timedelta(round_no * 7 % 364 + rng.integers(0, 3, rounds), unit='D'))
+    return player, round_no, course, tournament, date
+
+
+def generate_sheet(shots=None, players=6, rounds=48, courses=3, tournaments=None,
+                   seed=0, start_date='2025-01-01'):
+    """
+    Synthetic shots in the published sheet's columns (Player ... Ending
+    Lie, Penalty 'Yes'/'No'), one row per shot, ordered by round, hole and
+    shot. Pass `shots` to size the data (whole rounds, ~80 shots each)
+    instead of `rounds`.
+    """
+    rng = np.random.default_rng(seed)
+    if shots is not None:
+        rounds = max(1, round(shots / _SHOTS_PER_ROUND))
+    tournaments = tournaments or max(1, min(26, rounds // players // 2))
+
+    pars, yards = _course_layouts(rng, courses)
+    player, round_no, course, tournament, date = _rounds_plan(
+        rng, rounds, players, courses, tournaments, start_date
+    )
+    skill = rng.normal(0, 1, players)
+
+    # One entry per hole: (round, hole)
+    hole_round = np.repeat(np.arange(rounds), 18)
+    hole_no = np.tile(np.arange(18), rounds)
+    hole_par = pars[course[hole_round], hole_no]
+    hole_skill = skill[player[hole_round]]
+
+    loc = np.full(len(hole_round), TEE)
+    dist = yards[course[hole_round], hole_no].astype(float)
+    active = np.arange(len(hole_round))
+    shot = 1
+    parts = []
+    while len(active):
+        end_loc, end_dist, penalty = _play_stroke(
+            rng, loc[active], dist[active], hole_par[active], shot, hole_skill[active]
+        )
+        parts.append((active, np.full(len(active), shot), dist[active], loc[active],
+                      end_dist, end_loc, penalty))
+        loc[active], dist[active] = end_loc, end_dist
+        active = active[end_dist > 0]
+        shot += 1
+
+    hole, shot_no, start_dist, start_loc, end_dist, end_loc, penalty = (
+        np.concatenate(col) for col in zip(*parts)
+    )
+    order = np.lexsort((shot_no, hole))
+    hole = hole[order]
+    rnd = hole_round[hole]
+    pid = player[rnd]
+
+    round_ids = [f"P{p}R{r}" for p, r in zip(player, round_no)]
+    return pd.DataFrame({
+        'Player': _take([f"Player {i}" for i in range(players)], pid),
+        'Course': _take([f"Course {i}" for i in range(courses)], course[rnd]),
+        'Tournament': _take([f"Tourney {i}" for i in range(tournaments)], tournament[rnd]),
+        'Date': _take(date.strftime('%Y-%m-%d'), rnd),
+        'Round ID': _take(round_ids, rnd),
+        'Hole': hole_no[hole] + 1,
+        'Shot': shot_no[order],
+        'Starting Distance': start_dist[order],
+        'Starting Location': _take(LIES, start_loc[order]),
+        'Ending Distance': end_dist[order],
+        'Ending Lie': _take(LIES, end_loc[order]),
+        'Penalty': _take(['No', 'Yes'], penalty[order].astype(np.intp)),
+    })
+
+
+def generate_shots(shots=None, seed=0, **kwargs):
+    """
+    Synthetic shots enriched into the load_data schema (typed columns,
+    Par, Shot Type and surrogate keys) by the same data.load_data.enrich
+    the sheet goes through. Accepts generate_sheet's arguments.
+    """
+    from data.load_data import enrich
+    return enrich(generate_sheet(shots=shots, seed=seed, **kwargs))
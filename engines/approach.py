@@ -1,8 +1,9 @@
 import numpy as np
 import pandas as pd
 from ui.formatters import round_label
+from engines.partition import shot_type_slice
 from engines.helpers import (
-    approach_distance_bucket, rough_distance_bucket, zone_distance_bucket,
+    bucket_codes, penalty_labels,
     APPROACH_BUCKETS, ROUGH_BUCKETS, ZONE_BUCKETS, ZONE_RANGES
 )
 
@@ -10,30 +11,137 @@ from engines.helpers import (
 # APPROACH ENGINE
 # ============================================================
 
+# Distance cells: <50 yds, then APPROACH_BUCKETS (50–100 ... >200)
+_DISTANCE_BINS = [-np.inf, 50, 100, 150, 200, np.inf]
+# ZONE_BUCKETS edges (Green 75–125, Yellow 125–175, Red 175–225)
+_ZONE_BINS = [75, 125, 175, 225]
+# Cells below 150 yds (<50, 50–100, 100–150) form the "<150" rough bucket
+_ROUGH_CELLS = {"<150": [0, 1, 2], ">150": [3, 4]}
 
+_HEATMAP_LIES = ['Tee', 'Fairway', 'Rough', 'Sand']
 
-def _compute_bucket_metrics(bdf):
-    """Compute standard metrics for a bucket slice."""
-    if bdf.empty:
+
+def _build_cube(df):
+    """
+    One grouped aggregation over (distance cell, zone, starting lie).
+
+    Each stat is a 3-D array of per-group sums; index 0 on every axis holds
+    rows with no cell / no zone / no lie. Returns (cube, lies).
+    """
+    dist = df['Starting Distance'].to_numpy(dtype=float)
+    sg = df['Strokes Gained'].to_numpy(dtype=float)
+    end = df['Ending Distance'].to_numpy(dtype=float)
+
+    cell = bucket_codes(dist, _DISTANCE_BINS) + 1
+    zone = bucket_codes(dist, _ZONE_BINS) + 1
+    lie_codes, lies = pd.factorize(df['Starting Location'])
+    lie = lie_codes + 1
+
+    shape = (len(_DISTANCE_BINS), len(_ZONE_BINS), len(lies) + 1)
+    flat = np.ravel_multi_index((cell, zone, lie), shape)
+    size = int(np.prod(shape))
+
+    def _sum(weights=None):
+        return np.bincount(flat, weights=weights, minlength=size).reshape(shape)
+
+    has_sg = ~np.isnan(sg)
+    has_end = ~np.isnan(end)
+    cube = {
+        "shots": _sum(),
+        "sg_sum": _sum(np.where(has_sg, sg, 0.0)),
+        "sg_n": _sum(has_sg),
+        "prox_sum": _sum(np.where(has_end, end, 0.0)),
+        "prox_n": _sum(has_end),
+        "greens": _sum(df['Ending Location'].to_numpy() == 'Green'),
+        "positive": _sum(sg >= 0.0),
+        "poor": _sum(sg <= -0.15),
+    }
+    return cube, list(lies)
+
+
+def _select(cube, lies, cells=None, zones=None, lie_names=None):
+    """
+    Sum every stat over a selection of the cube.
+
+    cells index APPROACH cells (0 = <50, 1.. = APPROACH_BUCKETS), zones
+    index ZONE_BUCKETS and lie_names are Starting Location values; None
+    selects everything on that axis (including rows with no value).
+    """
+    n_cells, n_zones, n_lies = cube["shots"].shape
+    ci = range(n_cells) if cells is None else [c + 1 for c in cells]
+    zi = range(n_zones) if zones is None else [z + 1 for z in zones]
+    li = range(n_lies) if lie_names is None else [
+        lies.index(name) + 1 for name in lie_names if name in lies
+    ]
+    sel = np.ix_(list(ci), list(zi), list(li))
+    return {k: v[sel].sum() for k, v in cube.items()}
+
+
+def _compute_bucket_metrics(totals):
+    """Compute standard metrics from a selection's summed stats."""
+    shots = int(totals["shots"])
+    if shots == 0:
         return {"total_sg": 0.0, "sg_per_shot": 0.0, "prox": 0.0,
                 "green_hit_pct": 0.0, "shots": 0}
-    shots = len(bdf)
-    greens = (bdf['Ending Location'] == 'Green').sum()
     return {
-        "total_sg": bdf['Strokes Gained'].sum(),
-        "sg_per_shot": bdf['Strokes Gained'].mean(),
-        "prox": bdf['Ending Distance'].mean(),
-        "green_hit_pct": greens / shots * 100 if shots > 0 else 0.0,
+        "total_sg": totals["sg_sum"],
+        "sg_per_shot": (totals["sg_sum"] / totals["sg_n"]
+                        if totals["sg_n"] else np.nan),
+        "prox": (totals["prox_sum"] / totals["prox_n"]
+                 if totals["prox_n"] else np.nan),
+        "green_hit_pct": totals["greens"] / shots * 100,
         "shots": shots,
     }
 
 
-def build_approach_results(filtered_df, num_rounds):
+def _build_heatmaps(cube, lies):
+    """SG/shot and attempts by (distance bucket, starting lie)."""
+    # Collapse zones; drop the no-lie column and the <50 / missing cells
+    sg_sum = cube["sg_sum"].sum(axis=1)[2:, 1:]
+    sg_n = cube["sg_n"].sum(axis=1)[2:, 1:]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(sg_n > 0, sg_sum / np.where(sg_n > 0, sg_n, 1), np.nan)
+
+    heatmap_sg = pd.DataFrame(mean, index=APPROACH_BUCKETS, columns=lies)
+    heatmap_counts = pd.DataFrame(sg_n.astype(int), index=APPROACH_BUCKETS,
+                                  columns=lies)
+
+    # Keep buckets / lies that have data, in canonical order
+    bucket_order = [b for b, n in zip(APPROACH_BUCKETS, sg_n.sum(axis=1)) if n > 0]
+    present = {lie for lie, n in zip(lies, sg_n.sum(axis=0)) if n > 0}
+    if not bucket_order:
+        return pd.DataFrame(), pd.DataFrame()
+    ordered_cols = [c for c in _HEATMAP_LIES if c in present]
+
+    heatmap_sg = heatmap_sg.reindex(index=bucket_order, columns=ordered_cols)
+    heatmap_counts = heatmap_counts.reindex(index=bucket_order,
+                                            columns=ordered_cols, fill_value=0)
+    heatmap_sg.index.name = heatmap_counts.index.name = 'Bucket'
+    heatmap_sg.columns.name = heatmap_counts.columns.name = 'Starting Location'
+
+    # Cells with 0 attempts should be NaN in SG so heatmap renders them blank
+    heatmap_sg = heatmap_sg.where(heatmap_counts > 0, other=np.nan)
+    return heatmap_sg, heatmap_counts
+
+
+# Shot table columns build_approach_results reads
+APPROACH_COLUMNS = (
+    'Player', 'Course', 'Date', 'Round ID', 'Hole', 'Shot',
+    'Starting Distance', 'Starting Location', 'Ending Distance',
+    'Ending Location', 'Penalty', 'Shot Type', 'Strokes Gained',
+)
+
+
+def build_approach_results(filtered_df, num_rounds, shots=None):
     """
     Compute all approach analytics for the Approach tab.
+
+    Bucket, zone, rough, heatmap and best/worst outputs are all derived
+    from one aggregation over (distance cell, zone, starting lie).
     """
 
-    df = filtered_df[filtered_df['Shot Type'] == 'Approach'].copy()
+    df = shot_type_slice(filtered_df, 'Approach', shots)
     num_approach = len(df)
 
     empty_return = {
@@ -73,50 +181,41 @@ def build_approach_results(filtered_df, num_rounds):
     if num_approach == 0:
         return empty_return
 
-    # Ensure distances are numeric
-    df['Starting Distance'] = pd.to_numeric(df['Starting Distance'], errors='coerce')
-    df['Ending Distance'] = pd.to_numeric(df['Ending Distance'], errors='coerce')
+    cube, lies = _build_cube(df)
+    overall = _select(cube, lies)
 
     # --- Basic SG ---
     total_sg = df['Strokes Gained'].sum()
     sg_per_round = total_sg / num_rounds if num_rounds > 0 else 0
 
     # --- Section 1: Hero metrics ---
-    fairway_df = df[df['Starting Location'] == 'Fairway']
-    rough_df = df[df['Starting Location'] == 'Rough']
-
-    sg_fairway = fairway_df['Strokes Gained'].sum() if not fairway_df.empty else 0.0
-    sg_rough = rough_df['Strokes Gained'].sum() if not rough_df.empty else 0.0
+    sg_fairway = _select(cube, lies, lie_names=['Fairway'])["sg_sum"]
+    sg_rough = _select(cube, lies, lie_names=['Rough'])["sg_sum"]
 
-    positive_shot_rate = (df['Strokes Gained'] >= 0.0).sum() / num_approach * 100
-    poor_shot_rate = (df['Strokes Gained'] <= -0.15).sum() / num_approach * 100
-
-    # --- Bucket assignment ---
-    df['Bucket'] = df['Starting Distance'].apply(approach_distance_bucket)
+    positive_shot_rate = overall["positive"] / num_approach * 100
+    poor_shot_rate = overall["poor"] / num_approach * 100
 
     # --- Section 2: Fairway/Tee performance by distance ---
-    ft_df = df[df['Starting Location'].isin(['Fairway', 'Tee'])]
-    fairway_tee_metrics = {}
-    for b in APPROACH_BUCKETS:
-        bdf = ft_df[ft_df['Bucket'] == b]
-        fairway_tee_metrics[b] = _compute_bucket_metrics(bdf)
+    fairway_tee_metrics = {
+        b: _compute_bucket_metrics(
+            _select(cube, lies, cells=[i + 1], lie_names=['Fairway', 'Tee'])
+        )
+        for i, b in enumerate(APPROACH_BUCKETS)
+    }
 
     # --- Section 2: Rough performance by distance ---
-    rough_metrics = {}
-    for rb in ROUGH_BUCKETS:
-        if rb == "<150":
-            bdf = rough_df[rough_df['Starting Distance'] < 150]
-        else:
-            bdf = rough_df[rough_df['Starting Distance'] >= 150]
-        rough_metrics[rb] = _compute_bucket_metrics(bdf)
+    rough_metrics = {
+        rb: _compute_bucket_metrics(
+            _select(cube, lies, cells=_ROUGH_CELLS[rb], lie_names=['Rough'])
+        )
+        for rb in ROUGH_BUCKETS
+    }
 
     # --- Zone Performance (all approach shots combined) ---
-    df['Zone'] = df['Starting Distance'].apply(zone_distance_bucket)
-    zone_metrics = {}
-
-    for zone in ZONE_BUCKETS:
-        zdf = df[df['Zone'] == zone]
-        zone_metrics[zone] = _compute_bucket_metrics(zdf)
+    zone_metrics = {
+        zone: _compute_bucket_metrics(_select(cube, lies, zones=[i]))
+        for i, zone in enumerate(ZONE_BUCKETS)
+    }
 
     # --- Section 2: Best / worst bucket by Total SG ---
     all_buckets = {}
@@ -132,60 +231,23 @@ def build_approach_results(filtered_df, num_rounds):
 
     # --- Section 3: Approach Profile (horizontal bar chart data) ---
     profile_rows = []
-    for b in APPROACH_BUCKETS:
-        bdf = ft_df[ft_df['Bucket'] == b]
-        m = _compute_bucket_metrics(bdf)
-        profile_rows.append({
-            "Category": f"{b}",
-            "Group": "Fairway / Tee",
-            "Green Hit %": m["green_hit_pct"],
-            "Total SG": m["total_sg"],
-            "Proximity": m["prox"],
-        })
-    for rb in ROUGH_BUCKETS:
-        if rb == "<150":
-            bdf = rough_df[rough_df['Starting Distance'] < 150]
-        else:
-            bdf = rough_df[rough_df['Starting Distance'] >= 150]
-        m = _compute_bucket_metrics(bdf)
-        profile_rows.append({
-            "Category": f"{rb}",
-            "Group": "Rough",
-            "Green Hit %": m["green_hit_pct"],
-            "Total SG": m["total_sg"],
-            "Proximity": m["prox"],
-        })
+    for group, metrics in (("Fairway / Tee", fairway_tee_metrics),
+                           ("Rough", rough_metrics)):
+        for b, m in metrics.items():
+            profile_rows.append({
+                "Category": f"{b}",
+                "Group": group,
+                "Green Hit %": m["green_hit_pct"],
+                "Total SG": m["total_sg"],
+                "Proximity": m["prox"],
+            })
     profile_df = pd.DataFrame(profile_rows)
 
     # --- Section 4: Heatmap — Y=distance bucket, X=starting location ---
-    loc_order = ['Tee', 'Fairway', 'Rough', 'Sand']
-    heatmap_sg_data = df.groupby(['Bucket', 'Starting Location'])['Strokes Gained'].mean().reset_index()
-    heatmap_cnt_data = df.groupby(['Bucket', 'Starting Location'])['Strokes Gained'].count().reset_index()
-    heatmap_cnt_data.rename(columns={'Strokes Gained': 'Attempts'}, inplace=True)
-
-    if not heatmap_sg_data.empty:
-        heatmap_sg = heatmap_sg_data.pivot_table(
-            index='Bucket', columns='Starting Location',
-            values='Strokes Gained'
-        )
-        heatmap_counts = heatmap_cnt_data.pivot_table(
-            index='Bucket', columns='Starting Location',
-            values='Attempts', fill_value=0
-        )
-        # Reindex to consistent order; missing combos stay NaN for SG, 0 for counts
-        ordered_cols = [c for c in loc_order if c in heatmap_sg.columns]
-        bucket_order = [b for b in APPROACH_BUCKETS if b in heatmap_sg.index]
-        heatmap_sg = heatmap_sg.reindex(index=bucket_order, columns=ordered_cols)
-        heatmap_counts = heatmap_counts.reindex(index=bucket_order, columns=ordered_cols,
-                                                 fill_value=0)
-        # Cells with 0 attempts should be NaN in SG so heatmap renders them blank
-        heatmap_sg = heatmap_sg.where(heatmap_counts > 0, other=np.nan)
-    else:
-        heatmap_sg = pd.DataFrame()
-        heatmap_counts = pd.DataFrame()
+    heatmap_sg, heatmap_counts = _build_heatmaps(cube, lies)
 
     # --- Section 5: Outcome distribution by ending location ---
-    outcome_agg = df.groupby('Ending Location').agg(
+    outcome_agg = df.groupby('Ending Location', observed=True).agg(
         Shots=('Strokes Gained', 'count'),
         **{'Total SG': ('Strokes Gained', 'sum')}
     ).reset_index()
@@ -193,16 +255,16 @@ def build_approach_results(filtered_df, num_rounds):
     outcome_df = outcome_agg.sort_values('Shots', ascending=False).reset_index(drop=True)
 
     # --- Section 6: Trend by round (unchanged) ---
-    round_trend = df.groupby('Round ID').agg(
+    round_trend = df.groupby('Round ID', observed=True).agg(
         Date=('Date', 'first'),
         Course=('Course', 'first'),
         **{'Strokes Gained': ('Strokes Gained', 'sum')}
     ).reset_index()
     round_trend['Date'] = pd.to_datetime(round_trend['Date'])
     round_trend = round_trend.sort_values('Date')
-    round_trend['Label'] = round_trend.apply(
-        lambda r: round_label(r['Date'], r['Course']), axis=1
-    )
+    round_trend['Label'] = [
+        round_label(d, c) for d, c in zip(round_trend['Date'], round_trend['Course'])
+    ]
 
     # --- Section 7: Shot detail table ---
     detail_df = df[['Player', 'Date', 'Course', 'Hole', 'Shot',
@@ -213,6 +275,7 @@ def build_approach_results(filtered_df, num_rounds):
         'Starting Location': 'Starting Lie',
         'Ending Location': 'Ending Lie',
     })
+    detail_df['Penalty'] = penalty_labels(detail_df['Penalty'])
     detail_df = detail_df.sort_values(['Date', 'Course', 'Hole', 'Shot'],
                                        ascending=[False, True, True, True])
 
@@ -1,5 +1,7 @@
 import pandas as pd
-from engines.helpers import zone_distance_bucket, safe_divide
+from engines.helpers import safe_divide
+from engines.partition import build_shot_partition
+from engines.putting import build_putt_sequence
 
 # ============================================================
 # COACHES TABLE ENGINE
@@ -27,6 +29,9 @@ def _calculate_player_metrics(player, tournament, player_df, player_holes):
         # Return zeros for all metrics if no data
         return _empty_player_row(player)
 
+    # One shot-type partition per player, shared by every metric group
+    shots = build_shot_partition(player_df)
+
     # Calculate all metrics
     metrics = {
         'Player': player,
@@ -37,7 +42,7 @@ def _calculate_player_metrics(player, tournament, player_df, player_holes):
     metrics['Avg Score'] = player_holes['Hole Score'].sum() / num_rounds
 
     # --- TIGER 5 METRICS ---
-    tiger5 = _calculate_tiger5_metrics(player_df, player_holes, num_rounds)
+    tiger5 = _calculate_tiger5_metrics(player_df, player_holes, num_rounds, shots)
     metrics.update(tiger5)
 
     # --- SCORING FAILS (total of all Tiger 5 categories) ---
@@ -48,23 +53,23 @@ def _calculate_player_metrics(player, tournament, player_df, player_holes):
     metrics.update(momentum)
 
     # --- SG METRICS ---
-    sg_metrics = _calculate_sg_metrics(player_df, num_rounds)
+    sg_metrics = _calculate_sg_metrics(player_df, num_rounds, shots)
     metrics.update(sg_metrics)
 
     # --- DRIVING DETAILS ---
-    driving = _calculate_driving_metrics(player_df, num_rounds)
+    driving = _calculate_driving_metrics(shots, num_rounds)
     metrics.update(driving)
 
     # --- APPROACH ZONE SG ---
-    approach_zones = _calculate_approach_zones(player_df)
+    approach_zones = _calculate_approach_zones(shots)
     metrics.update(approach_zones)
 
     # --- SHORT GAME METRICS ---
-    short_game = _calculate_short_game_metrics(player_df)
+    short_game = _calculate_short_game_metrics(shots)
     metrics.update(short_game)
 
     # --- PUTTING METRICS ---
-    putting = _calculate_putting_metrics(player_df)
+    putting = _calculate_putting_metrics(shots)
     metrics.update(putting)
 
     return metrics
@@ -107,7 +112,7 @@ def _empty_player_row(player):
     }
 
 
-def _calculate_tiger5_metrics(player_df, player_holes, num_rounds):
+def _calculate_tiger5_metrics(player_df, player_holes, num_rounds, shots):
     """Calculate Tiger 5 metrics per round (pattern from tiger5.py)."""
     # 3 Putts per round
     three_putts = (player_holes['num_putts'] >= 3).sum() if 'num_putts' in player_holes.columns else 0
@@ -120,10 +125,10 @@ def _calculate_tiger5_metrics(player_df, player_holes, num_rounds):
     par5_bogeys = (par5_holes['Hole Score'] >= 6).sum() if not par5_holes.empty else 0
 
     # Missed Green per round (short game shots not ending on green)
-    sg_shots = player_df[player_df['Shot Type'] == 'Short Game'].copy()
+    sg_shots = shots.get('Short Game')
     if not sg_shots.empty:
-        sg_shots['missed_green'] = sg_shots['Ending Location'] != 'Green'
-        by_hole = sg_shots.groupby(['Round ID', 'Hole']).agg(
+        sg_shots = sg_shots.assign(missed_green=sg_shots['Ending Location'] != 'Green')
+        by_hole = sg_shots.groupby('Hole Key').agg(
             any_missed=('missed_green', 'any')
         ).reset_index()
         missed_green_count = by_hole['any_missed'].sum()
@@ -140,11 +145,11 @@ def _calculate_tiger5_metrics(player_df, player_holes, num_rounds):
             ((player_df['Shot'] == 1) & (player_df['Par'] == 3))
         )
     )
-    candidates = player_df[cond][['Round ID', 'Hole']].drop_duplicates()
+    candidates = player_df.loc[cond, ['Hole Key']].drop_duplicates()
     if not candidates.empty:
         with_score = candidates.merge(
-            player_holes[['Round ID', 'Hole', 'Hole Score', 'Par']],
-            on=['Round ID', 'Hole'], how='left'
+            player_holes[['Hole Key', 'Hole Score', 'Par']],
+            on='Hole Key', how='left'
         )
         bogey_125 = (with_score['Hole Score'] > with_score['Par']).sum()
     else:
@@ -233,17 +238,17 @@ def _calculate_momentum_metrics(player_holes, num_rounds):
     }
 
 
-def _calculate_sg_metrics(player_df, num_rounds):
+def _calculate_sg_metrics(player_df, num_rounds, shots):
     """Calculate SG metrics by shot type."""
     # Total SG
     total_sg = player_df['Strokes Gained'].sum()
 
     # SG by shot type
-    sg_driving = player_df[player_df['Shot Type'] == 'Driving']['Strokes Gained'].sum()
-    sg_approach = player_df[player_df['Shot Type'] == 'Approach']['Strokes Gained'].sum()
-    sg_short_game = player_df[player_df['Shot Type'] == 'Short Game']['Strokes Gained'].sum()
-    sg_putting = player_df[player_df['Shot Type'] == 'Putt']['Strokes Gained'].sum()
-    sg_other = player_df[player_df['Shot Type'] == 'Other']['Strokes Gained'].sum()
+    sg_driving = shots.get('Driving')['Strokes Gained'].sum()
+    sg_approach = shots.get('Approach')['Strokes Gained'].sum()
+    sg_short_game = shots.get('Short Game')['Strokes Gained'].sum()
+    sg_putting = shots.get('Putt')['Strokes Gained'].sum()
+    sg_other = shots.get('Other')['Strokes Gained'].sum()
 
     return {
         'SG/Rd': total_sg / num_rounds,
@@ -255,9 +260,9 @@ def _calculate_sg_metrics(player_df, num_rounds):
     }
 
 
-def _calculate_driving_metrics(player_df, num_rounds):
+def _calculate_driving_metrics(shots, num_rounds):
     """Calculate driving detail metrics (pattern from driving.py)."""
-    drives = player_df[player_df['Shot Type'] == 'Driving'].copy()
+    drives = shots.get('Driving')
 
     if drives.empty:
         return {'Obs%': 0.0, 'Pen%': 0.0, 'FW%': 0.0}
@@ -269,7 +274,7 @@ def _calculate_driving_metrics(player_df, num_rounds):
     obstruction_rate = safe_divide(non_playable, total_drives) * 100
 
     # Penalty rate
-    penalty_count = (drives['Penalty'] == 'Yes').sum()
+    penalty_count = drives['Penalty'].sum()
     penalty_rate = safe_divide(penalty_count, total_drives) * 100
 
     # Fairways hit %
@@ -283,96 +288,44 @@ def _calculate_driving_metrics(player_df, num_rounds):
     }
 
 
-def _calculate_approach_zones(player_df):
-    """Calculate approach zone SG (pattern from approach.py lines 114-119)."""
-    approach_shots = player_df[player_df['Shot Type'] == 'Approach'].copy()
-
-    if approach_shots.empty:
+def _calculate_approach_zones(shots):
+    """Calculate approach zone SG (zones from helpers.ZONE_RANGES)."""
+    if shots.count('Approach') == 0:
         return {'GZ SG': 0.0, 'YZ SG': 0.0, 'RZ SG': 0.0}
 
-    # Ensure numeric
-    approach_shots['Starting Distance'] = pd.to_numeric(
-        approach_shots['Starting Distance'], errors='coerce'
-    )
-
-    # Assign zones
-    approach_shots['Zone'] = approach_shots['Starting Distance'].apply(zone_distance_bucket)
-
-    # Green Zone (75-125 yds)
-    green_zone = approach_shots[approach_shots['Zone'] == 'Green Zone']
-    green_zone_sg = green_zone['Strokes Gained'].sum() if not green_zone.empty else 0.0
-
-    # Yellow Zone (125-175 yds)
-    yellow_zone = approach_shots[approach_shots['Zone'] == 'Yellow Zone']
-    yellow_zone_sg = yellow_zone['Strokes Gained'].sum() if not yellow_zone.empty else 0.0
-
-    # Red Zone (175-225 yds)
-    red_zone = approach_shots[approach_shots['Zone'] == 'Red Zone']
-    red_zone_sg = red_zone['Strokes Gained'].sum() if not red_zone.empty else 0.0
-
+    index = shots.distance_index('Approach')
     return {
-        'GZ SG': green_zone_sg,
-        'YZ SG': yellow_zone_sg,
-        'RZ SG': red_zone_sg,
+        'GZ SG': index.sg(75, 125, inclusive='left'),    # Green Zone (75-125 yds)
+        'YZ SG': index.sg(125, 175, inclusive='left'),   # Yellow Zone (125-175 yds)
+        'RZ SG': index.sg(175, 225, inclusive='left'),   # Red Zone (175-225 yds)
     }
 
 
-def _calculate_short_game_metrics(player_df):
+def _calculate_short_game_metrics(shots):
     """Calculate short game distance-based SG (pattern from short_game.py)."""
-    sg_shots = player_df[player_df['Shot Type'] == 'Short Game'].copy()
-
-    if sg_shots.empty:
+    if shots.count('Short Game') == 0:
         return {'SG25-50': 0.0, 'SG0-25': 0.0}
 
-    # Ensure numeric
-    sg_shots['Starting Distance'] = pd.to_numeric(
-        sg_shots['Starting Distance'], errors='coerce'
-    )
-
-    # SG 25-50 yards
-    sg_25_50 = sg_shots[sg_shots['Starting Distance'] >= 25]['Strokes Gained'].sum()
-
-    # SG 0-25 yards
-    sg_0_25 = sg_shots[sg_shots['Starting Distance'] < 25]['Strokes Gained'].sum()
-
+    index = shots.distance_index('Short Game')
     return {
-        'SG25-50': sg_25_50,
-        'SG0-25': sg_0_25,
+        'SG25-50': index.sg(lo=25),
+        'SG0-25': index.sg(hi=25, inclusive='left'),
     }
 
 
-def _calculate_putting_metrics(player_df):
-    """Calculate putting detail metrics (pattern from putting.py lines 43-95)."""
-    putts = player_df[player_df['Shot Type'] == 'Putt'].copy()
+def _calculate_putting_metrics(shots):
+    """Calculate putting detail metrics (pattern from putting.py)."""
+    putts = shots.get('Putt')
 
     if putts.empty:
         return {'SG4-6': 0.0, 'SG7-10': 0.0, 'Lag%': 0.0}
 
-    # Ensure numeric
-    putts['Starting Distance'] = pd.to_numeric(putts['Starting Distance'], errors='coerce')
-    putts['Ending Distance'] = pd.to_numeric(putts['Ending Distance'], errors='coerce')
-
-    # SG 4-6 ft
-    sg_4_6_putts = putts[
-        (putts['Starting Distance'] >= 4) & (putts['Starting Distance'] <= 6)
-    ]
-    sg_4_6 = sg_4_6_putts['Strokes Gained'].sum() if not sg_4_6_putts.empty else 0.0
-
-    # SG 7-10 ft
-    sg_7_10_putts = putts[
-        (putts['Starting Distance'] >= 7) & (putts['Starting Distance'] <= 10)
-    ]
-    sg_7_10 = sg_7_10_putts['Strokes Gained'].sum() if not sg_7_10_putts.empty else 0.0
+    index = shots.distance_index('Putt')
+    sg_4_6 = index.sg(4, 6)
+    sg_7_10 = index.sg(7, 10)
 
     # Poor Lag % (first putts >= 20 ft leaving > 5 ft)
-    putts['Hole Key'] = (
-        putts['Player'].astype(str) + '|' +
-        putts['Round ID'].astype(str) + '|' +
-        putts['Hole'].astype(str)
-    )
-    putts = putts.sort_values(['Hole Key', 'Shot'])
-    putts['Putt Number'] = putts.groupby('Hole Key').cumcount() + 1
-
+    putts = build_putt_sequence(putts)
     first_putts = putts[putts['Putt Number'] == 1]
     lag_first = first_putts[first_putts['Starting Distance'] >= 20]
     poor_lag_pct = safe_divide(
@@ -386,6 +339,14 @@ def _calculate_putting_metrics(player_df):
     }
 
 
+# Shot table columns build_coaches_table_results reads
+COACHES_TABLE_COLUMNS = (
+    'Player', 'Round ID', 'Hole', 'Shot', 'Starting Distance',
+    'Starting Location', 'Ending Distance', 'Ending Location', 'Penalty',
+    'Par', 'Shot Type', 'Hole Key', 'Strokes Gained',
+)
+
+
 def build_coaches_table_results(filtered_df, hole_summary):
     """
     Build per-player performance metrics for coaches table.
@@ -413,7 +374,7 @@ def build_coaches_table_results(filtered_df, hole_summary):
     # Loop through each unique player (aggregating across all tournaments)
     for player in sorted(filtered_df['Player'].unique()):
         # Filter to this player
-        player_df = filtered_df[filtered_df['Player'] == player].copy()
+        player_df = filtered_df[filtered_df['Player'] == player]
 
         # Get the Round IDs for this player
         player_rounds = player_df['Round ID'].unique()
@@ -2,11 +2,16 @@ import pandas as pd
 
 from engines.tiger5 import build_tiger5_root_cause
 from engines.helpers import safe_divide, APPROACH_BUCKETS
+from engines.partition import shot_type_slice
+from engines.putting import build_putt_sequence
+from engines.section_cache import SectionCache
 
 # ============================================================
 # COACH'S CORNER ENGINE
 # ============================================================
 
+# Section outputs shared across reruns (see build_coachs_corner)
+_SECTION_CACHE = SectionCache()
 
 
 def _strengths_weaknesses(sg_summary):
@@ -44,7 +49,7 @@ def _bogey_avoidance(hole_summary):
     return result
 
 
-def _birdie_opportunities(filtered_df, hole_summary):
+def _birdie_opportunities(filtered_df, hole_summary, shots=None):
     """
     Quality birdie opportunities: holes where player reached green in regulation (GIR)
     AND finished ≤20 feet from the hole.
@@ -59,34 +64,20 @@ def _birdie_opportunities(filtered_df, hole_summary):
 
     Conversions: of those qualified opportunities, how many resulted in birdie or better.
     """
-    putts = filtered_df[filtered_df['Shot Type'] == 'Putt'].copy()
+    putts = shot_type_slice(filtered_df, 'Putt', shots)
 
     if putts.empty or hole_summary.empty:
         return {"opportunities": 0, "conversions": 0, "conversion_pct": 0.0}
 
-    # Sort putts by hole and shot number
-    putts = putts.sort_values(['Player', 'Round ID', 'Hole', 'Shot'])
-
-    # Add putt sequence number for each hole (similar to putting engine pattern)
-    # cumcount() starts at 0, so 0 = first putt, 1 = second putt, etc.
-    putts['Putt Sequence'] = putts.groupby(
-        ['Player', 'Round ID', 'Hole']
-    ).cumcount()
-
-    # Get only first putts (Putt Sequence == 0)
-    # This preserves all columns including 'Shot'
-    first_putts = putts[putts['Putt Sequence'] == 0].copy()
-
-    # Ensure Ending Distance is numeric for proximity filtering
-    first_putts['Ending Distance'] = pd.to_numeric(
-        first_putts['Ending Distance'], errors='coerce'
-    )
+    # First putt on each hole (shared putt-sequence columns)
+    putts = build_putt_sequence(putts)
+    first_putts = putts[putts['Putt Number'] == 1]
 
     # Merge with hole summary to get Hole Score ONLY (first_putts already has Par from original data)
     # This avoids duplicate 'Par' column conflict that was causing Shot column to be lost
     first_putts = first_putts.merge(
-        hole_summary[['Player', 'Round ID', 'Hole', 'Hole Score']],
-        on=['Player', 'Round ID', 'Hole'],
+        hole_summary[['Hole Key', 'Hole Score']],
+        on='Hole Key',
         how='left'
     )
 
@@ -139,7 +130,7 @@ def _flow_metrics(hole_summary):
     total_bogey_plus = 0  # Total holes with score > par
     consecutive_bogey_plus = 0  # Bogey+ holes that follow another bogey+
 
-    for rid, round_df in hole_summary.groupby('Round ID'):
+    for rid, round_df in hole_summary.groupby('Round ID', observed=True):
         round_sorted = round_df.sort_values('Hole').reset_index(drop=True)
         scores = round_sorted['Hole Score'].values
         pars = round_sorted['Par'].values
@@ -214,6 +205,24 @@ def _flow_metrics(hole_summary):
     return result
 
 
+def _flow_metrics_from_rollup(rollup):
+    """_flow_metrics() from the per-round flow counters of a RoundRollup."""
+    trains = rollup.bogey_trains
+    return {
+        "bounce_back_pct": safe_divide(rollup['bounce_back_successes'],
+                                       rollup['bounce_back_attempts']) * 100,
+        "drop_off_pct": safe_divide(rollup['drop_off_count'],
+                                    rollup['drop_off_attempts']) * 100,
+        "gas_pedal_pct": safe_divide(rollup['gas_pedal_count'],
+                                     rollup['gas_pedal_attempts']) * 100,
+        "bogey_train_count": len(trains),
+        "longest_bogey_train": max(trains, default=0),
+        "bogey_trains": trains,
+        "bogey_train_pct": safe_divide(rollup['consecutive_bogey_plus'],
+                                       rollup['bogey_plus']) * 100,
+    }
+
+
 def _practice_priorities(weaknesses, tiger5_results, performance_drivers,
                         driving_results, approach_results,
                         short_game_results, putting_results):
@@ -364,7 +373,8 @@ def _safe_pr(val, num_rounds):
 
 def _build_performance_drivers(num_rounds, filtered_df,
                                 driving_results, approach_results,
-                                short_game_results, putting_results):
+                                short_game_results, putting_results,
+                                shots=None):
     """
     Identify the top 3-5 granular factors costing the most strokes.
 
@@ -461,10 +471,8 @@ def _build_performance_drivers(num_rounds, filtered_df,
         })
 
     # Sand-specific
-    sand_df = filtered_df[
-        (filtered_df['Shot Type'] == 'Short Game') &
-        (filtered_df['Starting Location'] == 'Sand')
-    ]
+    short_game_df = shot_type_slice(filtered_df, 'Short Game', shots)
+    sand_df = short_game_df[short_game_df['Starting Location'] == 'Sand']
     if len(sand_df) >= 3:
         sand_sg = sand_df['Strokes Gained'].sum()
         if sand_sg < 0:
@@ -537,7 +545,7 @@ def _build_performance_drivers(num_rounds, filtered_df,
 
     # ---- RECOVERY / OTHER candidates ----
     for shot_type in ['Recovery', 'Other']:
-        st_df = filtered_df[filtered_df['Shot Type'] == shot_type]
+        st_df = shot_type_slice(filtered_df, shot_type, shots)
         if len(st_df) >= 3:
             st_sg = st_df['Strokes Gained'].sum()
             if st_sg < -0.5:
@@ -999,7 +1007,8 @@ def _combined_root_cause_putting_details(pr, putt_type, t5_count, sp_count, sp_s
 
 def _build_player_path(sg_summary, num_rounds, filtered_df,
                         driving_results, approach_results,
-                        short_game_results, putting_results):
+                        short_game_results, putting_results,
+                        shots=None):
     """
     Build detailed strengths and weaknesses with granular drill-down.
 
@@ -1036,7 +1045,7 @@ def _build_player_path(sg_summary, num_rounds, filtered_df,
 
     # Check Recovery / Other shot types
     for shot_type in ["Recovery", "Other"]:
-        st_df = filtered_df[filtered_df['Shot Type'] == shot_type]
+        st_df = shot_type_slice(filtered_df, shot_type, shots)
         if len(st_df) >= 5:
             st_sg = st_df['Strokes Gained'].sum()
             st_pr = _safe_pr(st_sg, num_rounds)
@@ -1317,16 +1326,33 @@ def _putting_detail(pr, is_strength):
 # MASTER COACH'S CORNER ENGINE
 # ============================================================
 
+# Shot table columns build_coachs_corner reads
+COACHS_CORNER_COLUMNS = (
+    'Round ID', 'Hole', 'Shot', 'Starting Distance', 'Starting Location',
+    'Ending Distance', 'Penalty', 'Par', 'Shot Type', 'Hole Key',
+    'Strokes Gained',
+)
+
+
 def build_coachs_corner(filtered_df, hole_summary,
                          driving_results, approach_results,
                          short_game_results, putting_results,
                          tiger5_results, scoring_perf_results,
-                         grit_score, num_rounds):
+                         grit_score, num_rounds, shots=None, rollup=None,
+                         selection=None):
     """
     Combine all engines into a single coaching insight package.
     Now includes both Tiger 5 AND Scoring Performance root causes.
+
+    Each section is memoized, so reruns that leave its inputs unchanged
+    reuse its last output. Sections are keyed on `selection` (the
+    ShotView.key every input was built from) when given, else on a
+    content hash of the inputs they read. Flow metrics are read from
+    `rollup` (a RoundRollup) when given.
     """
 
+    run = _SECTION_CACHE.run(selection)
+
     # --- SG summary ---
     sg_summary = {
         "Driving": driving_results.get("driving_sg", 0),
@@ -1335,35 +1361,63 @@ def build_coachs_corner(filtered_df, hole_summary,
         "Putting": putting_results.get("total_sg_putting", 0)
     }
 
-    strengths, weaknesses = _strengths_weaknesses(sg_summary)
+    strengths, weaknesses = run.section(
+        "strengths_weaknesses", [sg_summary],
+        lambda: _strengths_weaknesses(sg_summary),
+    )
 
     # --- Decision making ---
     # gyr = _green_yellow_red(filtered_df)  # REMOVED
-    ba = _bogey_avoidance(hole_summary)
-    bo = _birdie_opportunities(filtered_df, hole_summary)
+    ba = run.section(
+        "bogey_avoidance", [hole_summary],
+        lambda: _bogey_avoidance(hole_summary),
+    )
+    bo = run.section(
+        "birdie_opportunities", [filtered_df, hole_summary],
+        lambda: _birdie_opportunities(filtered_df, hole_summary, shots),
+    )
 
     # --- Round flow ---
-    flow = _flow_metrics(hole_summary)
+    flow = run.section(
+        "flow_metrics", [hole_summary],
+        lambda: (_flow_metrics(hole_summary) if rollup is None
+                 else _flow_metrics_from_rollup(rollup)),
+    )
 
     # --- Narrative ---
-    summary = _coach_summary(strengths, weaknesses, grit_score, flow)
+    summary = run.section(
+        "coach_summary", [strengths, weaknesses, grit_score, flow],
+        lambda: _coach_summary(strengths, weaknesses, grit_score, flow),
+    )
 
     # --- Performance Drivers (NEW) ---
-    perf_drivers = _build_performance_drivers(
-        num_rounds, filtered_df,
-        driving_results, approach_results,
-        short_game_results, putting_results,
+    perf_drivers = run.section(
+        "performance_drivers",
+        [num_rounds, filtered_df, driving_results, approach_results,
+         short_game_results, putting_results],
+        lambda: _build_performance_drivers(
+            num_rounds, filtered_df,
+            driving_results, approach_results,
+            short_game_results, putting_results,
+            shots,
+        ),
     )
 
     # --- Practice priorities (moved after perf_drivers for tiered structure) ---
-    priorities = _practice_priorities(
-        weaknesses, tiger5_results, perf_drivers,
-        driving_results, approach_results, short_game_results, putting_results
+    priorities = run.section(
+        "practice_priorities",
+        [weaknesses, tiger5_results, perf_drivers, driving_results,
+         approach_results, short_game_results, putting_results],
+        lambda: _practice_priorities(
+            weaknesses, tiger5_results, perf_drivers,
+            driving_results, approach_results, short_game_results, putting_results
+        ),
     )
 
     # --- Tiger 5 Root Cause Analysis ---
-    t5_shot_type_counts, t5_detail_by_type = build_tiger5_root_cause(
-        filtered_df, tiger5_results, hole_summary,
+    t5_shot_type_counts, t5_detail_by_type = run.section(
+        "tiger5_root_cause", [filtered_df, tiger5_results, hole_summary],
+        lambda: build_tiger5_root_cause(filtered_df, tiger5_results, hole_summary),
     )
     total_t5_fails = sum(v for v in t5_shot_type_counts.values())
 
@@ -1373,12 +1427,18 @@ def build_coachs_corner(filtered_df, hole_summary,
     total_sp_issues = scoring_perf_results.get('total_fails', 0)
 
     # --- PlayerPath (Root Cause Driven - merges Tiger 5 + Scoring Performance) ---
-    player_path = _build_combined_root_cause_player_path(
-        t5_shot_type_counts, total_t5_fails,
-        sp_total_counts, sp_total_sg_sums, total_sp_issues,
-        num_rounds, sg_summary,
-        driving_results, approach_results,
-        short_game_results, putting_results,
+    player_path = run.section(
+        "player_path",
+        [t5_shot_type_counts, sp_total_counts, sp_total_sg_sums,
+         total_sp_issues, num_rounds, sg_summary, driving_results,
+         approach_results, short_game_results, putting_results],
+        lambda: _build_combined_root_cause_player_path(
+            t5_shot_type_counts, total_t5_fails,
+            sp_total_counts, sp_total_sg_sums, total_sp_issues,
+            num_rounds, sg_summary,
+            driving_results, approach_results,
+            short_game_results, putting_results,
+        ),
     )
 
     return {
@@ -1397,4 +1457,6 @@ def build_coachs_corner(filtered_df, hole_summary,
         # "tiger5_deep_dive": tiger5_deep_dive,  # REMOVED
         # "tiger5_root_cause_counts": shot_type_counts,  # REMOVED
         "player_path": player_path,
+        # {section: {"ms", "cached"}} for this call
+        "section_timings": run.timings,
     }
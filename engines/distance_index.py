@@ -0,0 +1,83 @@
+import numpy as np
+
+# ============================================================
+# DISTANCE INDEX — PREFIX-SUM RANGE QUERIES BY STARTING DISTANCE
+# ============================================================
+# Shots of one type are sorted by Starting Distance once, with
+# cumulative SG / count / made arrays alongside. Any "shots starting
+# between a and b" aggregate is then two searchsorted calls and a
+# subtraction instead of a boolean mask over the frame.
+# ============================================================
+
+_INCLUSIVE = {
+    'both': (True, True),
+    'left': (True, False),
+    'right': (False, True),
+    'neither': (False, False),
+}
+
+
+class DistanceIndex:
+    """
+    Shots sorted by Starting Distance with prefix sums for range queries.
+
+    Bounds follow Series.between: lo/hi are the range ends (None for an
+    open end) and inclusive is 'both', 'left', 'right' or 'neither'.
+    Shots with a missing Starting Distance never match a range; missing
+    SG counts as 0, like pandas sum.
+    """
+
+    def __init__(self, shots_df):
+        dist = shots_df['Starting Distance'].to_numpy(dtype=float)
+        sg = shots_df['Strokes Gained'].to_numpy(dtype=float)
+        end = shots_df['Ending Distance'].to_numpy(dtype=float)
+
+        keep = ~np.isnan(dist)
+        order = np.argsort(dist[keep], kind='stable')
+
+        self.distances = dist[keep][order]
+        self._sg = np.concatenate(([0.0], np.cumsum(np.nan_to_num(sg[keep][order]))))
+        self._made = np.concatenate(([0], np.cumsum(end[keep][order] == 0)))
+
+    def __len__(self):
+        return len(self.distances)
+
+    def _bounds(self, lo, hi, inclusive):
+        """Positional [start, stop) of the shots inside the range."""
+        lo_closed, hi_closed = _INCLUSIVE[inclusive]
+        start = 0 if lo is None else np.searchsorted(
+            self.distances, lo, side='left' if lo_closed else 'right'
+        )
+        stop = len(self.distances) if hi is None else np.searchsorted(
+            self.distances, hi, side='right' if hi_closed else 'left'
+        )
+        return int(start), int(max(start, stop))
+
+    def count(self, lo=None, hi=None, inclusive='both'):
+        """Number of shots starting in the range."""
+        start, stop = self._bounds(lo, hi, inclusive)
+        return stop - start
+
+    def sg(self, lo=None, hi=None, inclusive='both'):
+        """Total Strokes Gained of shots starting in the range."""
+        start, stop = self._bounds(lo, hi, inclusive)
+        return float(self._sg[stop] - self._sg[start])
+
+    def made(self, lo=None, hi=None, inclusive='both'):
+        """Number of shots starting in the range that were holed."""
+        start, stop = self._bounds(lo, hi, inclusive)
+        return int(self._made[stop] - self._made[start])
+
+    def stats(self, lo=None, hi=None, inclusive='both'):
+        """count / sg / made for the range in one lookup."""
+        start, stop = self._bounds(lo, hi, inclusive)
+        return {
+            "count": stop - start,
+            "sg": float(self._sg[stop] - self._sg[start]),
+            "made": int(self._made[stop] - self._made[start]),
+        }
+
+
+def build_distance_index(shots_df):
+    """Index one shot type's rows by Starting Distance."""
+    return DistanceIndex(shots_df)
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 from ui.formatters import round_label
+from engines.partition import shot_type_slice
 
 # ============================================================
 # DRIVING ENGINE
@@ -15,39 +16,39 @@ def _detect_ob_retee(filtered_df, driving_df):
     Returns:
         ob_count (int), ob_details (DataFrame)
     """
-    ob_count = 0
-    ob_rows = []
-
-    drive_holes = driving_df[['Player', 'Round ID', 'Hole', 'Course', 'Date']].drop_duplicates()
-
-    for _, row in drive_holes.iterrows():
-        hole_shots = filtered_df[
-            (filtered_df['Player'] == row['Player']) &
-            (filtered_df['Round ID'] == row['Round ID']) &
-            (filtered_df['Hole'] == row['Hole'])
-        ].sort_values('Shot')
-
-        tee_shots = hole_shots[hole_shots['Starting Location'] == 'Tee']
-        if len(tee_shots) >= 2:
-            ob_count += 1
-            ob_rows.append({
-                'Player': row['Player'],
-                'Round ID': row['Round ID'],
-                'Date': row['Date'],
-                'Course': row['Course'],
-                'Hole': row['Hole']
-            })
-
-    ob_details = pd.DataFrame(ob_rows)
-    return ob_count, ob_details
-
-
-def build_driving_results(filtered_df, num_rounds, hole_summary):
+    drive_holes = driving_df[
+        ['Player', 'Round ID', 'Hole', 'Course', 'Date', 'Hole Key']
+    ].drop_duplicates('Hole Key')
+
+    # Tee shots per hole, counted once over all shots
+    tee_keys = filtered_df.loc[filtered_df['Starting Location'] == 'Tee', 'Hole Key']
+    tee_counts = tee_keys.value_counts()
+    retee_keys = tee_counts.index[tee_counts.to_numpy() >= 2]
+
+    ob_holes = drive_holes[drive_holes['Hole Key'].isin(retee_keys)]
+    if ob_holes.empty:
+        return 0, pd.DataFrame()
+
+    ob_details = ob_holes[
+        ['Player', 'Round ID', 'Date', 'Course', 'Hole', 'Hole Key']
+    ].reset_index(drop=True)
+    return len(ob_details), ob_details
+
+
+# Shot table columns build_driving_results reads
+DRIVING_COLUMNS = (
+    'Player', 'Course', 'Date', 'Round ID', 'Hole', 'Starting Distance',
+    'Starting Location', 'Ending Distance', 'Ending Location', 'Penalty',
+    'Par', 'Shot Type', 'Hole Key', 'Strokes Gained',
+)
+
+
+def build_driving_results(filtered_df, num_rounds, hole_summary, shots=None):
     """
     Compute all driving analytics for the Driving tab.
     """
 
-    df = filtered_df[filtered_df['Shot Type'] == 'Driving'].copy()
+    df = shot_type_slice(filtered_df, 'Driving', shots)
     num_drives = len(df)
 
     empty_trend = pd.DataFrame(columns=['Label', 'SG', 'Fairway %'])
@@ -122,7 +123,7 @@ def build_driving_results(filtered_df, num_rounds, hole_summary):
     # --- Non-playable rate ---
     non_playable_mask = (
         df['Ending Location'].isin(['Recovery', 'Sand']) |
-        (df['Penalty'] == 'Yes')
+        df['Penalty']
     )
     non_playable_count = int(non_playable_mask.sum())
     non_playable_pct = non_playable_count / num_drives * 100
@@ -130,13 +131,13 @@ def build_driving_results(filtered_df, num_rounds, hole_summary):
     # --- SG Playable Drives (Fairway or Rough, no penalty) ---
     playable_mask = (
         df['Ending Location'].isin(['Fairway', 'Rough']) &
-        (df['Penalty'] != 'Yes')
+        ~df['Penalty']
     )
     sg_playable = df.loc[playable_mask, 'Strokes Gained'].sum()
     sg_playable_per_round = sg_playable / num_rounds if num_rounds > 0 else 0
 
     # --- Driving Distance (P90) ---
-    valid_distance_mask = (df['Penalty'] != 'Yes')
+    valid_distance_mask = ~df['Penalty']
     calc_distances = (
         df.loc[valid_distance_mask, 'Starting Distance'] -
         df.loc[valid_distance_mask, 'Ending Distance']
@@ -146,30 +147,13 @@ def build_driving_results(filtered_df, num_rounds, hole_summary):
     # --- Penalties + OB ---
     ob_count, ob_details = _detect_ob_retee(filtered_df, df)
 
-    # OB drives: identify by holes with re-tee; take the first tee shot per OB hole
-    ob_sg = 0.0
-    if ob_count > 0 and not ob_details.empty:
-        for _, ob_row in ob_details.iterrows():
-            ob_hole_drives = df[
-                (df['Player'] == ob_row['Player']) &
-                (df['Round ID'] == ob_row['Round ID']) &
-                (df['Hole'] == ob_row['Hole'])
-            ]
-            ob_sg += ob_hole_drives['Strokes Gained'].sum()
+    # OB drives: identify by holes with re-tee; SG of all drives on OB holes
+    ob_keys = ob_details['Hole Key'] if ob_count > 0 else []
+    ob_hole_mask = df['Hole Key'].isin(ob_keys)
+    ob_sg = df.loc[ob_hole_mask, 'Strokes Gained'].sum()
 
     # Non-OB penalties
-    if ob_count > 0 and not ob_details.empty:
-        ob_keys = set(
-            ob_details.apply(
-                lambda r: (r['Player'], r['Round ID'], r['Hole']), axis=1
-            )
-        )
-        penalty_mask = (df['Penalty'] == 'Yes')
-        non_ob_penalty_mask = penalty_mask & ~df.apply(
-            lambda r: (r['Player'], r['Round ID'], r['Hole']) in ob_keys, axis=1
-        )
-    else:
-        non_ob_penalty_mask = (df['Penalty'] == 'Yes')
+    non_ob_penalty_mask = df['Penalty'] & ~ob_hole_mask
 
     penalty_count = int(non_ob_penalty_mask.sum())
     penalty_sg = df.loc[non_ob_penalty_mask, 'Strokes Gained'].sum()
@@ -192,7 +176,7 @@ def build_driving_results(filtered_df, num_rounds, hole_summary):
     avoidable_mask = (
         (df['Strokes Gained'] <= -0.25) &
         df['Ending Location'].isin(['Fairway', 'Rough', 'Sand']) &
-        (df['Penalty'] != 'Yes')
+        ~df['Penalty']
     )
     avoidable_loss_count = int(avoidable_mask.sum())
     avoidable_loss_pct = avoidable_loss_count / num_drives * 100
@@ -212,27 +196,16 @@ def build_driving_results(filtered_df, num_rounds, hole_summary):
     poor_drive_sg = df.loc[poor_mask, 'Strokes Gained'].sum()
 
     # --- Scoring Impacts ---
-    # Build a mapping: (Player, Round ID, Hole) → drive ending location
-    drive_end_map = df.groupby(['Player', 'Round ID', 'Hole'])['Ending Location'].first()
+    # Score vs par of every hole, looked up by Hole Key
+    score_vs_par = pd.Series(
+        (hole_summary['Hole Score'] - hole_summary['Par']).to_numpy(),
+        index=hole_summary['Hole Key'].to_numpy(),
+    ) if not hole_summary.empty else pd.Series(dtype=float)
 
     # Trouble to Bogey: drives ending in Recovery → bogey or worse rate
-    recovery_drives = df[df['Ending Location'] == 'Recovery'][
-        ['Player', 'Round ID', 'Hole']
-    ].drop_duplicates()
-    trouble_to_bogey_attempts = len(recovery_drives)
-    trouble_to_bogey_fails = 0
-
-    if trouble_to_bogey_attempts > 0 and not hole_summary.empty:
-        for _, rd in recovery_drives.iterrows():
-            hole_row = hole_summary[
-                (hole_summary['Player'] == rd['Player']) &
-                (hole_summary['Round ID'] == rd['Round ID']) &
-                (hole_summary['Hole'] == rd['Hole'])
-            ]
-            if not hole_row.empty:
-                h = hole_row.iloc[0]
-                if h['Hole Score'] >= h['Par'] + 1:
-                    trouble_to_bogey_fails += 1
+    recovery_holes = df.loc[df['Ending Location'] == 'Recovery', 'Hole Key'].unique()
+    trouble_to_bogey_attempts = len(recovery_holes)
+    trouble_to_bogey_fails = int((score_vs_par.reindex(recovery_holes) >= 1).sum())
 
     trouble_to_bogey_pct = (
         trouble_to_bogey_fails / trouble_to_bogey_attempts * 100
@@ -240,23 +213,9 @@ def build_driving_results(filtered_df, num_rounds, hole_summary):
     )
 
     # Double+ rate on penalty holes (excluding OB)
-    penalty_drives = df[non_ob_penalty_mask][
-        ['Player', 'Round ID', 'Hole']
-    ].drop_duplicates()
-    double_penalty_attempts = len(penalty_drives)
-    double_penalty_fails = 0
-
-    if double_penalty_attempts > 0 and not hole_summary.empty:
-        for _, pd_row in penalty_drives.iterrows():
-            hole_row = hole_summary[
-                (hole_summary['Player'] == pd_row['Player']) &
-                (hole_summary['Round ID'] == pd_row['Round ID']) &
-                (hole_summary['Hole'] == pd_row['Hole'])
-            ]
-            if not hole_row.empty:
-                h = hole_row.iloc[0]
-                if h['Hole Score'] >= h['Par'] + 2:
-                    double_penalty_fails += 1
+    penalty_holes = df.loc[non_ob_penalty_mask, 'Hole Key'].unique()
+    double_penalty_attempts = len(penalty_holes)
+    double_penalty_fails = int((score_vs_par.reindex(penalty_holes) >= 2).sum())
 
     double_penalty_pct = (
         double_penalty_fails / double_penalty_attempts * 100
@@ -267,21 +226,12 @@ def build_driving_results(filtered_df, num_rounds, hole_summary):
     avg_score_rows = []
     if not hole_summary.empty:
         for loc in ['Fairway', 'Rough', 'Sand', 'Recovery']:
-            loc_drives = df[df['Ending Location'] == loc][
-                ['Player', 'Round ID', 'Hole']
-            ].drop_duplicates()
-            if len(loc_drives) == 0:
-                continue
-            merged = loc_drives.merge(
-                hole_summary[['Player', 'Round ID', 'Hole', 'Hole Score', 'Par']],
-                on=['Player', 'Round ID', 'Hole'],
-                how='inner'
-            )
-            if not merged.empty:
-                avg_vs_par = (merged['Hole Score'] - merged['Par']).mean()
+            loc_holes = df.loc[df['Ending Location'] == loc, 'Hole Key'].unique()
+            vs_par = score_vs_par.reindex(loc_holes).dropna()
+            if not vs_par.empty:
                 avg_score_rows.append({
                     'Ending Location': loc,
-                    'Avg vs Par': avg_vs_par
+                    'Avg vs Par': vs_par.mean()
                 })
 
     avg_score_by_end_loc = pd.DataFrame(avg_score_rows) if avg_score_rows else pd.DataFrame(
@@ -289,14 +239,14 @@ def build_driving_results(filtered_df, num_rounds, hole_summary):
     )
 
     # --- SG by ending location result ---
-    sg_by_result = df.groupby('Ending Location').agg(
+    sg_by_result = df.groupby('Ending Location', observed=True).agg(
         Count=('Strokes Gained', 'count'),
         **{'Total SG': ('Strokes Gained', 'sum')}
     ).reset_index()
     sg_by_result.columns = ['Result', 'Count', 'Total SG']
 
     # --- Trend by round ---
-    round_trend = df.groupby('Round ID').agg(
+    round_trend = df.groupby('Round ID', observed=True).agg(
         Date=('Date', 'first'),
         Course=('Course', 'first'),
         SG=('Strokes Gained', 'sum'),
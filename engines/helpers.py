@@ -1,3 +1,5 @@
+import numpy as np
+
 # ============================================================
 # HELPERS MODULE
 # Shared logic used across multiple engines
@@ -98,6 +100,41 @@ def leave_distance_bucket(dist):
         return "10–20"
     return "20+"
 
+# ------------------------------------------------------------
+# VECTORIZED BUCKET CODES
+# ------------------------------------------------------------
+def bucket_codes(values, bins):
+    """
+    Bucket index of each value over left-closed bins [bins[i], bins[i+1]).
+
+    Same buckets as pd.cut(values, bins, right=False).codes: values outside
+    the bins (or NaN) get -1.
+    """
+    values = np.asarray(values, dtype=float)
+    codes = np.searchsorted(bins, values, side='right') - 1
+    codes[(codes >= len(bins) - 1) | np.isnan(values)] = -1
+    return codes
+
+
+def bucket_totals(codes, num_buckets, weights=None):
+    """
+    Per-bucket row count (or sum of weights, NaN weights skipped) for
+    codes from bucket_codes(). Rows with code -1 are ignored.
+    """
+    valid = codes >= 0
+    if weights is not None:
+        weights = np.nan_to_num(np.asarray(weights, dtype=float)[valid])
+    return np.bincount(codes[valid], weights=weights, minlength=num_buckets)
+
+
+# ------------------------------------------------------------
+# PENALTY DISPLAY LABELS
+# ------------------------------------------------------------
+def penalty_labels(penalty):
+    """'Yes' / 'No' display labels for the bool Penalty column."""
+    return np.where(penalty, 'Yes', 'No')
+
+
 # ------------------------------------------------------------
 # SAFE DIVIDE
 # ------------------------------------------------------------
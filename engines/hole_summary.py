@@ -18,6 +18,13 @@ def score_to_name(hole_score, par):
     return 'Double or Worse'
 
 
+# Shot table columns build_hole_summary reads
+HOLE_SUMMARY_COLUMNS = (
+    'Player', 'Course', 'Date', 'Round ID', 'Hole', 'Shot', 'Penalty', 'Par',
+    'Shot Type', 'Hole Key', 'Strokes Gained',
+)
+
+
 def build_hole_summary(filtered_df):
     """
     Compute per-hole summary used across multiple engines:
@@ -29,12 +36,13 @@ def build_hole_summary(filtered_df):
     """
 
     hole_summary = filtered_df.groupby(
-        ['Player', 'Round ID', 'Date', 'Course', 'Hole', 'Par']
+        ['Player', 'Round ID', 'Date', 'Course', 'Hole', 'Par'], observed=True
     ).agg(
         num_shots=('Shot', 'count'),
-        num_penalties=('Penalty', lambda x: (x == 'Yes').sum()),
+        num_penalties=('Penalty', 'sum'),
         num_putts=('Shot Type', lambda x: (x == 'Putt').sum()),
-        total_sg=('Strokes Gained', 'sum')
+        total_sg=('Strokes Gained', 'sum'),
+        **{'Hole Key': ('Hole Key', 'first')}
     ).reset_index()
 
     # Hole score = shots + penalties
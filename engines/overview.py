@@ -1,23 +1,43 @@
+import numpy as np
 import pandas as pd
 from ui.formatters import round_label, format_date
+from engines.helpers import penalty_labels
+from engines.partition import (
+    shot_type_slice, sg_category_frame, SG_CATEGORY_ORDER,
+)
 
 # ============================================================
 # OVERVIEW ENGINE
 # ============================================================
 
 
+# Shot table columns overview_engine reads
+OVERVIEW_COLUMNS = (
+    'Course', 'Date', 'Round ID', 'Starting Distance', 'Par', 'Shot Type',
+    'Strokes Gained',
+)
+
+
 def overview_engine(df, hole_summary, driving_results, approach_results,
-                    short_game_results, putting_results, tiger5_results):
+                    short_game_results, putting_results, tiger5_results,
+                    shots=None, rollup=None):
     """
     High-level overview metrics for the Overview tab.
+
+    With a RoundRollup of the same rounds (see round_cube.py) the totals,
+    scoring average and par breakdown are read from it instead of the
+    shot and hole tables.
     """
 
     # -----------------------------
     # TOTAL SG
     # -----------------------------
-    total_sg = df['Strokes Gained'].sum()
-
-    num_rounds = df['Round ID'].nunique()
+    if rollup is not None:
+        total_sg = rollup['sg']
+        num_rounds = len(rollup)
+    else:
+        total_sg = df['Strokes Gained'].sum()
+        num_rounds = df['Round ID'].nunique()
 
     # -----------------------------
     # SG BY CATEGORY
@@ -40,29 +60,41 @@ def overview_engine(df, hole_summary, driving_results, approach_results,
         sg_by_category.get("Short Game", 0)
     )
 
-    # SG putting from >= 30 ft
-    putts_30_plus = df[(df['Shot Type'] == 'Putt') &
-                       (pd.to_numeric(df['Starting Distance'], errors='coerce') >= 30)]
-    sg_putts_over_30 = putts_30_plus['Strokes Gained'].sum() if not putts_30_plus.empty else 0
-
-    # SG putting 5-10 ft
-    start_dist = pd.to_numeric(df['Starting Distance'], errors='coerce')
-    putts_5_10 = df[(df['Shot Type'] == 'Putt') & (start_dist >= 5) & (start_dist <= 10)]
-    sg_putts_5_10 = putts_5_10['Strokes Gained'].sum() if not putts_5_10.empty else 0
-
-    # SG Other + Recovery (combined)
-    other_recovery_shots = df[(df['Shot Type'] == 'Other') | (df['Shot Type'] == 'Recovery')]
-    sg_other_recovery = other_recovery_shots['Strokes Gained'].sum() if not other_recovery_shots.empty else 0
+    if rollup is not None:
+        sg_putts_over_30 = rollup['sep:putt_30_plus']
+        sg_putts_5_10 = rollup['sep:putt_5_10']
+        # SG category 'Other' covers Other + Recovery shots
+        sg_other_recovery = rollup['sg:Other']
+    else:
+        putts = shot_type_slice(df, 'Putt', shots)
+        putt_dist = putts['Starting Distance']
+
+        # SG putting from >= 30 ft
+        putts_30_plus = putts[putt_dist >= 30]
+        sg_putts_over_30 = putts_30_plus['Strokes Gained'].sum() if not putts_30_plus.empty else 0
+
+        # SG putting 5-10 ft
+        putts_5_10 = putts[(putt_dist >= 5) & (putt_dist <= 10)]
+        sg_putts_5_10 = putts_5_10['Strokes Gained'].sum() if not putts_5_10.empty else 0
+
+        # SG Other + Recovery (combined)
+        sg_other_recovery = (
+            shot_type_slice(df, 'Other', shots)['Strokes Gained'].sum() +
+            shot_type_slice(df, 'Recovery', shots)['Strokes Gained'].sum()
+        )
 
     # -----------------------------
     # SCORING AVERAGE
     # -----------------------------
-    scoring_average = hole_summary['Hole Score'].mean() if not hole_summary.empty else 0
+    if rollup is not None:
+        scoring_average = rollup['strokes'] / rollup['holes'] if rollup['holes'] else 0
+    else:
+        scoring_average = hole_summary['Hole Score'].mean() if not hole_summary.empty else 0
 
     # -----------------------------
     # BEST / WORST ROUNDS
     # -----------------------------
-    round_scores = hole_summary.groupby('Round ID').agg(
+    round_scores = hole_summary.groupby('Round ID', observed=True).agg(
         Date=('Date', 'first'),
         Course=('Course', 'first'),
         Total=('Hole Score', 'sum')
@@ -92,7 +124,11 @@ def overview_engine(df, hole_summary, driving_results, approach_results,
     # -----------------------------
     # PAR BREAKDOWN (Birdie/Par/Bogey/etc.)
     # -----------------------------
-    par_breakdown = hole_summary['Score Name'].value_counts().to_dict()
+    if rollup is not None:
+        par_breakdown = _outcome_counts(rollup)
+        par_breakdown = {k: v for k, v in par_breakdown.items() if v > 0}
+    else:
+        par_breakdown = hole_summary['Score Name'].value_counts().to_dict()
 
     # -----------------------------
     # TIGER 5 SUMMARY (filter to category dicts only)
@@ -125,76 +161,107 @@ def overview_engine(df, hole_summary, driving_results, approach_results,
 # SG SEPARATORS — GRANULAR BREAKDOWNS
 # ============================================================
 
-def build_sg_separators(df, num_rounds):
-    """Calculate granular SG separator metrics with per-round values and best/worst identification."""
+# Separator catalog. Each entry selects shots of one Shot Type, optionally
+# narrowed by starting lie, ending lie and a Starting Distance range
+# (lo, hi, inclusive) with Series.between bounds (None = open end).
+# Entries may overlap; all are evaluated in one pass.
+SG_SEPARATORS = [
+    {'key': 'putt_4_6', 'label': 'SG Putting 4–6ft',  # CHANGED from 3-6
+     'shot_type': 'Putt', 'distance': (4, 6, 'both')},
+    {'key': 'putt_7_19', 'label': 'SG Putting 7–19ft',
+     'shot_type': 'Putt', 'distance': (7, 19, 'both')},
+    {'key': 'putt_20_plus', 'label': 'SG Putting 20+ft',  # CHANGED from 25+
+     'shot_type': 'Putt', 'distance': (20, None, 'both')},
+    {'key': 'app_100_150', 'label': 'SG Approach 100–150yd',
+     'shot_type': 'Approach', 'distance': (100, 150, 'both')},
+    {'key': 'app_150_200', 'label': 'SG Approach 150–200yd',
+     'shot_type': 'Approach', 'distance': (150, 200, 'both')},
+    {'key': 'app_rough_150', 'label': 'SG Approach Rough <150yd',
+     'shot_type': 'Approach', 'start_lie': ['Rough'],
+     'distance': (None, 150, 'neither')},
+    # Playable drives = drives ending in Fairway, Rough, or Sand
+    {'key': 'playable_drives', 'label': 'SG Playable Drives',
+     'shot_type': 'Driving', 'end_lie': ['Fairway', 'Rough', 'Sand']},
+    # Around the green = short game starting within 25 yards
+    {'key': 'around_green', 'label': 'SG Around the Green',
+     'shot_type': 'Short Game', 'distance': (None, 25, 'both')},
+]
+
+
+def _code_mask(codes, uniques, values):
+    """Rows whose factorized code is one of `values`."""
+    wanted = np.flatnonzero(np.isin(uniques, values))
+    return np.isin(codes, wanted)
+
+
+def separator_members(df, catalog):
+    """
+    Boolean (shots x entries) membership matrix of a separator catalog.
+    String columns are factorized once and each entry is a boolean
+    column over the integer codes.
+    """
+    shot_type, shot_types = pd.factorize(df['Shot Type'])
+    start_lie, start_lies = pd.factorize(df['Starting Location'])
+    end_lie, end_lies = pd.factorize(df['Ending Location'])
+    dist = df['Starting Distance'].to_numpy(dtype=float)
+
+    member = np.empty((len(df), len(catalog)), dtype=bool)
+    for j, sep in enumerate(catalog):
+        mask = _code_mask(shot_type, shot_types, [sep['shot_type']])
+        if 'start_lie' in sep:
+            mask &= _code_mask(start_lie, start_lies, sep['start_lie'])
+        if 'end_lie' in sep:
+            mask &= _code_mask(end_lie, end_lies, sep['end_lie'])
+        if 'distance' in sep:
+            lo, hi, inclusive = sep['distance']
+            if lo is not None:
+                mask &= dist >= lo if inclusive in ('both', 'left') else dist > lo
+            if hi is not None:
+                mask &= dist <= hi if inclusive in ('both', 'right') else dist < hi
+        member[:, j] = mask
+    return member
+
+
+def _separator_totals(df, catalog):
+    """
+    Total SG of every catalog entry from one matrix-vector product over
+    the membership matrix (missing SG counts as 0).
+    """
+    sg = np.nan_to_num(df['Strokes Gained'].to_numpy(dtype=float))
+    return sg @ separator_members(df, catalog)
+
+
+# Shot table columns build_sg_separators reads
+SG_SEPARATOR_COLUMNS = (
+    'Starting Distance', 'Starting Location', 'Ending Location', 'Shot Type',
+    'Strokes Gained',
+)
+
+
+def build_sg_separators(df, num_rounds, shots=None, catalog=None, rollup=None):
+    """
+    Calculate granular SG separator metrics with per-round values and
+    best/worst identification. `catalog` defaults to SG_SEPARATORS, whose
+    totals are read from `rollup` when one is given.
+    """
     if df.empty:
         return [], None, None
 
-    start_dist = pd.to_numeric(df['Starting Distance'], errors='coerce')
-
-    def _calc(mask):
-        total = df.loc[mask, 'Strokes Gained'].sum()
-        per_round = total / num_rounds if num_rounds > 0 else 0
-        return total, per_round
+    if catalog is None and rollup is not None:
+        catalog = SG_SEPARATORS
+        totals = [rollup[f"sep:{sep['key']}"] for sep in catalog]
+    else:
+        catalog = SG_SEPARATORS if catalog is None else catalog
+        frame = shots.df if shots is not None else df
+        totals = _separator_totals(frame, catalog)
 
     separators = []
     separator_dict = {}  # Track all totals for best/worst calculation
-
-    # SG Putting 4-6 Feet (CHANGED from 3-6)
-    m = (df['Shot Type'] == 'Putt') & (start_dist >= 4) & (start_dist <= 6)
-    t, pr = _calc(m)
-    key = 'putt_4_6'
-    separators.append(('SG Putting 4–6ft', t, pr, key))
-    separator_dict[key] = t
-
-    # SG Putting 7-19 Feet
-    m = (df['Shot Type'] == 'Putt') & (start_dist >= 7) & (start_dist <= 19)
-    t, pr = _calc(m)
-    key = 'putt_7_19'
-    separators.append(('SG Putting 7–19ft', t, pr, key))
-    separator_dict[key] = t
-
-    # SG Putting 20+ Feet (CHANGED from 25+)
-    m = (df['Shot Type'] == 'Putt') & (start_dist >= 20)
-    t, pr = _calc(m)
-    key = 'putt_20_plus'
-    separators.append(('SG Putting 20+ft', t, pr, key))
-    separator_dict[key] = t
-
-    # SG Approach 100-150 yards
-    m = (df['Shot Type'] == 'Approach') & (start_dist >= 100) & (start_dist <= 150)
-    t, pr = _calc(m)
-    key = 'app_100_150'
-    separators.append(('SG Approach 100–150yd', t, pr, key))
-    separator_dict[key] = t
-
-    # SG Approach 150-200 yards
-    m = (df['Shot Type'] == 'Approach') & (start_dist >= 150) & (start_dist <= 200)
-    t, pr = _calc(m)
-    key = 'app_150_200'
-    separators.append(('SG Approach 150–200yd', t, pr, key))
-    separator_dict[key] = t
-
-    # SG Approach Rough <150 yards
-    m = (df['Shot Type'] == 'Approach') & (df['Starting Location'] == 'Rough') & (start_dist < 150)
-    t, pr = _calc(m)
-    key = 'app_rough_150'
-    separators.append(('SG Approach Rough <150yd', t, pr, key))
-    separator_dict[key] = t
-
-    # SG Playable Drives = drives ending in Fairway, Rough, or Sand
-    m = (df['Shot Type'] == 'Driving') & (df['Ending Location'].isin(['Fairway', 'Rough', 'Sand']))
-    t, pr = _calc(m)
-    key = 'playable_drives'
-    separators.append(('SG Playable Drives', t, pr, key))
-    separator_dict[key] = t
-
-    # SG Around the Green = Short Game with starting distance <= 25 yards
-    m = (df['Shot Type'] == 'Short Game') & (start_dist <= 25)
-    t, pr = _calc(m)
-    key = 'around_green'
-    separators.append(('SG Around the Green', t, pr, key))
-    separator_dict[key] = t
+    for sep, t in zip(catalog, totals):
+        t = float(t)
+        pr = t / num_rounds if num_rounds > 0 else 0
+        separators.append((sep['label'], t, pr, sep['key']))
+        separator_dict[sep['key']] = t
 
     # Determine best and worst
     best_key = max(separator_dict, key=separator_dict.get) if separator_dict else None
@@ -207,31 +274,27 @@ def build_sg_separators(df, num_rounds):
 # SG TREND BY ROUND
 # ============================================================
 
-def build_sg_trend(df):
+# Shot table columns build_sg_trend reads
+SG_TREND_COLUMNS = (
+    'Course', 'Date', 'Round ID', 'Shot Type', 'Strokes Gained',
+)
+
+
+def build_sg_trend(df, shots=None):
     """Per-round SG breakdown by category for trend chart."""
     if df.empty:
         return pd.DataFrame()
 
-    cat_map = {
-        'Driving': 'Driving',
-        'Approach': 'Approach',
-        'Short Game': 'Short Game',
-        'Putt': 'Putting',
-        'Recovery': 'Other',
-        'Other': 'Other'
-    }
+    frame, sg_category = sg_category_frame(df, shots)
 
-    df_copy = df.copy()
-    df_copy['SG Category'] = df_copy['Shot Type'].map(cat_map).fillna('Other')
-
-    round_info = df_copy.groupby('Round ID').agg(
+    round_info = df.groupby('Round ID', observed=True).agg(
         Date=('Date', 'first'),
         Course=('Course', 'first')
     ).reset_index()
 
-    sg_by_round_cat = df_copy.groupby(
-        ['Round ID', 'SG Category']
-    )['Strokes Gained'].sum().reset_index()
+    sg_by_round_cat = frame['Strokes Gained'].groupby(
+        [frame['Round ID'], sg_category], observed=True
+    ).sum().reset_index()
 
     sg_pivot = sg_by_round_cat.pivot(
         index='Round ID', columns='SG Category', values='Strokes Gained'
@@ -255,17 +318,30 @@ def build_sg_trend(df):
 # SCORING AVERAGE & SG BY HOLE PAR
 # ============================================================
 
-def build_scoring_by_par(hole_summary):
-    """Scoring average and SG by hole par."""
+def build_scoring_by_par(hole_summary, rollup=None):
+    """Scoring average and SG by hole par (per-par totals from `rollup` if given)."""
     if hole_summary.empty:
         return pd.DataFrame()
 
-    by_par = hole_summary.groupby('Par').agg(
-        Holes=('Hole Score', 'count'),
-        Scoring_Avg=('Hole Score', 'mean'),
-        Total_SG=('total_sg', 'sum'),
-        SG_Per_Hole=('total_sg', 'mean')
-    ).reset_index()
+    if rollup is not None:
+        pars = [p for p in (3, 4, 5) if rollup[f'holes:par{p}'] > 0]
+        holes = np.array([rollup[f'holes:par{p}'] for p in pars])
+        strokes = np.array([rollup[f'strokes:par{p}'] for p in pars])
+        total_sg = np.array([rollup[f'hole_sg:par{p}'] for p in pars], dtype=float)
+        by_par = pd.DataFrame({
+            'Par': np.array(pars, dtype=hole_summary['Par'].dtype),
+            'Holes': holes,
+            'Scoring_Avg': strokes / holes,
+            'Total_SG': total_sg,
+            'SG_Per_Hole': total_sg / holes,
+        })
+    else:
+        by_par = hole_summary.groupby('Par').agg(
+            Holes=('Hole Score', 'count'),
+            Scoring_Avg=('Hole Score', 'mean'),
+            Total_SG=('total_sg', 'sum'),
+            SG_Per_Hole=('total_sg', 'mean')
+        ).reset_index()
 
     by_par.columns = ['Par', 'Holes Played', 'Scoring Avg', 'Total SG', 'SG / Hole']
     by_par['Scoring Avg'] = by_par['Scoring Avg'].round(2)
@@ -279,18 +355,28 @@ def build_scoring_by_par(hole_summary):
 # HOLE OUTCOME DISTRIBUTION
 # ============================================================
 
-def build_hole_outcomes(hole_summary):
+SCORE_ORDER = ['Eagle', 'Birdie', 'Par', 'Bogey', 'Double or Worse']
+
+
+def _outcome_counts(rollup):
+    """{score name: holes} of a RoundRollup, in SCORE_ORDER."""
+    return {name: rollup[f'outcome:{name}'] for name in SCORE_ORDER}
+
+
+def build_hole_outcomes(hole_summary, rollup=None):
     """Count and percentage of each scoring outcome."""
     if hole_summary.empty:
         return pd.DataFrame()
 
-    score_order = ['Eagle', 'Birdie', 'Par', 'Bogey', 'Double or Worse']
-
-    counts = hole_summary['Score Name'].value_counts()
-    total = counts.sum()
+    if rollup is not None:
+        counts = _outcome_counts(rollup)
+        total = sum(counts.values())
+    else:
+        counts = hole_summary['Score Name'].value_counts()
+        total = counts.sum()
 
     rows = []
-    for name in score_order:
+    for name in SCORE_ORDER:
         c = int(counts.get(name, 0))
         rows.append({
             'Score': name,
@@ -305,227 +391,272 @@ def build_hole_outcomes(hole_summary):
 # HOLE-BY-HOLE SG PIVOT BY SHOT TYPE
 # ============================================================
 
-def build_sg_by_hole_pivot(df, hole_summary):
-    """Hole-by-hole SG pivot table by shot type with Par and Score rows."""
-    if df.empty:
-        return pd.DataFrame()
+def _format_hole_pivot(sg_by_hole, hole_means):
+    """
+    Display table from a SG Category x Hole sum frame: Hole Par / Hole
+    Score rows on top, shot types in SG_CATEGORY_ORDER, a Total SG row
+    and a Total column.
+    """
+    existing_types = [t for t in SG_CATEGORY_ORDER if t in sg_by_hole.index]
+    pivot_table = sg_by_hole.loc[existing_types].astype(float)
+    pivot_table.loc['Total SG'] = pivot_table.sum()
+    pivot_table['Total'] = pivot_table.sum(axis=1)
 
-    cat_map = {
-        'Driving': 'Driving',
-        'Approach': 'Approach',
-        'Short Game': 'Short Game',
-        'Putt': 'Putting',
-        'Recovery': 'Other',
-        'Other': 'Other'
-    }
+    if hole_means is not None:
+        # Average par / score per hole (handles multiple rounds)
+        info = hole_means.reindex(sg_by_hole.columns, fill_value=0).T
+        info['Total'] = hole_means.sum()
+        info.index = ['Hole Par', 'Hole Score']
+        pivot_table = pd.concat([info, pivot_table])
 
-    df_copy = df.copy()
-    df_copy['SG Category'] = df_copy['Shot Type'].map(cat_map).fillna('Other')
+    pivot_table = pivot_table.round(2)
+    pivot_table.columns = [
+        int(c) if c != 'Total' else c for c in pivot_table.columns
+    ]
+    pivot_table.index.name = 'Shot Type'
+    return pivot_table.reset_index()
 
-    pivot = df_copy.groupby(
-        ['Hole', 'SG Category']
-    )['Strokes Gained'].sum().reset_index()
 
-    pivot_table = pivot.pivot(
-        index='SG Category', columns='Hole', values='Strokes Gained'
-    ).fillna(0)
+def _hole_means(hole_summary, keys):
+    """Mean Par and Hole Score per keys, or None without hole data."""
+    if hole_summary.empty:
+        return None
+    return hole_summary.groupby(keys, observed=True)[['Par', 'Hole Score']].mean()
 
-    # Sort columns (holes) numerically
-    pivot_table = pivot_table.reindex(sorted(pivot_table.columns), axis=1)
 
-    # Order shot type rows
-    type_order = ['Driving', 'Approach', 'Short Game', 'Putting', 'Other']
-    existing_types = [t for t in type_order if t in pivot_table.index]
-    pivot_table = pivot_table.loc[existing_types]
+# Shot table columns build_sg_by_hole_pivot reads (and build_sg_by_hole_pivot_by_course)
+SG_BY_HOLE_COLUMNS = (
+    'Course', 'Hole', 'Par', 'Shot Type', 'Strokes Gained',
+)
 
-    # Add Total SG row
-    total_row = pivot_table.sum()
-    total_row.name = 'Total SG'
-    pivot_table = pd.concat([pivot_table, total_row.to_frame().T])
 
-    # Add Total column (sum across all holes for each row)
-    pivot_table['Total'] = pivot_table.sum(axis=1)
+def build_sg_by_hole_pivot(df, hole_summary, shots=None):
+    """Hole-by-hole SG pivot table by shot type with Par and Score rows."""
+    if df.empty:
+        return pd.DataFrame()
 
-    # Add Hole Par and Hole Score rows from hole_summary
-    if not hole_summary.empty:
-        # Average par per hole (handles multiple rounds)
-        par_by_hole = hole_summary.groupby('Hole')['Par'].mean()
-        # Average score per hole (handles multiple rounds)
-        score_by_hole = hole_summary.groupby('Hole')['Hole Score'].mean()
-
-        # Create Hole Par row
-        par_row = pd.Series(index=pivot_table.columns, dtype=float)
-        for hole in pivot_table.columns:
-            if hole == 'Total':
-                par_row[hole] = par_by_hole.sum()
-            elif hole in par_by_hole.index:
-                par_row[hole] = par_by_hole[hole]
-            else:
-                par_row[hole] = 0
-        par_row.name = 'Hole Par'
-
-        # Create Hole Score row
-        score_row = pd.Series(index=pivot_table.columns, dtype=float)
-        for hole in pivot_table.columns:
-            if hole == 'Total':
-                score_row[hole] = score_by_hole.sum()
-            elif hole in score_by_hole.index:
-                score_row[hole] = score_by_hole[hole]
-            else:
-                score_row[hole] = 0
-        score_row.name = 'Hole Score'
-
-        # Insert at the top
-        pivot_table = pd.concat([
-            par_row.to_frame().T,
-            score_row.to_frame().T,
-            pivot_table
-        ])
+    frame, sg_category = sg_category_frame(df, shots)
 
-    pivot_table = pivot_table.round(2)
+    sg_by_hole = frame['Strokes Gained'].groupby(
+        [sg_category, frame['Hole']], observed=True
+    ).sum().unstack('Hole', fill_value=0).sort_index(axis=1)
 
-    # Clean up for display
-    pivot_table.index.name = 'Shot Type'
-    new_cols = []
-    for c in pivot_table.columns:
-        try:
-            new_cols.append(int(c))
-        except (ValueError, TypeError):
-            new_cols.append(c)
-    pivot_table.columns = new_cols
-    pivot_table = pivot_table.reset_index()
+    return _format_hole_pivot(sg_by_hole, _hole_means(hole_summary, 'Hole'))
+
+
+def build_sg_by_hole_pivot_by_course(df, hole_summary, shots=None):
+    """
+    build_sg_by_hole_pivot for each course, from one grouped sum.
+    Returns {course: pivot}; each table only has the holes played there.
+    """
+    if df.empty:
+        return {}
+
+    frame, sg_category = sg_category_frame(df, shots)
 
-    return pivot_table
+    sums = frame['Strokes Gained'].groupby(
+        [frame['Course'], sg_category, frame['Hole']], observed=True
+    ).sum().unstack('Hole').sort_index(axis=1)
+    hole_means = _hole_means(hole_summary, ['Course', 'Hole'])
+
+    pivots = {}
+    for course, sg_by_hole in sums.groupby(level='Course', sort=True, observed=True):
+        sg_by_hole = sg_by_hole.droplevel('Course')
+        sg_by_hole = sg_by_hole.loc[:, sg_by_hole.notna().any()].fillna(0)
+        course_means = None
+        if hole_means is not None and course in hole_means.index:
+            course_means = hole_means.xs(course, level='Course')
+        pivots[course] = _format_hole_pivot(sg_by_hole, course_means)
+
+    return pivots
 
 
 # ============================================================
 # TIGER 5 FAIL SHOT DETAILS
 # ============================================================
 
+TIGER5_NAMES = ['3 Putts', 'Double Bogey', 'Par 5 Bogey', 'Missed Green', '125yd Bogey']
+
+# Shots shown for each fail type (None = every shot on the hole)
+_T5_FAIL_SHOT_TYPES = {
+    '3 Putts': ['Putt'],
+    'Double Bogey': None,
+    'Par 5 Bogey': None,
+    'Missed Green': ['Short Game'],
+    '125yd Bogey': ['Approach', 'Short Game', 'Putt'],
+}
+
+_T5_FAIL_SHOT_COLUMNS = {
+    'Shot': 'Shot #',
+    'Starting Location': 'Starting Lie',
+    'Starting Distance': 'Starting Dist',
+    'Ending Location': 'Ending Lie',
+    'Ending Distance': 'Ending Dist',
+    'Penalty': 'Penalty',
+    'Strokes Gained': 'Strokes Gained',
+}
+
+
+# Shot table columns build_tiger5_fail_shots reads
+TIGER5_FAIL_SHOT_COLUMNS = (
+    'Course', 'Date', 'Round ID', 'Hole', 'Shot', 'Starting Distance',
+    'Starting Location', 'Ending Distance', 'Ending Location', 'Penalty',
+    'Shot Type', 'Hole Key', 'Strokes Gained',
+)
+
+
 def build_tiger5_fail_shots(df, tiger5_results):
-    """Build shot-level detail for each Tiger 5 fail type."""
-    fail_shots = {}
+    """
+    Shot-level detail for every Tiger 5 fail hole, as one frame.
 
-    tiger5_names = ['3 Putts', 'Double Bogey', 'Par 5 Bogey', 'Missed Green', '125yd Bogey']
+    One row per shot keyed by (Category, Round ID, Hole), ordered by fail
+    type, fail hole and shot. Built with a single join of the fail-hole
+    list against the shots on Hole Key; tiger5_fail_holes() slices it
+    per hole.
+    """
+    key_cols = ['Category', 'Round ID', 'Hole', 'Date', 'Course']
+    columns = key_cols + list(_T5_FAIL_SHOT_COLUMNS.values())
 
-    for stat_name in tiger5_names:
+    fail_holes = []
+    for stat_name in TIGER5_NAMES:
         detail = tiger5_results[stat_name]
-        if detail['fails'] == 0:
-            fail_shots[stat_name] = []
+        if detail['fails'] == 0 or detail['detail_holes'].empty:
             continue
+        fail_holes.append(
+            detail['detail_holes']
+            .reindex(columns=['Round ID', 'Hole', 'Hole Key', 'Date', 'Course'])
+            .assign(Category=stat_name)
+        )
+
+    if not fail_holes:
+        return pd.DataFrame(columns=columns)
+
+    fail_holes = pd.concat(fail_holes, ignore_index=True)
+    shots = fail_holes.merge(
+        df[['Hole Key', 'Shot Type', *_T5_FAIL_SHOT_COLUMNS]],
+        on='Hole Key',
+        how='inner',
+    )
+
+    # Keep only the shots relevant to each fail type
+    category = shots['Category'].to_numpy()
+    keep = np.ones(len(shots), dtype=bool)
+    for stat_name, shot_types in _T5_FAIL_SHOT_TYPES.items():
+        if shot_types is not None:
+            keep &= (category != stat_name) | shots['Shot Type'].isin(shot_types).to_numpy()
+    shots = shots[keep].rename(columns=_T5_FAIL_SHOT_COLUMNS)
+
+    shots['Category'] = pd.Categorical(shots['Category'], categories=TIGER5_NAMES)
+    shots['Shot #'] = shots['Shot #'].astype(int)
+    shots['Starting Dist'] = shots['Starting Dist'].round(1)
+    shots['Ending Dist'] = shots['Ending Dist'].round(1)
+    shots['Strokes Gained'] = shots['Strokes Gained'].round(2)
+    shots['Penalty'] = penalty_labels(shots['Penalty'])
+
+    return shots[columns].reset_index(drop=True)
+
 
-        detail_holes = detail['detail_holes']
-        holes_list = []
-
-        for _, row in detail_holes.iterrows():
-            rid = row['Round ID']
-            hole = row['Hole']
-            date = row.get('Date', '')
-            course = row.get('Course', '')
-
-            hole_shots = df[
-                (df['Round ID'] == rid) & (df['Hole'] == hole)
-            ].copy()
-
-            # Filter based on fail type
-            if stat_name == '3 Putts':
-                shots = hole_shots[hole_shots['Shot Type'] == 'Putt']
-            elif stat_name in ['Double Bogey', 'Par 5 Bogey']:
-                shots = hole_shots
-            elif stat_name == 'Missed Green':
-                shots = hole_shots[hole_shots['Shot Type'] == 'Short Game']
-            elif stat_name == '125yd Bogey':
-                shots = hole_shots[
-                    hole_shots['Shot Type'].isin(['Approach', 'Short Game', 'Putt'])
-                ]
-            else:
-                shots = hole_shots
-
-            if not shots.empty:
-                shots_data = shots[[
-                    'Shot', 'Starting Location', 'Starting Distance',
-                    'Ending Location', 'Ending Distance', 'Penalty',
-                    'Strokes Gained'
-                ]].copy()
-
-                shots_data = shots_data.rename(columns={
-                    'Shot': 'Shot #',
-                    'Starting Location': 'Starting Lie',
-                    'Starting Distance': 'Starting Dist',
-                    'Ending Location': 'Ending Lie',
-                    'Ending Distance': 'Ending Dist',
-                })
-
-                shots_data['Shot #'] = shots_data['Shot #'].astype(int)
-                shots_data['Starting Dist'] = pd.to_numeric(
-                    shots_data['Starting Dist'], errors='coerce'
-                ).round(1)
-                shots_data['Ending Dist'] = pd.to_numeric(
-                    shots_data['Ending Dist'], errors='coerce'
-                ).round(1)
-                shots_data['Strokes Gained'] = pd.to_numeric(
-                    shots_data['Strokes Gained'], errors='coerce'
-                ).round(2)
-
-                holes_list.append({
-                    'date': format_date(pd.to_datetime(date)),
-                    'course': course,
-                    'hole': int(hole),
-                    'shots': shots_data
-                })
-
-        fail_shots[stat_name] = holes_list
-
-    return fail_shots
+def tiger5_fail_holes(fail_shots, stat_name):
+    """
+    Yield one dict per fail hole of a Tiger 5 category:
+    {'date', 'course', 'hole', 'shots'}. Each hole's shots are a positional
+    slice of the build_tiger5_fail_shots() frame, taken only when iterated.
+    """
+    if fail_shots.empty:
+        return
+
+    in_cat = np.flatnonzero((fail_shots['Category'] == stat_name).to_numpy())
+    if len(in_cat) == 0:
+        return
+
+    # Categories are contiguous; holes are contiguous runs within them
+    cat = fail_shots.iloc[in_cat[0]:in_cat[-1] + 1]
+    rounds = cat['Round ID'].to_numpy()
+    holes = cat['Hole'].to_numpy()
+    starts = np.flatnonzero(
+        np.r_[True, (rounds[1:] != rounds[:-1]) | (holes[1:] != holes[:-1])]
+    )
+    stops = np.r_[starts[1:], len(cat)]
+
+    shot_cols = list(_T5_FAIL_SHOT_COLUMNS.values())
+    for start, stop in zip(starts, stops):
+        first = cat.iloc[start]
+        yield {
+            'date': format_date(pd.to_datetime(first['Date'])),
+            'course': first['Course'],
+            'hole': int(first['Hole']),
+            'shots': cat.iloc[start:stop][shot_cols],
+        }
 
 
 # ============================================================
 # SHOT LEVEL DETAIL BY ROUND
 # ============================================================
 
-def build_shot_detail(df):
-    """Shot-level detail for all shots, grouped by round."""
-    if df.empty:
-        return {}
+_SHOT_DETAIL_COLUMNS = {
+    'Hole': 'Hole',
+    'Par': 'Par',
+    'Shot': 'Shot #',
+    'Starting Distance': 'Starting Distance',
+    'Starting Location': 'Starting Lie',
+    'Ending Distance': 'Ending Distance',
+    'Ending Location': 'Ending Lie',
+    'Penalty': 'Penalty',
+    'Strokes Gained': 'Strokes Gained',
+}
 
-    rounds = {}
-    round_info = df.groupby('Round ID').agg(
-        Date=('Date', 'first'),
-        Course=('Course', 'first')
-    ).reset_index()
+# Shot table columns build_shot_detail reads
+ROUND_DETAIL_COLUMNS = ('Course', 'Date', 'Round ID', *_SHOT_DETAIL_COLUMNS)
 
-    round_info['Date'] = pd.to_datetime(round_info['Date'])
-    round_info = round_info.sort_values('Date', ascending=False)
 
-    for _, r in round_info.iterrows():
-        rid = r['Round ID']
-        label = f"{format_date(r['Date'])} - {r['Course']}"
+class RoundDetail:
+    """
+    Shot-level detail for every round, materialized one round at a time.
 
-        round_shots = df[df['Round ID'] == rid][[
-            'Hole', 'Par', 'Shot', 'Starting Distance', 'Starting Location',
-            'Ending Distance', 'Ending Location', 'Penalty', 'Strokes Gained'
-        ]].copy()
+    Holds a single typed shot table sorted by round (newest first), hole
+    and shot, plus the round dimension (Round ID, Date, Course, label).
+    offsets[i]:offsets[i + 1] are round i's rows, so a round's view is a
+    positional slice taken only when it is requested.
+    """
 
-        round_shots = round_shots.rename(columns={
-            'Shot': 'Shot #',
-            'Starting Location': 'Starting Lie',
-            'Ending Location': 'Ending Lie'
-        })
+    def __init__(self, df):
+        round_info = df.groupby('Round ID', observed=True).agg(
+            Date=('Date', 'first'),
+            Course=('Course', 'first')
+        ).reset_index()
+        round_info['Date'] = pd.to_datetime(round_info['Date'])
+        self.rounds = round_info.sort_values('Date', ascending=False).reset_index(drop=True)
+        self.labels = [
+            f"{format_date(d)} - {c}"
+            for d, c in zip(self.rounds['Date'], self.rounds['Course'])
+        ]
+
+        table = df[list(_SHOT_DETAIL_COLUMNS)].rename(columns=_SHOT_DETAIL_COLUMNS)
+        table['Hole'] = table['Hole'].astype(int)
+        table['Par'] = table['Par'].astype(int)
+        table['Shot #'] = table['Shot #'].astype(int)
+        table['Starting Distance'] = table['Starting Distance'].round(1)
+        table['Ending Distance'] = table['Ending Distance'].round(1)
+        table['Strokes Gained'] = table['Strokes Gained'].round(2)
+        table['Penalty'] = penalty_labels(table['Penalty'])
+
+        # Rows without a Round ID (-1) sort first and are skipped by offsets
+        round_pos = pd.Index(self.rounds['Round ID']).get_indexer(df['Round ID'])
+        order = np.lexsort((
+            table['Shot #'].to_numpy(), table['Hole'].to_numpy(), round_pos
+        ))
+        self.shots = table.iloc[order]
+        counts = np.bincount(round_pos + 1, minlength=len(self.rounds) + 1)
+        self.offsets = np.cumsum(counts)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def round(self, i):
+        """Shot detail frame of the i-th round (newest first)."""
+        return self.shots.iloc[self.offsets[i]:self.offsets[i + 1]]
 
-        round_shots['Hole'] = round_shots['Hole'].astype(int)
-        round_shots['Par'] = round_shots['Par'].astype(int)
-        round_shots['Shot #'] = round_shots['Shot #'].astype(int)
-        round_shots['Starting Distance'] = pd.to_numeric(
-            round_shots['Starting Distance'], errors='coerce'
-        ).round(1)
-        round_shots['Ending Distance'] = pd.to_numeric(
-            round_shots['Ending Distance'], errors='coerce'
-        ).round(1)
-        round_shots['Strokes Gained'] = pd.to_numeric(
-            round_shots['Strokes Gained'], errors='coerce'
-        ).round(2)
-        round_shots = round_shots.sort_values(['Hole', 'Shot #'])
-
-        rounds[label] = round_shots
-
-    return rounds
+
+def build_shot_detail(df):
+    """Shot-level detail for all shots, grouped by round (a RoundDetail)."""
+    return RoundDetail(df)
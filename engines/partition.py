@@ -0,0 +1,206 @@
+import numpy as np
+import pandas as pd
+
+from engines.distance_index import build_distance_index
+from engines.rerun_profile import record_copy
+
+# ============================================================
+# SHOT PARTITION — SHOT TYPE SLICES COMPUTED ONCE PER FILTER
+# ============================================================
+# The filtered shot table is stably sorted by Shot Type once per
+# filter state. Each shot type then occupies a contiguous positional
+# range, so engines take their slice with iloc instead of scanning
+# the whole frame with a boolean mask.
+#
+# The partition of the whole shot table is built once per dataset
+# version and benchmark (DatasetVersion.partition). A filter state's
+# partition is select()ed from it as positions and ranges over the
+# shared one: its rows keep the same grouping and stable order, so
+# nothing is sorted per filter, and a selection of every row reuses
+# the shared partition as is. Partitions hold only PARTITION_COLUMNS,
+# and a selected one takes rows when an engine first reads them (one
+# shot type's rows for get(), all of them for .df).
+# ============================================================
+
+SG_CATEGORY_MAP = {
+    'Driving': 'Driving',
+    'Approach': 'Approach',
+    'Short Game': 'Short Game',
+    'Putt': 'Putting',
+    'Recovery': 'Other',
+    'Other': 'Other',
+}
+
+SG_CATEGORY_ORDER = ['Driving', 'Approach', 'Short Game', 'Putting', 'Other']
+
+# Columns a partition holds: what engines read from partition rows (the
+# union of the engines' <ENGINE>_COLUMNS) plus SG Category. The sidebar
+# date and the surrogate keys other than Hole Key stay on the table.
+PARTITION_COLUMNS = (
+    'Player', 'Course', 'Tournament', 'Date', 'Round ID', 'Hole', 'Shot',
+    'Starting Distance', 'Starting Location', 'Ending Distance',
+    'Ending Location', 'Penalty', 'Par', 'Shot Type', 'Hole Key',
+    'Strokes Gained', 'SG Category',
+)
+
+
+def _sg_category(shot_type):
+    """SG category labels (str) for a Shot Type column."""
+    # Shot Type is categorical, so map() runs once per category; unmapped
+    # and missing types are filled before the cast (astype('str') would
+    # turn NaN into the text 'nan' on pandas 2)
+    return shot_type.map(SG_CATEGORY_MAP).astype(object).fillna('Other').astype('str')
+
+
+class ShotPartition:
+    """
+    Filtered shots grouped by Shot Type with per-type positional ranges.
+
+    Attributes:
+        df: the filtered shots, stably sorted by Shot Type (original index
+            labels preserved) with a precomputed 'SG Category' column
+        ranges: dict {shot_type: (start, stop)} positions into df
+        positions: position of each df row in the table partitioned
+
+    A partition from select() holds positions into the shared one and
+    takes df (or one shot type's rows, for get()) on first use. Per-type
+    distance indexes (see distance_index.py) are built on first use and
+    kept for the life of the partition.
+    """
+
+    def __init__(self, filtered_df):
+        codes, uniques = pd.factorize(filtered_df['Shot Type'], sort=True)
+        order = np.argsort(codes, kind='stable')
+        sorted_codes = codes[order]
+
+        columns = [c for c in PARTITION_COLUMNS if c in filtered_df.columns]
+        df = filtered_df[columns].take(order)
+        df['SG Category'] = _sg_category(df['Shot Type'])
+
+        targets = np.arange(len(uniques))
+        starts = np.searchsorted(sorted_codes, targets, side='left')
+        stops = np.searchsorted(sorted_codes, targets, side='right')
+
+        self._df = df
+        self.ranges = {
+            shot_type: (int(start), int(stop))
+            for shot_type, start, stop in zip(uniques, starts, stops)
+        }
+        self.positions = order
+        self._source = None
+        self._rows = None
+        self._slices = {}
+        self._distance_indexes = {}
+
+    @classmethod
+    def _from_parts(cls, source, rows, ranges, positions):
+        partition = cls.__new__(cls)
+        partition._df = None
+        partition.ranges = ranges
+        partition.positions = positions
+        partition._source = source
+        partition._rows = rows
+        partition._slices = {}
+        partition._distance_indexes = {}
+        return partition
+
+    @property
+    def df(self):
+        """The partitioned shots (a selected partition takes its rows once, here)."""
+        if self._df is None:
+            self._df = record_copy(self._source.take(self._rows))
+        return self._df
+
+    def __len__(self):
+        return len(self.positions)
+
+    @property
+    def empty(self):
+        return len(self.positions) == 0
+
+    def get(self, shot_type):
+        """Rows of one shot type: a positional slice of df, or that type's rows only."""
+        start, stop = self.ranges.get(shot_type, (0, 0))
+        if self._df is not None:
+            return self._df.iloc[start:stop]
+        if shot_type not in self._slices:
+            self._slices[shot_type] = record_copy(self._source.take(self._rows[start:stop]))
+        return self._slices[shot_type]
+
+    def count(self, shot_type):
+        """Number of shots of one shot type."""
+        start, stop = self.ranges.get(shot_type, (0, 0))
+        return stop - start
+
+    def select(self, rows):
+        """
+        Partition of a subset of the partitioned table, given as sorted
+        positions into it (a ShotView's rows). Equal to partitioning
+        that subset, with takes on first use instead of a sort.
+        """
+        if len(rows) == len(self.positions):
+            return self
+        selected = np.zeros(len(self.positions), dtype=bool)
+        selected[rows] = True
+        keep = np.flatnonzero(selected[self.positions])
+        ranges = {}
+        for shot_type, (start, stop) in self.ranges.items():
+            start, stop = np.searchsorted(keep, [start, stop])
+            if stop > start:
+                ranges[shot_type] = (int(start), int(stop))
+        return ShotPartition._from_parts(self.df, keep, ranges, self.positions[keep])
+
+    def distance_index(self, shot_type):
+        """Starting-distance index of one shot type (built once, then cached)."""
+        if shot_type not in self._distance_indexes:
+            self._distance_indexes[shot_type] = build_distance_index(self.get(shot_type))
+        return self._distance_indexes[shot_type]
+
+
+def build_shot_partition(filtered_df, partition=None):
+    """
+    Partition the filtered shots by Shot Type (call once per filter
+    state). filtered_df may be a ShotView; given the shared table's
+    `partition`, the view's partition is selected from it.
+    """
+    rows = getattr(filtered_df, 'rows', None)
+    if partition is not None and rows is not None:
+        return partition.select(rows)
+    if rows is not None:
+        filtered_df = filtered_df.frame()
+    return ShotPartition(filtered_df)
+
+
+def shot_type_slice(filtered_df, shot_type, shots=None):
+    """
+    Rows of one shot type.
+
+    Uses the partition when one is supplied; otherwise falls back to a
+    single boolean mask over filtered_df.
+    """
+    if shots is not None:
+        return shots.get(shot_type)
+    return filtered_df[filtered_df['Shot Type'] == shot_type]
+
+
+def shot_distance_index(filtered_df, shot_type, shots=None):
+    """
+    Starting-distance index of one shot type.
+
+    Reuses the partition's cached index when one is supplied; otherwise
+    builds it from a masked slice of filtered_df.
+    """
+    if shots is not None:
+        return shots.distance_index(shot_type)
+    return build_distance_index(shot_type_slice(filtered_df, shot_type))
+
+
+def sg_category_frame(filtered_df, shots=None):
+    """
+    Return (frame, sg_category) aligned row-for-row, without copying
+    the shot table. Used by the SG-by-category groupbys.
+    """
+    if shots is not None:
+        return shots.df, shots.df['SG Category']
+    category = _sg_category(filtered_df['Shot Type'])
+    return filtered_df, category.rename('SG Category')
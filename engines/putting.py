@@ -1,67 +1,97 @@
+import numpy as np
 import pandas as pd
-from engines.helpers import safe_divide
+from engines.helpers import safe_divide, bucket_codes, bucket_totals
 from ui.formatters import round_label
+from engines.partition import shot_type_slice
+from engines.distance_index import build_distance_index
 
 # ============================================================
 # PUTTING ENGINE
 # ============================================================
 
+# Starting-distance buckets (ft) for the bucket table and outcome chart
+PUTT_BUCKET_BINS = [0, 4, 7, 11, 21, 31, 1000]
+PUTT_BUCKETS = ['0–3', '4–6', '7–10', '10–20', '20–30', '30+']
 
-def _enrich_putting_df(filtered_df):
-    """Filter to putts and add computed columns."""
-    putting_df = filtered_df[filtered_df['Shot Type'] == 'Putt'].copy()
+# First-putt starting distance on 3-putt holes (donut a)
+THREE_PUTT_BINS = [0, 20, 30, 40, 1000]
+THREE_PUTT_BUCKETS = ['<20 ft', '20–30 ft', '30–40 ft', '40+ ft']
+
+# Ending distance on long putts (donut b)
+LEAVE_BINS = [0, 4, 7, 11, 1000]
+LEAVE_BUCKETS_FT = ['0–3 ft', '4–6 ft', '7–10 ft', '10+ ft']
+
+
+def build_putt_sequence(putts):
+    """
+    Order putts by hole and shot and add the shared putt-sequence columns.
+
+    Adds:
+        Putt Number    1 for the first putt on the hole, 2 for the second, ...
+        Putts On Hole  total putts on the hole
+        Made           1 if the putt was holed
+    """
+    if putts.empty:
+        return putts.copy()
+
+    # Hole Key sorts like (Player, Round ID, Hole)
+    hole_key = putts['Hole Key'].to_numpy()
+    order = np.lexsort((putts['Shot'].to_numpy(), hole_key))
+    hole_key = hole_key[order]
+    putts = putts.take(order)
+
+    # Position of each row within its hole (rows are contiguous per hole)
+    pos = np.arange(len(hole_key))
+    new_hole = np.ones(len(hole_key), dtype=bool)
+    new_hole[1:] = hole_key[1:] != hole_key[:-1]
+    hole_start = np.maximum.accumulate(np.where(new_hole, pos, 0))
+    hole_idx = np.cumsum(new_hole) - 1
+
+    putts['Putt Number'] = pos - hole_start + 1
+    putts['Putts On Hole'] = np.bincount(hole_idx)[hole_idx]
+    putts['Made'] = (putts['Ending Distance'] == 0).astype(int)
+    return putts
+
+
+def _enrich_putting_df(filtered_df, shots=None):
+    """Filter to putts and add the putt-sequence and bucket code columns."""
+    putting_df = build_putt_sequence(shot_type_slice(filtered_df, 'Putt', shots))
     if putting_df.empty:
         return putting_df
 
-    putting_df['Starting Distance'] = pd.to_numeric(
-        putting_df['Starting Distance'], errors='coerce'
+    start = putting_df['Starting Distance'].to_numpy()
+    putting_df['Distance Bucket Code'] = bucket_codes(start, PUTT_BUCKET_BINS)
+    putting_df['Three Putt Bucket Code'] = bucket_codes(start, THREE_PUTT_BINS)
+    putting_df['Leave Bucket Code'] = bucket_codes(
+        putting_df['Ending Distance'].to_numpy(), LEAVE_BINS
     )
-    putting_df['Ending Distance'] = pd.to_numeric(
-        putting_df['Ending Distance'], errors='coerce'
-    )
-    putting_df['Made'] = (putting_df['Ending Distance'] == 0).astype(int)
-    putting_df['Hole Key'] = (
-        putting_df['Player'].astype(str) + '|' +
-        putting_df['Round ID'].astype(str) + '|' +
-        putting_df['Hole'].astype(str)
-    )
-
-    # Putt ordinal within each hole (1st putt, 2nd putt, etc.)
-    putting_df = putting_df.sort_values(['Hole Key', 'Shot'])
-    putting_df['Putt Number'] = putting_df.groupby('Hole Key').cumcount() + 1
+    return putting_df
 
-    # Total putts on the hole (joined back to every row)
-    putting_df['Putts On Hole'] = putting_df.groupby('Hole Key')['Shot'].transform('count')
 
-    return putting_df
+def _bucket_categorical(labels):
+    """Ordered categorical of bucket labels (same dtype pd.cut produces)."""
+    return pd.Categorical(labels, categories=labels, ordered=True)
 
 
 # ============================================================
 # HERO METRICS
 # ============================================================
-
-def _build_hero_metrics(putting_df, num_rounds):
-    """Compute the five hero card metrics."""
+def _build_hero_metrics(putting_df, num_rounds, index):
+    """Compute the five hero card metrics (distance ranges from the index)."""
     sg_total = putting_df['Strokes Gained'].sum()
     sg_per_round = safe_divide(sg_total, num_rounds)
 
     # SG Putting 4-6 ft
-    m46 = putting_df[
-        (putting_df['Starting Distance'] >= 4) &
-        (putting_df['Starting Distance'] <= 6)
-    ]
-    sg_4_6 = m46['Strokes Gained'].sum() if not m46.empty else 0.0
-    sg_4_6_made = int(m46['Made'].sum()) if not m46.empty else 0
-    sg_4_6_attempts = len(m46)
+    m46 = index.stats(4, 6)
+    sg_4_6 = m46["sg"]
+    sg_4_6_made = m46["made"]
+    sg_4_6_attempts = m46["count"]
 
     # SG Putting 7-10 ft
-    m710 = putting_df[
-        (putting_df['Starting Distance'] >= 7) &
-        (putting_df['Starting Distance'] <= 10)
-    ]
-    sg_7_10 = m710['Strokes Gained'].sum() if not m710.empty else 0.0
-    sg_7_10_made = int(m710['Made'].sum()) if not m710.empty else 0
-    sg_7_10_attempts = len(m710)
+    m710 = index.stats(7, 10)
+    sg_7_10 = m710["sg"]
+    sg_7_10_made = m710["made"]
+    sg_7_10_attempts = m710["count"]
 
     # Lag Miss % — first putts >= 20 ft that leave > 5 ft
     first_putts = putting_df[putting_df['Putt Number'] == 1]
@@ -71,13 +101,10 @@ def _build_hero_metrics(putting_df, num_rounds):
     )
 
     # Make % 0-3 ft
-    m03 = putting_df[
-        (putting_df['Starting Distance'] > 0) &
-        (putting_df['Starting Distance'] <= 3)
-    ]
-    make_0_3_pct = safe_divide(m03['Made'].sum(), len(m03)) * 100
-    make_0_3_made = int(m03['Made'].sum()) if not m03.empty else 0
-    make_0_3_attempts = len(m03)
+    m03 = index.stats(0, 3, inclusive='right')
+    make_0_3_pct = safe_divide(m03["made"], m03["count"]) * 100
+    make_0_3_made = m03["made"]
+    make_0_3_attempts = m03["count"]
 
     return {
         "sg_total": sg_total,
@@ -106,31 +133,22 @@ def _build_bucket_table(putting_df):
             columns=['Distance Bucket', 'Attempts', 'SG', 'Makes', 'Make %']
         )
 
-    bins = [0, 4, 7, 11, 21, 31, 1000]
-    labels = ['0–3', '4–6', '7–10', '10–20', '20–30', '30+']
-
-    df = putting_df.copy()
-    df['Distance Bucket'] = pd.cut(
-        df['Starting Distance'],
-        bins=bins,
-        labels=labels,
-        right=False,
-    )
-
-    grouped = df.groupby('Distance Bucket', observed=False).agg(
-        Attempts=('Made', 'count'),
-        SG=('Strokes Gained', 'sum'),
-        Makes=('Made', 'sum'),
-    ).reset_index()
-
-    grouped['Make %'] = grouped.apply(
-        lambda row: f"{safe_divide(row['Makes'], row['Attempts']) * 100:.1f}%"
-        if row['Attempts'] > 0 else "-",
-        axis=1,
-    )
-    grouped['SG'] = grouped['SG'].apply(lambda x: f"{x:+.2f}")
-
-    return grouped
+    codes = putting_df['Distance Bucket Code'].to_numpy()
+    n = len(PUTT_BUCKETS)
+    attempts = bucket_totals(codes, n)
+    makes = bucket_totals(codes, n, putting_df['Made']).astype(int)
+    sg = bucket_totals(codes, n, putting_df['Strokes Gained'])
+
+    return pd.DataFrame({
+        'Distance Bucket': _bucket_categorical(PUTT_BUCKETS),
+        'Attempts': attempts,
+        'SG': [f"{x:+.2f}" for x in sg],
+        'Makes': makes,
+        'Make %': [
+            f"{safe_divide(m, a) * 100:.1f}%" if a > 0 else "-"
+            for m, a in zip(makes, attempts)
+        ],
+    })
 
 
 # ============================================================
@@ -149,43 +167,27 @@ def _build_outcome_chart_data(putting_df):
     if putting_df.empty:
         return pd.DataFrame()
 
-    first_putts = putting_df[putting_df['Putt Number'] == 1].copy()
-    if first_putts.empty:
+    codes = putting_df['Distance Bucket Code'].to_numpy()
+    first = putting_df['Putt Number'].to_numpy() == 1
+    if not first.any():
         return pd.DataFrame()
 
-    bins = [0, 4, 7, 11, 21, 31, 1000]
-    labels = ['0–3', '4–6', '7–10', '10–20', '20–30', '30+']
-
-    first_putts['Distance Bucket'] = pd.cut(
-        first_putts['Starting Distance'],
-        bins=bins,
-        labels=labels,
-        right=False,
-    )
-
-    # Classify hole outcome by total putts on the hole
-    first_putts['Outcome'] = first_putts['Putts On Hole'].apply(
-        lambda x: '1-Putt' if x == 1 else ('2-Putt' if x == 2 else '3+ Putt')
-    )
+    n = len(PUTT_BUCKETS)
+    first_codes = codes[first]
+    putts_on_hole = putting_df['Putts On Hole'].to_numpy()[first]
 
-    # Calculate SG using ALL putts (putt-level), not hole-level
-    # This matches the stat cards calculation method
-    all_putts = putting_df.copy()
-    all_putts['Distance Bucket'] = pd.cut(
-        all_putts['Starting Distance'],
-        bins=bins,
-        labels=labels,
-        right=False,
-    )
+    # Hole outcome by total putts on the hole, counted per first-putt bucket
+    holes = bucket_totals(first_codes, n)
+    one_putts = bucket_totals(first_codes[putts_on_hole == 1], n)
+    two_putts = bucket_totals(first_codes[putts_on_hole == 2], n)
+    three_plus = bucket_totals(first_codes[putts_on_hole >= 3], n)
 
-    # Sum SG by distance bucket for all putts
-    sg_by_bucket = all_putts.groupby('Distance Bucket', observed=False)['Strokes Gained'].sum().to_dict()
+    # SG from ALL putts (putt-level), matching the stat cards
+    sg_by_bucket = bucket_totals(codes, n, putting_df['Strokes Gained'])
 
-    # Aggregate by bucket
     rows = []
-    for bucket in labels:
-        bucket_df = first_putts[first_putts['Distance Bucket'] == bucket]
-        total_holes = len(bucket_df)
+    for i, bucket in enumerate(PUTT_BUCKETS):
+        total_holes = int(holes[i])
         if total_holes == 0:
             rows.append({
                 'Distance Bucket': bucket,
@@ -196,10 +198,10 @@ def _build_outcome_chart_data(putting_df):
 
         rows.append({
             'Distance Bucket': bucket,
-            'pct_1putt': (bucket_df['Outcome'] == '1-Putt').sum() / total_holes * 100,
-            'pct_2putt': (bucket_df['Outcome'] == '2-Putt').sum() / total_holes * 100,
-            'pct_3plus': (bucket_df['Outcome'] == '3+ Putt').sum() / total_holes * 100,
-            'sg': sg_by_bucket.get(bucket, 0.0),  # Use putt-level SG
+            'pct_1putt': one_putts[i] / total_holes * 100,
+            'pct_2putt': two_putts[i] / total_holes * 100,
+            'pct_3plus': three_plus[i] / total_holes * 100,
+            'sg': float(sg_by_bucket[i]),
             'holes': total_holes,
         })
 
@@ -237,7 +239,7 @@ def _build_lag_miss_detail(putting_df):
     lag_misses = first_putts[
         (first_putts['Starting Distance'] >= 20) &
         (first_putts['Ending Distance'] > 5)
-    ].copy()
+    ]
 
     if lag_misses.empty:
         return pd.DataFrame(columns=[
@@ -267,28 +269,18 @@ def _build_lag_miss_detail(putting_df):
 
 def _build_three_putt_starts(putting_df):
     """First-putt starting distance on holes with 3+ putts."""
-    first_putts = putting_df[putting_df['Putt Number'] == 1]
-    three_putt_firsts = first_putts[first_putts['Putts On Hole'] >= 3].copy()
-
-    if three_putt_firsts.empty:
-        return pd.DataFrame(columns=['Bucket', 'Count'])
-
-    bins = [0, 20, 30, 40, 1000]
-    labels = ['<20 ft', '20–30 ft', '30–40 ft', '40+ ft']
-
-    three_putt_firsts['Bucket'] = pd.cut(
-        three_putt_firsts['Starting Distance'],
-        bins=bins,
-        labels=labels,
-        right=False,
+    three_putt_firsts = (
+        (putting_df['Putt Number'].to_numpy() == 1) &
+        (putting_df['Putts On Hole'].to_numpy() >= 3)
     )
+    if not three_putt_firsts.any():
+        return pd.DataFrame(columns=['Bucket', 'Count'])
 
-    return (
-        three_putt_firsts
-        .groupby('Bucket', observed=False)
-        .size()
-        .reset_index(name='Count')
-    )
+    codes = putting_df['Three Putt Bucket Code'].to_numpy()[three_putt_firsts]
+    return pd.DataFrame({
+        'Bucket': _bucket_categorical(THREE_PUTT_BUCKETS),
+        'Count': bucket_totals(codes, len(THREE_PUTT_BUCKETS)),
+    })
 
 
 # ============================================================
@@ -297,25 +289,15 @@ def _build_three_putt_starts(putting_df):
 
 def _build_leave_distribution(putting_df):
     """Ending-distance distribution for putts starting > 20 ft."""
-    lag = putting_df[putting_df['Starting Distance'] > 20].copy()
-    if lag.empty:
+    lag = putting_df['Starting Distance'].to_numpy() > 20
+    if not lag.any():
         return pd.DataFrame(columns=['Bucket', 'Count'])
 
-    bins = [0, 4, 7, 11, 1000]
-    labels = ['0–3 ft', '4–6 ft', '7–10 ft', '10+ ft']
-
-    lag['Bucket'] = pd.cut(
-        lag['Ending Distance'],
-        bins=bins,
-        labels=labels,
-        right=False,
-    )
-
-    return (
-        lag.groupby('Bucket', observed=False)
-        .size()
-        .reset_index(name='Count')
-    )
+    codes = putting_df['Leave Bucket Code'].to_numpy()[lag]
+    return pd.DataFrame({
+        'Bucket': _bucket_categorical(LEAVE_BUCKETS_FT),
+        'Count': bucket_totals(codes, len(LEAVE_BUCKETS_FT)),
+    })
 
 
 # ============================================================
@@ -327,7 +309,7 @@ def _build_trend_df(putting_df):
     if putting_df.empty:
         return pd.DataFrame(columns=['Round ID', 'Date', 'Course', 'SG', 'Label'])
 
-    grouped = putting_df.groupby('Round ID').agg(
+    grouped = putting_df.groupby('Round ID', observed=True).agg(
         Date=('Date', 'first'),
         Course=('Course', 'first'),
         SG=('Strokes Gained', 'sum'),
@@ -374,7 +356,15 @@ def _build_shot_detail(putting_df):
 # MAIN ENTRY POINT
 # ============================================================
 
-def build_putting_results(filtered_df, num_rounds):
+# Shot table columns build_putting_results reads
+PUTTING_COLUMNS = (
+    'Player', 'Course', 'Date', 'Round ID', 'Hole', 'Shot',
+    'Starting Distance', 'Ending Distance', 'Shot Type', 'Hole Key',
+    'Strokes Gained',
+)
+
+
+def build_putting_results(filtered_df, num_rounds, shots=None):
     """
     Return a rich dict consumed by putting_tab, overview_engine,
     and coachs_corner.
@@ -383,7 +373,11 @@ def build_putting_results(filtered_df, num_rounds):
         - total_sg_putting   (used by overview_engine, coachs_corner)
         - df                 (enriched putting DataFrame)
     """
-    putting_df = _enrich_putting_df(filtered_df)
+    putting_df = _enrich_putting_df(filtered_df, shots)
+    index = (
+        shots.distance_index('Putt') if shots is not None
+        else build_distance_index(putting_df)
+    )
 
     empty_hero = {
         "sg_total": 0.0, "sg_per_round": 0.0,
@@ -416,7 +410,7 @@ def build_putting_results(filtered_df, num_rounds):
         "empty": False,
         "df": putting_df,
         "total_sg_putting": total_sg,
-        "hero_metrics": _build_hero_metrics(putting_df, num_rounds),
+        "hero_metrics": _build_hero_metrics(putting_df, num_rounds, index),
         "bucket_table": _build_bucket_table(putting_df),
         "outcome_chart_data": _build_outcome_chart_data(putting_df),
         "lag_metrics": _build_lag_metrics(putting_df),
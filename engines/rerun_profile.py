@@ -0,0 +1,219 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+import weakref
+from contextlib import contextmanager
+
+import pandas as pd
+
+# ============================================================
+# RERUN PROFILE — PER-STEP TIMING FOR ONE SCRIPT RUN
+# ============================================================
+# app.py wraps data loading, filtering, every engine call and every tab
+# render in a profile step. An enabled profile records each step's wall
+# time, rows in / out, peak Python allocation (tracemalloc) and bytes
+# copied, and can append the rerun as one JSON line to PERF_LOG. A
+# disabled profile does no bookkeeping: step() yields a shared no-op
+# record and call() is a plain function call.
+#
+#     profile = RerunProfile(enabled)
+#     hole_summary = profile.call('hole_summary', build_hole_summary, df)
+#     with profile.step('tab:Putting', kind='tab'):
+#         putting_tab(...)
+# ============================================================
+
+PERF_LOG = os.environ.get(
+    'GOLF_PERF_LOG',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache', 'perf.jsonl'),
+)
+
+# Peak allocation per step costs a tracemalloc hook on every allocation
+# while a profile is on (GOLF_PERF_MEMORY=0 records timings only)
+PERF_MEMORY = os.environ.get('GOLF_PERF_MEMORY', '1') != '0'
+
+_log_lock = threading.Lock()
+
+# Profiles currently tracing allocations; tracemalloc is process-wide, so
+# it runs while any one is active (peaks then include other sessions)
+_tracing = 0
+_tracing_lock = threading.Lock()
+
+
+def _start_tracing():
+    global _tracing
+    with _tracing_lock:
+        if _tracing == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        _tracing += 1
+
+
+def _stop_tracing():
+    global _tracing
+    with _tracing_lock:
+        _tracing -= 1
+        if _tracing == 0:
+            tracemalloc.stop()
+
+
+# ============================================================
+# COPY METER — BYTES COPIED PER STEP
+# ============================================================
+# While an enabled step runs, every row take a ShotView or
+# ShotPartition.select makes (the copies of shared shot-table data a
+# rerun makes) passes through record_copy() and adds its size to the
+# step's copied_kb. Copies engines make of their own intermediate
+# frames are not counted; pandas is left unpatched.
+# ============================================================
+
+_active = threading.local()
+
+
+def count_bytes(obj):
+    """Buffer size of a DataFrame or Series (shallow; object columns count pointers)."""
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=False).sum())
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(index=False))
+    return 0
+
+
+def record_copy(obj):
+    """Count obj as copied by the current thread's step; returns obj."""
+    record = getattr(_active, 'step', None)
+    if record is not None:
+        record.copied_kb += count_bytes(obj) / 1024
+    return obj
+
+
+def count_rows(obj):
+    """
+    Rows in an engine input or output: the length of a DataFrame or
+    Series, the rows of every DataFrame at the top level of a results
+    dict, the first element of a tuple (tiger5's results dict) and the
+    len() of anything else sized (a RoundRollup's rounds).
+    """
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return len(obj)
+    if isinstance(obj, dict):
+        return sum(len(v) for v in obj.values() if isinstance(v, pd.DataFrame))
+    if isinstance(obj, tuple) and obj:
+        return count_rows(obj[0])
+    if hasattr(obj, '__len__') and not isinstance(obj, str):
+        return len(obj)
+    return None
+
+
+class ProfileStep:
+    """One timed step: name, kind, ms, rows_in, rows_out, peak_kb, copied_kb."""
+
+    __slots__ = ('name', 'kind', 'ms', 'rows_in', 'rows_out', 'peak_kb', 'copied_kb')
+
+    def __init__(self, name, kind, rows_in=None):
+        self.name = name
+        self.kind = kind
+        self.ms = None
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.peak_kb = None
+        self.copied_kb = 0.0
+
+    def as_dict(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+# Yielded by a disabled profile; attribute writes on it are discarded
+_NULL_STEP = ProfileStep('', '')
+
+
+class RerunProfile:
+    """
+    Steps recorded during one script run.
+
+    Args:
+        enabled: record steps (False makes step/call no-ops)
+        memory: also record peak allocation per step (tracemalloc; slows
+            the steps it measures)
+    """
+
+    def __init__(self, enabled=False, memory=PERF_MEMORY):
+        self.enabled = enabled
+        self.memory = enabled and memory
+        self.steps = []
+        self.started = time.time()
+        self._start = time.perf_counter()
+        if self.memory:
+            _start_tracing()
+            # Also released if an interrupted rerun never calls finish()
+            self._release = weakref.finalize(self, _stop_tracing)
+
+    @contextmanager
+    def step(self, name, kind='engine', rows_in=None):
+        """Time the enclosed block; set rows_out on the yielded step."""
+        if not self.enabled:
+            yield _NULL_STEP
+            return
+        record = ProfileStep(name, kind, rows_in)
+        if self.memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        outer = getattr(_active, 'step', None)
+        _active.step = record
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.ms = (time.perf_counter() - start) * 1000
+            _active.step = outer
+            if self.memory:
+                record.peak_kb = max(0, tracemalloc.get_traced_memory()[1] - base) / 1024
+            self.steps.append(record)
+
+    def call(self, name, fn, *args, rows_in=None, **kwargs):
+        """fn(*args, **kwargs) as a step; rows_out is counted from the result."""
+        if not self.enabled:
+            return fn(*args, **kwargs)
+        with self.step(name, rows_in=rows_in) as record:
+            result = fn(*args, **kwargs)
+            record.rows_out = count_rows(result)
+        return result
+
+    @property
+    def total_ms(self):
+        return (time.perf_counter() - self._start) * 1000
+
+    @property
+    def copied_kb(self):
+        """KB copied by all steps of this run."""
+        return sum(s.copied_kb for s in self.steps)
+
+    def frame(self):
+        """Recorded steps as a DataFrame, slowest first."""
+        df = pd.DataFrame([s.as_dict() for s in self.steps],
+                          columns=list(ProfileStep.__slots__))
+        return df.sort_values('ms', ascending=False, ignore_index=True)
+
+    def finish(self):
+        """End allocation tracing (stopped once no profile is tracing)."""
+        if self.memory:
+            self._release()
+            self.memory = False
+
+    def write_jsonl(self, path=PERF_LOG, **context):
+        """Append this rerun (steps plus `context` fields) as one JSON line."""
+        if not self.enabled or not path:
+            return
+        line = json.dumps({
+            'ts': self.started,
+            'total_ms': self.total_ms,
+            'copied_kb': self.copied_kb,
+            **context,
+            'steps': [s.as_dict() for s in self.steps],
+        }, default=str)
+        directory = os.path.dirname(path)
+        with _log_lock:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'a') as fh:
+                fh.write(line + '\n')
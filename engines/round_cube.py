@@ -0,0 +1,350 @@
+import numpy as np
+import pandas as pd
+
+from engines.helpers import (
+    bucket_codes, APPROACH_BUCKETS, ZONE_BUCKETS, SHORT_GAME_BUCKETS,
+)
+from engines.partition import _sg_category, SG_CATEGORY_ORDER
+from engines.putting import PUTT_BUCKET_BINS, PUTT_BUCKETS
+from engines.overview import SG_SEPARATORS, SCORE_ORDER, separator_members
+from engines.hole_summary import score_to_name
+
+# ============================================================
+# ROUND CUBE — PER-ROUND ROLLUP OF ADDITIVE METRICS
+# ============================================================
+# Every sidebar filter (player, course, tournament, date) selects whole
+# rounds, so any additive metric of a selection is the sum of that
+# metric over the selected rounds. The cube holds one row per Round Key,
+# built once per benchmark at ingest; a filter state then sums a few
+# dozen rows instead of scanning the shot table. Engines still scan the
+# filtered shots for their detail tables.
+#
+# Column families (one column per label):
+#     sg, shots                         all shots
+#     sg:<category>, shots:<category>   SG_CATEGORY_ORDER
+#     sep:<key>                         SG_SEPARATORS + _ROLLUP_RANGES
+#     putt_sg / putts / putts_made:<bucket>     PUTT_BUCKETS
+#     app_sg / app_shots:<bucket>       APPROACH_BUCKETS
+#     zone_sg / zone_shots:<zone>       ZONE_BUCKETS
+#     short_sg / short_shots:<bucket>   SHORT_GAME_BUCKETS
+#     holes, strokes, par, outcome:<score name>
+#     holes / strokes / hole_sg:par<n>  par 3 / 4 / 5
+#     t5_attempts / t5_fails:<category> Tiger 5
+#     bounce_back_* / drop_off_* / gas_pedal_* / bogey_* flow counters,
+#     bogey_trains (tuple of train lengths per round)
+# ============================================================
+
+# Extra SG ranges used by the overview cards (separator catalog format)
+_ROLLUP_RANGES = [
+    {'key': 'putt_30_plus', 'shot_type': 'Putt', 'distance': (30, None, 'both')},
+    {'key': 'putt_5_10', 'shot_type': 'Putt', 'distance': (5, 10, 'both')},
+]
+
+# Approach buckets (yds): 50–100 ... >200, and the scoring zones
+_APPROACH_BINS = [50, 100, 150, 200, np.inf]
+_ZONE_BINS = [75, 125, 175, 225]
+# Upper edges of SHORT_GAME_BUCKETS; the rest fall in "40–50"
+_SHORT_GAME_EDGES = [10, 20, 30, 40]
+
+_PARS = [3, 4, 5]
+
+# Combined with max instead of sum
+_MAX_COLUMNS = ['longest_bogey_train']
+_DIM_COLUMNS = ['Round ID', 'Player', 'Course', 'Tournament', 'Date']
+
+
+def _per_round(keys, n, weights=None):
+    """Per-round count (or float sum of weights) over round keys."""
+    if weights is None:
+        return np.bincount(keys, minlength=n)
+    return np.bincount(keys, weights=np.nan_to_num(weights), minlength=n)
+
+
+def _bucketed(cols, keys, n, codes, labels, prefix_weights):
+    """Per-round, per-bucket totals; codes of -1 are skipped."""
+    valid = codes >= 0
+    flat = keys[valid] * len(labels) + codes[valid]
+    size = n * len(labels)
+    for prefix, weights in prefix_weights.items():
+        if weights is None:
+            totals = np.bincount(flat, minlength=size)
+        else:
+            totals = np.bincount(flat, weights=np.nan_to_num(weights[valid]), minlength=size)
+        totals = totals.reshape(n, len(labels))
+        for j, label in enumerate(labels):
+            cols[f'{prefix}:{label}'] = totals[:, j]
+
+
+# ============================================================
+# SHOT-LEVEL COLUMNS
+# ============================================================
+
+def _shot_columns(df, n):
+    cols = {}
+    keys = df['Round Key'].to_numpy(dtype=np.intp)
+    sg = df['Strokes Gained'].to_numpy(dtype=float)
+    start = df['Starting Distance'].to_numpy(dtype=float)
+    shot_type = df['Shot Type'].to_numpy()
+
+    cols['shots'] = _per_round(keys, n)
+    cols['sg'] = _per_round(keys, n, sg)
+
+    category = _sg_category(df['Shot Type']).to_numpy()
+    for cat in SG_CATEGORY_ORDER:
+        mask = category == cat
+        cols[f'shots:{cat}'] = _per_round(keys[mask], n)
+        cols[f'sg:{cat}'] = _per_round(keys[mask], n, sg[mask])
+
+    catalog = SG_SEPARATORS + _ROLLUP_RANGES
+    member = separator_members(df, catalog)
+    for j, sep in enumerate(catalog):
+        mask = member[:, j]
+        cols[f"sep:{sep['key']}"] = _per_round(keys[mask], n, sg[mask])
+
+    putt = shot_type == 'Putt'
+    made = (df['Ending Distance'].to_numpy() == 0)[putt]
+    _bucketed(cols, keys[putt], n, bucket_codes(start[putt], PUTT_BUCKET_BINS),
+              PUTT_BUCKETS, {'putts': None, 'putts_made': made, 'putt_sg': sg[putt]})
+
+    app = shot_type == 'Approach'
+    _bucketed(cols, keys[app], n, bucket_codes(start[app], _APPROACH_BINS),
+              APPROACH_BUCKETS, {'app_shots': None, 'app_sg': sg[app]})
+    _bucketed(cols, keys[app], n, bucket_codes(start[app], _ZONE_BINS),
+              ZONE_BUCKETS, {'zone_shots': None, 'zone_sg': sg[app]})
+
+    short = shot_type == 'Short Game'
+    short_codes = np.searchsorted(_SHORT_GAME_EDGES, start[short], side='right')
+    _bucketed(cols, keys[short], n, short_codes,
+              SHORT_GAME_BUCKETS, {'short_shots': None, 'short_sg': sg[short]})
+
+    # Cast made-putt totals back to counts
+    for label in PUTT_BUCKETS:
+        cols[f'putts_made:{label}'] = cols[f'putts_made:{label}'].astype(np.int64)
+    return cols
+
+
+# ============================================================
+# HOLE-LEVEL COLUMNS
+# ============================================================
+
+def _hole_table(df):
+    """
+    One row per hole (sorted by Hole Key, so by round then hole) with
+    the same score, putt and SG columns as build_hole_summary.
+    """
+    holes = df.groupby('Hole Key', sort=True).agg(
+        Hole=('Hole', 'first'),
+        Par=('Par', 'first'),
+        num_shots=('Shot', 'count'),
+        num_penalties=('Penalty', 'sum'),
+        total_sg=('Strokes Gained', 'sum'),
+        round_key=('Round Key', 'first'),
+    )
+    holes['num_putts'] = (
+        (df['Shot Type'] == 'Putt').groupby(df['Hole Key']).sum()
+        .reindex(holes.index, fill_value=0)
+    )
+    holes['Hole Score'] = holes['num_shots'] + holes['num_penalties']
+    return holes
+
+
+def _tiger5_hole_flags(df, holes):
+    """
+    Per-hole Tiger 5 (attempt, fail) bool arrays, aligned with holes,
+    using the rules of the _t5_* functions in tiger5.py.
+    """
+    score = holes['Hole Score'].to_numpy()
+    par = holes['Par'].to_numpy(dtype=np.int64)
+    putts = holes['num_putts'].to_numpy()
+    hole_keys = holes.index.to_numpy()
+
+    # Missed Green: holes with a short game shot, failed if any missed
+    short = df['Shot Type'] == 'Short Game'
+    missed = (df.loc[short, 'Ending Location'] != 'Green').groupby(
+        df.loc[short, 'Hole Key']
+    ).any()
+    mg_attempt = np.isin(hole_keys, missed.index.to_numpy())
+    mg_fail = np.isin(hole_keys, missed.index[missed.to_numpy()].to_numpy())
+
+    # 125yd Bogey: holes with a scoring shot inside 125 yds
+    shot, shot_par = df['Shot'], df['Par']
+    cond = (
+        (df['Starting Distance'] <= 125) &
+        (df['Starting Location'] != 'Recovery') &
+        (
+            ((shot == 3) & (shot_par == 5)) |
+            ((shot == 2) & (shot_par == 4)) |
+            ((shot == 1) & (shot_par == 3))
+        )
+    )
+    a125_attempt = np.isin(hole_keys, df.loc[cond, 'Hole Key'].unique())
+
+    return {
+        '3 Putts': (putts >= 1, putts >= 3),
+        'Double Bogey': (np.ones(len(holes), dtype=bool), score >= par + 2),
+        'Par 5 Bogey': (par == 5, (par == 5) & (score >= 6)),
+        'Missed Green': (mg_attempt, mg_fail),
+        '125yd Bogey': (a125_attempt, a125_attempt & (score > par)),
+    }
+
+
+def _flow_columns(holes, n):
+    """
+    Per-round flow counters of coachs_corner._flow_metrics, computed on
+    consecutive hole pairs within each round.
+    """
+    rk = holes['round_key'].to_numpy(dtype=np.intp)
+    order = np.lexsort((holes['Hole'].to_numpy(), rk))
+    rk = rk[order]
+    score = holes['Hole Score'].to_numpy()[order]
+    par = holes['Par'].to_numpy(dtype=np.int64)[order]
+    bogey = score > par
+    birdie = score < par
+
+    # Pairs (previous hole, hole) within the same round
+    same = rk[1:] == rk[:-1]
+    pair_rk = rk[1:]
+    prev_bogey = bogey[:-1] & same
+    prev_birdie = birdie[:-1] & same
+
+    cols = {
+        'bounce_back_attempts': _per_round(pair_rk[prev_bogey], n),
+        'bounce_back_successes': _per_round(pair_rk[prev_bogey & ~bogey[1:]], n),
+        'drop_off_attempts': _per_round(pair_rk[prev_birdie], n),
+        'drop_off_count': _per_round(pair_rk[prev_birdie & bogey[1:]], n),
+        'gas_pedal_attempts': _per_round(pair_rk[prev_birdie], n),
+        'gas_pedal_count': _per_round(pair_rk[prev_birdie & birdie[1:]], n),
+        'bogey_plus': _per_round(rk[bogey], n),
+        'consecutive_bogey_plus': _per_round(pair_rk[prev_bogey & bogey[1:]], n),
+    }
+
+    # Bogey trains: runs of 2+ bogey-or-worse holes within a round
+    run_start = bogey.copy()
+    run_start[1:] &= ~prev_bogey
+    run_id = np.cumsum(run_start) - 1
+    lengths = np.bincount(run_id[bogey], minlength=int(run_start.sum()))
+    train_rk = rk[run_start]
+    is_train = lengths >= 2
+
+    trains = [[] for _ in range(n)]
+    for r, length in zip(train_rk[is_train], lengths[is_train]):
+        trains[r].append(int(length))
+    cols['bogey_train_count'] = _per_round(train_rk[is_train], n)
+    cols['longest_bogey_train'] = np.array([max(t, default=0) for t in trains], dtype=np.int64)
+    cols['bogey_trains'] = [tuple(t) for t in trains]
+    return cols
+
+
+def _hole_columns(df, n):
+    holes = _hole_table(df)
+    rk = holes['round_key'].to_numpy(dtype=np.intp)
+    score = holes['Hole Score'].to_numpy()
+    par = holes['Par'].to_numpy(dtype=np.int64)
+    hole_sg = holes['total_sg'].to_numpy(dtype=float)
+
+    cols = {
+        'holes': _per_round(rk, n),
+        'strokes': _per_round(rk, n, score).astype(np.int64),
+        'par': _per_round(rk, n, par).astype(np.int64),
+    }
+
+    # Same labels as hole_summary's Score Name
+    name = np.array([score_to_name(d, 0) for d in range(-2, 3)])
+    outcome = name[np.clip(score - par, -2, 2) + 2]
+    for label in SCORE_ORDER:
+        cols[f'outcome:{label}'] = _per_round(rk[outcome == label], n)
+
+    for p in _PARS:
+        mask = par == p
+        cols[f'holes:par{p}'] = _per_round(rk[mask], n)
+        cols[f'strokes:par{p}'] = _per_round(rk[mask], n, score[mask]).astype(np.int64)
+        cols[f'hole_sg:par{p}'] = _per_round(rk[mask], n, hole_sg[mask])
+
+    for cat, (attempt, fail) in _tiger5_hole_flags(df, holes).items():
+        cols[f't5_attempts:{cat}'] = _per_round(rk[attempt], n)
+        cols[f't5_fails:{cat}'] = _per_round(rk[fail], n)
+
+    cols.update(_flow_columns(holes, n))
+    return cols
+
+
+# ============================================================
+# CUBE & SELECTIONS
+# ============================================================
+
+class RoundRollup:
+    """
+    Metrics of a selection of whole rounds.
+
+    Attributes:
+        rows: the selected cube rows (one per round, Round Key order)
+        totals: dict of every additive column summed over rows (ints
+                for counts, floats for SG); longest_bogey_train is the max
+
+    rollup['sg:Putting'] reads a total; len(rollup) is the round count.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+        additive = rows.drop(columns=_DIM_COLUMNS + _MAX_COLUMNS + ['bogey_trains'])
+        # Sum each dtype block on its own so counts stay integers
+        self.totals = {
+            **additive.select_dtypes('integer').sum().to_dict(),
+            **additive.select_dtypes('floating').sum().to_dict(),
+        }
+        for col in _MAX_COLUMNS:
+            self.totals[col] = int(rows[col].max()) if len(rows) else 0
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, column):
+        return self.totals[column]
+
+    def get(self, column, default=0):
+        return self.totals.get(column, default)
+
+    @property
+    def bogey_trains(self):
+        """Lengths of every bogey train, round by round."""
+        return [length for trains in self.rows['bogey_trains'] for length in trains]
+
+
+class RoundCube:
+    """
+    Per-round rollup of the full shot table (one row per Round Key).
+    Rounds with no shots have all-zero rows.
+    """
+
+    def __init__(self, rounds):
+        self.rounds = rounds
+
+    def __len__(self):
+        return len(self.rounds)
+
+    def select(self, round_keys):
+        """RoundRollup of the given Round Keys (e.g. filtered_df['Round Key'].unique())."""
+        keys = np.sort(np.asarray(round_keys, dtype=np.intp))
+        return RoundRollup(self.rounds.iloc[keys])
+
+
+def build_round_cube(df):
+    """
+    Build the RoundCube of a shot table with Strokes Gained and the
+    surrogate keys of data.schema.
+    """
+    n = len(df['Round ID'].cat.categories)
+
+    dims = df.groupby('Round Key', sort=True).agg(
+        **{'Round ID': ('Round ID', 'first')},
+        Player=('Player', 'first'),
+        Course=('Course', 'first'),
+        Tournament=('Tournament', 'first'),
+        Date=('Date', 'first'),
+    ).reindex(pd.RangeIndex(n, name='Round Key'))
+
+    metrics = pd.DataFrame(
+        {**_shot_columns(df, n), **_hole_columns(df, n)},
+        index=dims.index,
+    )
+    return RoundCube(pd.concat([dims, metrics], axis=1))
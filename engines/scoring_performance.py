@@ -1,5 +1,6 @@
 import pandas as pd
 from ui.formatters import round_label
+from engines.helpers import penalty_labels
 
 # ============================================================
 # SCORING PERFORMANCE ENGINE
@@ -31,7 +32,7 @@ def categorize_holes(hole_summary, filtered_df):
     categorized['bogey'] = list(zip(bogey['Round ID'], bogey['Hole']))
 
     # Underperformance: par or better with 3-putt OR short game miss
-    par_or_better = hole_summary[hole_summary['Hole Score'] <= hole_summary['Par']].copy()
+    par_or_better = hole_summary[hole_summary['Hole Score'] <= hole_summary['Par']]
 
     underperf_holes = []
     for _, row in par_or_better.iterrows():
@@ -69,7 +70,7 @@ def find_worst_shot(hole_shots_df):
     if hole_shots_df.empty:
         return None
 
-    sg_numeric = pd.to_numeric(hole_shots_df['Strokes Gained'], errors='coerce')
+    sg_numeric = hole_shots_df['Strokes Gained']
     worst_idx = sg_numeric.idxmin()
     return hole_shots_df.loc[worst_idx]
 
@@ -87,7 +88,7 @@ def categorize_shot(shot_row):
         String category name
     """
     shot_type = shot_row['Shot Type']
-    starting_dist = pd.to_numeric(shot_row['Starting Distance'], errors='coerce')
+    starting_dist = shot_row['Starting Distance']
 
     if shot_type == 'Putt':
         if pd.notna(starting_dist):
@@ -164,7 +165,7 @@ def analyze_category(filtered_df, hole_summary, hole_list, category_name):
         hole_shots = filtered_df[
             (filtered_df['Round ID'] == rid) &
             (filtered_df['Hole'] == hole_num)
-        ].copy()
+        ]
 
         if hole_shots.empty:
             continue
@@ -178,7 +179,7 @@ def analyze_category(filtered_df, hole_summary, hole_list, category_name):
         root_cause = categorize_shot(worst_shot)
 
         # Get worst SG value
-        worst_sg = pd.to_numeric(worst_shot['Strokes Gained'], errors='coerce')
+        worst_sg = worst_shot['Strokes Gained']
         if pd.isna(worst_sg):
             worst_sg = 0.0
 
@@ -216,7 +217,7 @@ def aggregate_by_round(filtered_df, all_analyzed_holes):
         DataFrame with columns for each root cause category + Total Fails
     """
     # Get unique rounds
-    round_info = filtered_df.groupby('Round ID').agg(
+    round_info = filtered_df.groupby('Round ID', observed=True).agg(
         Date=('Date', 'first'),
         Course=('Course', 'first')
     ).reset_index()
@@ -296,7 +297,7 @@ def calculate_penalty_stats(filtered_df, hole_summary, categorized_holes):
             (filtered_df['Round ID'] == rid) &
             (filtered_df['Hole'] == hole)
         ]
-        if (hole_shots['Penalty'] == 'Yes').any():
+        if hole_shots['Penalty'].any():
             bogey_with_penalty += 1
 
     if len(bogey_holes) > 0:
@@ -314,11 +315,11 @@ def calculate_penalty_stats(filtered_df, hole_summary, categorized_holes):
         ]
 
         # Check for penalty
-        if (hole_shots['Penalty'] == 'Yes').any():
+        if hole_shots['Penalty'].any():
             db_with_penalty += 1
 
         # Check for 2+ shots with SG <= -0.5
-        sg_numeric = pd.to_numeric(hole_shots['Strokes Gained'], errors='coerce')
+        sg_numeric = hole_shots['Strokes Gained']
         bad_shots = (sg_numeric <= -0.5).sum()
         if bad_shots >= 2:
             db_with_multiple_bad += 1
@@ -383,7 +384,7 @@ def build_shot_details(filtered_df, all_analyzed_holes):
         hole_shots = filtered_df[
             (filtered_df['Round ID'] == rid) &
             (filtered_df['Hole'] == hole_num)
-        ].copy()
+        ]
 
         if hole_shots.empty:
             continue
@@ -402,11 +403,11 @@ def build_shot_details(filtered_df, all_analyzed_holes):
             'Ending Location': 'Ending Lie',
             'Ending Distance': 'Ending Dist'
         })
+        shots_data['Penalty'] = penalty_labels(shots_data['Penalty'])
 
         # Round numeric values
         for col in ['Starting Dist', 'Ending Dist', 'Strokes Gained']:
             if col in shots_data.columns:
-                shots_data[col] = pd.to_numeric(shots_data[col], errors='coerce')
                 shots_data[col] = shots_data[col].round(1)
 
         shot_details[root_cause].append({
@@ -422,6 +423,14 @@ def build_shot_details(filtered_df, all_analyzed_holes):
     return shot_details
 
 
+# Shot table columns build_scoring_performance reads
+SCORING_PERFORMANCE_COLUMNS = (
+    'Course', 'Tournament', 'Date', 'Round ID', 'Hole', 'Shot',
+    'Starting Distance', 'Starting Location', 'Ending Distance',
+    'Ending Location', 'Penalty', 'Par', 'Shot Type', 'Strokes Gained',
+)
+
+
 def build_scoring_performance(filtered_df, hole_summary):
     """
     Master function that orchestrates all scoring performance analysis.
@@ -508,7 +517,7 @@ def build_scoring_performance(filtered_df, hole_summary):
     # Add Total Score to by_round for scoring impact calculation
     if not by_round.empty:
         # Calculate total score per round from hole_summary
-        round_scores = hole_summary.groupby('Round ID').agg(
+        round_scores = hole_summary.groupby('Round ID', observed=True).agg(
             Total_Score=('Hole Score', 'sum')
         ).reset_index()
         by_round = by_round.merge(
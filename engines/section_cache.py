@@ -0,0 +1,145 @@
+import copy
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# ============================================================
+# SECTION CACHE — MEMOIZE ENGINE SECTIONS BY INPUT CONTENT
+# ============================================================
+# A section is a pure function of a few inputs (a results dict, the
+# hole summary, ...). Its output is stored under a key of those inputs,
+# so a filter change that leaves them unchanged reuses the earlier
+# output instead of recomputing it. When every input is derived from one
+# selection of shots, a run is keyed on that selection (ShotView.key)
+# and nothing is hashed; otherwise each input is content-hashed. Outputs
+# are shared by every session, so they are stored and returned as
+# copies.
+# ============================================================
+
+
+def _update(h, obj):
+    """Feed a content digest of obj into hash h."""
+    if isinstance(obj, pd.DataFrame):
+        h.update(b'D')
+        h.update(repr((list(obj.columns), [str(t) for t in obj.dtypes])).encode())
+        try:
+            h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+        except TypeError:  # unhashable cells (lists, dicts)
+            h.update(pickle.dumps(obj))
+    elif isinstance(obj, pd.Series):
+        h.update(b'S')
+        h.update(repr((obj.name, str(obj.dtype))).encode())
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, np.ndarray):
+        h.update(b'A')
+        h.update(repr((obj.dtype.str, obj.shape)).encode())
+        h.update(pickle.dumps(obj) if obj.dtype == object else obj.tobytes())
+    elif isinstance(obj, dict):
+        h.update(b'{')
+        for k, v in obj.items():
+            _update(h, k)
+            _update(h, v)
+        h.update(b'}')
+    elif isinstance(obj, (list, tuple)):
+        h.update(b'[' if isinstance(obj, list) else b'(')
+        for v in obj:
+            _update(h, v)
+        h.update(b']')
+    elif obj is None or isinstance(obj, (str, bool, int, float, np.generic, pd.Timestamp)):
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+    else:
+        h.update(pickle.dumps(obj))
+
+
+def fingerprint(obj):
+    """Content hash of a DataFrame / Series / array / nested dict or list."""
+    h = hashlib.blake2b(digest_size=16)
+    _update(h, obj)
+    return h.hexdigest()
+
+
+class SectionCache:
+    """
+    Bounded LRU of section outputs keyed by (section name, input hashes).
+    Shared across reruns and sessions; cached outputs must be treated as
+    read-only by callers.
+    """
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self._store = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._store:
+                return False, None
+            self._store.move_to_end(key)
+            return True, self._store[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._store[key] = value
+            self._store.move_to_end(key)
+            while len(self._store) > self.maxsize:
+                self._store.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._store.clear()
+
+    def run(self, key=None):
+        """
+        Start a SectionRun for one engine call; `key` (hashable) names
+        the selection every section input is derived from.
+        """
+        return SectionRun(self, key)
+
+
+class SectionRun:
+    """
+    One engine call against a SectionCache. Sections are keyed on the
+    run's `key` when it has one; otherwise each input object is hashed
+    at most once per run. Every section's wall time and cache hit are
+    recorded in `timings` as {name: {"ms", "cached"}}.
+    """
+
+    def __init__(self, cache, key=None):
+        self.cache = cache
+        self.key = key
+        self.timings = {}
+        self._digests = {}
+
+    def digest(self, obj):
+        key = id(obj)
+        if key not in self._digests:
+            self._digests[key] = (obj, fingerprint(obj))  # keep obj alive so id stays unique
+        return self._digests[key][1]
+
+    def section(self, name, inputs, compute):
+        """
+        Return compute() for section `name`, reusing the cached output
+        for the same run key, or when every object in `inputs` hashes as
+        it did before. The caller gets its own copy either way.
+        """
+        start = time.perf_counter()
+        if self.key is not None:
+            key = (name, self.key)
+        else:
+            key = (name,) + tuple(self.digest(obj) for obj in inputs)
+        cached, value = self.cache.get(key)
+        if cached:
+            value = copy.deepcopy(value)
+        else:
+            value = compute()
+            self.cache.put(key, copy.deepcopy(value))
+        self.timings[name] = {
+            "ms": (time.perf_counter() - start) * 1000,
+            "cached": cached,
+        }
+        return value
@@ -1,43 +1,86 @@
+import numpy as np
 import pandas as pd
-from engines.helpers import sg_distance_bucket, leave_distance_bucket, SHORT_GAME_BUCKETS, LEAVE_BUCKETS, LIE_ORDER
+from engines.helpers import SHORT_GAME_BUCKETS, LEAVE_BUCKETS, LIE_ORDER, penalty_labels
 from ui.formatters import round_label
+from engines.partition import shot_type_slice
+from engines.distance_index import build_distance_index
 
 # ============================================================
 # SHORT GAME ENGINE
 # ============================================================
 
+# Upper edges of SHORT_GAME_BUCKETS (<10 ... 30–40); the rest (and missing
+# distances) fall in "40–50", matching helpers.sg_distance_bucket
+_DIST_EDGES = [10, 20, 30, 40]
+# Inclusive upper edges of LEAVE_BUCKETS (0–3 ... 10–20); the rest is "20+",
+# matching helpers.leave_distance_bucket
+_LEAVE_EDGES = [3, 6, 10, 20]
 
 
-def _build_hero_metrics(df, num_rounds):
+def _build_cube(df):
+    """
+    One grouped aggregation over (distance bucket, starting lie, leave bucket).
+
+    Each stat is a 3-D array of per-group sums. Rows with no starting lie
+    sit at lie index 0. Returns (cube, lies).
+    """
+    start = df['Starting Distance'].to_numpy(dtype=float)
+    end = df['Ending Distance'].to_numpy(dtype=float)
+    sg = df['Strokes Gained'].to_numpy(dtype=float)
+
+    dist = np.searchsorted(_DIST_EDGES, start, side='right')
+    leave = np.searchsorted(_LEAVE_EDGES, end, side='left')
+    lie_codes, lies = pd.factorize(df['Starting Location'])
+
+    shape = (len(SHORT_GAME_BUCKETS), len(lies) + 1, len(LEAVE_BUCKETS))
+    flat = np.ravel_multi_index((dist, lie_codes + 1, leave), shape)
+    size = int(np.prod(shape))
+
+    def _sum(weights=None):
+        return np.bincount(flat, weights=weights, minlength=size).reshape(shape)
+
+    has_sg = ~np.isnan(sg)
+    has_end = ~np.isnan(end)
+    inside_8 = end <= 8
+    cube = {
+        "shots": _sum(),
+        "sg_sum": _sum(np.where(has_sg, sg, 0.0)),
+        "sg_n": _sum(has_sg),
+        "prox_sum": _sum(np.where(has_end, end, 0.0)),
+        "prox_n": _sum(has_end),
+        "inside_8": _sum(inside_8),
+        "inside_8_green": _sum(
+            inside_8 & (df['Ending Location'].to_numpy() == 'Green')
+        ),
+    }
+    return cube, list(lies)
+
+
+def _lie_totals(cube, lies, names):
+    """Sum each stat over the given starting lies (all buckets)."""
+    idx = [lies.index(n) + 1 for n in names if n in lies]
+    return {k: v[:, idx, :].sum() for k, v in cube.items()}
+
+
+def _build_hero_metrics(df, num_rounds, cube, lies, index):
     """Compute the five hero-card values."""
     sg_total = df['Strokes Gained'].sum()
     sg_per_round = sg_total / num_rounds if num_rounds > 0 else 0.0
 
-    shots_25_50 = df[df['Starting Distance'] >= 25]
-    sg_25_50 = shots_25_50['Strokes Gained'].sum() if not shots_25_50.empty else 0.0
-
-    shots_arg = df[df['Starting Distance'] < 25]
-    sg_arg = shots_arg['Strokes Gained'].sum() if not shots_arg.empty else 0.0
+    sg_25_50 = index.sg(lo=25)
+    sg_arg = index.sg(hi=25, inclusive='left')
 
     # % inside 8 ft on the green — Fairway & Rough
-    fr_shots = df[df['Starting Location'].isin(['Fairway', 'Rough'])]
-    if len(fr_shots) > 0:
-        fr_inside_8 = fr_shots[
-            (fr_shots['Ending Distance'] <= 8) & (fr_shots['Ending Location'] == 'Green')
-        ]
-        pct_inside_8_fr = len(fr_inside_8) / len(fr_shots) * 100
-    else:
-        pct_inside_8_fr = 0.0
+    fr = _lie_totals(cube, lies, ['Fairway', 'Rough'])
+    pct_inside_8_fr = (
+        fr["inside_8_green"] / fr["shots"] * 100 if fr["shots"] > 0 else 0.0
+    )
 
     # % inside 8 ft on the green — Sand
-    sand_shots = df[df['Starting Location'] == 'Sand']
-    if len(sand_shots) > 0:
-        sand_inside_8 = sand_shots[
-            (sand_shots['Ending Distance'] <= 8) & (sand_shots['Ending Location'] == 'Green')
-        ]
-        pct_inside_8_sand = len(sand_inside_8) / len(sand_shots) * 100
-    else:
-        pct_inside_8_sand = 0.0
+    sand = _lie_totals(cube, lies, ['Sand'])
+    pct_inside_8_sand = (
+        sand["inside_8_green"] / sand["shots"] * 100 if sand["shots"] > 0 else 0.0
+    )
 
     return {
         "sg_total": sg_total,
@@ -49,79 +92,108 @@ def _build_hero_metrics(df, num_rounds):
     }
 
 
-def _build_heatmap_data(df):
-    """Build SG/Shot and shot-count pivot tables for the heat map."""
-    heat_df = df[df['Starting Location'].isin(LIE_ORDER)]
+def _ratio(num, den):
+    """Elementwise num / den, NaN where den is 0."""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(den > 0, num / np.where(den > 0, den, 1), np.nan)
 
-    sg_pivot = heat_df.pivot_table(
-        index='Starting Location',
-        columns='Dist Bucket',
-        values='Strokes Gained',
-        aggfunc='mean',
-    )
 
-    count_pivot = heat_df.pivot_table(
-        index='Starting Location',
-        columns='Dist Bucket',
-        values='Strokes Gained',
-        aggfunc='count',
-    )
-
-    # Enforce consistent row/column ordering; missing combos become NaN
-    sg_pivot = sg_pivot.reindex(index=LIE_ORDER, columns=SHORT_GAME_BUCKETS)
-    count_pivot = count_pivot.reindex(index=LIE_ORDER, columns=SHORT_GAME_BUCKETS)
+def _build_heatmap_data(cube, lies):
+    """Build SG/Shot and shot-count pivot tables for the heat map."""
+    sg_sum = cube["sg_sum"].sum(axis=2)
+    sg_n = cube["sg_n"].sum(axis=2)
+    shots = cube["shots"].sum(axis=2)
+
+    sg_rows, count_rows = [], []
+    for lie in LIE_ORDER:
+        if lie in lies:
+            i = lies.index(lie) + 1
+            sg_rows.append(_ratio(sg_sum[:, i], sg_n[:, i]))
+            count_rows.append(np.where(shots[:, i] > 0, sg_n[:, i], np.nan))
+        else:
+            sg_rows.append(np.full(len(SHORT_GAME_BUCKETS), np.nan))
+            count_rows.append(np.full(len(SHORT_GAME_BUCKETS), np.nan))
+
+    # Missing lie/bucket combos stay NaN
+    index = pd.Index(LIE_ORDER, name='Starting Location')
+    columns = pd.Index(SHORT_GAME_BUCKETS, name='Dist Bucket')
+    sg_pivot = pd.DataFrame(sg_rows, index=index, columns=columns)
+    count_pivot = pd.DataFrame(count_rows, index=index, columns=columns)
+    if not count_pivot.isna().any().any():
+        count_pivot = count_pivot.astype(int)
 
     return sg_pivot, count_pivot
 
 
-def _build_distance_lie_table(df):
-    """Aggregate short game stats by distance bucket and starting lie."""
-    lie_table = df.groupby(['Dist Bucket', 'Starting Location']).agg(
-        Shots=('Strokes Gained', 'count'),
-        **{'Total SG': ('Strokes Gained', 'sum')},
-        **{'SG/Shot': ('Strokes Gained', 'mean')},
-        **{'Avg Proximity': ('Ending Distance', 'mean')},
-        **{'Inside 8 ft': ('Ending Distance', lambda x: (x <= 8).sum())},
-    ).reset_index()
-
-    return lie_table
-
-
-def _build_leave_distribution(df):
+def _build_distance_lie_table(cube, lies):
+    """Short game stats by distance bucket and starting lie."""
+    totals = {k: v.sum(axis=2) for k, v in cube.items()}
+
+    rows = []
+    for b, bucket in enumerate(SHORT_GAME_BUCKETS):
+        for i, lie in enumerate(lies, start=1):
+            if totals["shots"][b, i] == 0:
+                continue
+            rows.append({
+                'Dist Bucket': bucket,
+                'Starting Location': lie,
+                'Shots': int(totals["sg_n"][b, i]),
+                'Total SG': totals["sg_sum"][b, i],
+                'SG/Shot': _ratio(totals["sg_sum"][b, i], totals["sg_n"][b, i]).item(),
+                'Avg Proximity': _ratio(totals["prox_sum"][b, i], totals["prox_n"][b, i]).item(),
+                'Inside 8 ft': int(totals["inside_8"][b, i]),
+            })
+
+    # Same row order as a groupby on the label columns
+    rows.sort(key=lambda r: (r['Dist Bucket'], r['Starting Location']))
+    return pd.DataFrame(rows, columns=[
+        'Dist Bucket', 'Starting Location', 'Shots', 'Total SG',
+        'SG/Shot', 'Avg Proximity', 'Inside 8 ft',
+    ])
+
+
+def _build_leave_distribution(cube):
     """Count shots in each leave-distance bucket."""
-    df = df.copy()
-    df['Leave Bucket'] = df['Ending Distance'].apply(leave_distance_bucket)
-
-    leave_dist = (
-        df.groupby('Leave Bucket')
-        .size()
-        .reindex(LEAVE_BUCKETS, fill_value=0)
-        .reset_index(name='Shots')
-    )
-    leave_dist.columns = ['Leave Bucket', 'Shots']
-    return leave_dist
+    return pd.DataFrame({
+        'Leave Bucket': LEAVE_BUCKETS,
+        'Shots': cube["shots"].sum(axis=(0, 1)),
+    })
 
 
 def _build_trend(df):
     """Per-round SG and inside-8-ft trend data."""
-    round_trend = df.groupby('Round ID').agg(
-        Date=('Date', 'first'),
-        Course=('Course', 'first'),
-        SG=('Strokes Gained', 'sum'),
-        Total_Shots=('Strokes Gained', 'count'),
-        Inside8_Count=('Ending Distance', lambda x: (x <= 8).sum()),
-    ).reset_index()
-
-    round_trend['Date'] = pd.to_datetime(round_trend['Date'])
-    round_trend = round_trend.sort_values('Date')
-    round_trend['Inside8 %'] = round_trend.apply(
-        lambda r: r['Inside8_Count'] / r['Total_Shots'] * 100 if r['Total_Shots'] > 0 else 0,
-        axis=1,
-    )
-    round_trend['Label'] = round_trend.apply(
-        lambda r: round_label(r['Date'], r['Course']), axis=1
-    )
-    return round_trend
+    # Sorted round codes give the same round order as groupby('Round ID')
+    codes, rounds = pd.factorize(df['Round ID'], sort=True)
+    keep = codes >= 0
+    codes = codes[keep]
+    n = len(rounds)
+
+    sg = df['Strokes Gained'].to_numpy(dtype=float)[keep]
+    has_sg = ~np.isnan(sg)
+    inside_8 = df['Ending Distance'].to_numpy(dtype=float)[keep] <= 8
+    _, first = np.unique(codes, return_index=True)
+
+    total = np.bincount(codes, weights=has_sg, minlength=n).astype(int)
+    inside_8_count = np.bincount(codes, weights=inside_8, minlength=n).astype(int)
+    dates = pd.to_datetime(df['Date'].to_numpy()[keep][first])
+    courses = df['Course'].to_numpy()[keep][first]
+
+    # Chronological order (same sort as sort_values('Date'))
+    order = np.argsort(dates.to_numpy(), kind='quicksort')
+    dates, courses = dates[order], courses[order]
+
+    return pd.DataFrame({
+        'Round ID': rounds[order],
+        'Date': dates,
+        'Course': courses,
+        'SG': np.bincount(codes, weights=np.where(has_sg, sg, 0.0), minlength=n)[order],
+        'Total_Shots': total[order],
+        'Inside8_Count': inside_8_count[order],
+        'Inside8 %': np.where(
+            total > 0, inside_8_count / np.maximum(total, 1) * 100, 0.0
+        )[order],
+        'Label': [round_label(d, c) for d, c in zip(dates, courses)],
+    }, index=order)
 
 
 def _build_shot_detail(df):
@@ -131,8 +203,7 @@ def _build_shot_detail(df):
         'Starting Distance', 'Starting Location',
         'Ending Distance', 'Ending Location', 'Penalty', 'Strokes Gained',
     ]
-    shot_detail = df[detail_cols].copy()
-    shot_detail = shot_detail.rename(columns={
+    shot_detail = df[detail_cols].rename(columns={
         'Shot': 'Shot #',
         'Starting Distance': 'Start Dist',
         'Starting Location': 'Start Lie',
@@ -140,6 +211,7 @@ def _build_shot_detail(df):
         'Ending Location': 'End Lie',
         'Strokes Gained': 'SG',
     })
+    shot_detail['Penalty'] = penalty_labels(shot_detail['Penalty'])
     shot_detail = shot_detail.sort_values(['Date', 'Course', 'Hole', 'Shot #'])
     return shot_detail
 
@@ -148,7 +220,15 @@ def _build_shot_detail(df):
 # MASTER BUILDER
 # ============================================================
 
-def build_short_game_results(filtered_df, num_rounds):
+# Shot table columns build_short_game_results reads
+SHORT_GAME_COLUMNS = (
+    'Player', 'Course', 'Date', 'Round ID', 'Hole', 'Shot',
+    'Starting Distance', 'Starting Location', 'Ending Distance',
+    'Ending Location', 'Penalty', 'Shot Type', 'Strokes Gained',
+)
+
+
+def build_short_game_results(filtered_df, num_rounds, shots=None):
     """
     Compute all short game analytics for the Short Game tab.
 
@@ -156,7 +236,7 @@ def build_short_game_results(filtered_df, num_rounds):
     Keys 'total_sg', 'sg_per_round', and 'empty' are also consumed
     by overview.py and coachs_corner.py — do not remove them.
     """
-    df = filtered_df[filtered_df['Shot Type'] == 'Short Game'].copy()
+    df = shot_type_slice(filtered_df, 'Short Game', shots)
 
     empty_hero = {
         "sg_total": 0.0, "sg_per_round": 0.0,
@@ -179,18 +259,18 @@ def build_short_game_results(filtered_df, num_rounds):
             "shot_detail": pd.DataFrame(),
         }
 
-    # Ensure distances are numeric
-    df['Ending Distance'] = pd.to_numeric(df['Ending Distance'], errors='coerce')
-    df['Starting Distance'] = pd.to_numeric(df['Starting Distance'], errors='coerce')
-
-    # Distance bucket column — shared by heatmap and distance-lie table
-    df['Dist Bucket'] = df['Starting Distance'].apply(sg_distance_bucket)
+    # Bucket codes and per-group sums shared by every section
+    cube, lies = _build_cube(df)
+    index = (
+        shots.distance_index('Short Game') if shots is not None
+        else build_distance_index(df)
+    )
 
     # Build each section
-    hero = _build_hero_metrics(df, num_rounds)
-    sg_pivot, count_pivot = _build_heatmap_data(df)
-    lie_table = _build_distance_lie_table(df)
-    leave_dist = _build_leave_distribution(df)
+    hero = _build_hero_metrics(df, num_rounds, cube, lies, index)
+    sg_pivot, count_pivot = _build_heatmap_data(cube, lies)
+    lie_table = _build_distance_lie_table(cube, lies)
+    leave_dist = _build_leave_distribution(cube)
     trend = _build_trend(df)
     shot_detail = _build_shot_detail(df)
 
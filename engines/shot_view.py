@@ -0,0 +1,122 @@
+import hashlib
+import itertools
+import weakref
+
+import numpy as np
+import pandas as pd
+
+from engines.rerun_profile import record_copy
+
+# ============================================================
+# SHOT VIEW — ONE FILTER STATE OVER THE SHARED SHOT TABLE
+# ============================================================
+# Every session reads the same shot table (one per dataset version and
+# benchmark, held once per process). A filter state is just the sorted
+# integer positions of its rows; columns and frames are taken from the
+# shared table when an engine asks for them, and a view of every row
+# hands out the table itself without copying it.
+#
+# Engines declare the columns they read (<ENGINE>_COLUMNS next to each
+# build function) and get frame(columns): a projection whose columns
+# are taken once per view and shared by every engine that reads them.
+#
+# view.key identifies the selection (which table, which rows) without
+# hashing any data, for caches of results derived from it.
+# ============================================================
+
+# Views hand out shallow copies of the table every session shares; only
+# copy-on-write (always on from pandas 3) keeps an engine's writes off it
+if int(pd.__version__.split('.')[0]) < 3 and pd.options.mode.copy_on_write is not True:
+    raise ImportError(
+        "engines.shot_view needs copy-on-write: install pandas>=3 "
+        "(or set pd.options.mode.copy_on_write = True on pandas 2)"
+    )
+
+# id(table) -> token, dropped when the table is freed so a new table at
+# the same address never shares a token
+_table_tokens = {}
+_next_token = itertools.count()
+
+
+def _table_token(table):
+    key = id(table)
+    if key not in _table_tokens:
+        _table_tokens[key] = next(_next_token)
+        weakref.finalize(table, _table_tokens.pop, key, None)
+    return _table_tokens[key]
+
+
+class ShotView:
+    """
+    Rows of the shared shot table selected by one filter state.
+
+    Attributes:
+        table: the shared shot table (all shots; never modified)
+        rows: sorted int64 positions of the selected rows in table
+        full: True when every row is selected
+
+    Taken columns and the full frame are kept for the life of the view
+    (one rerun); takes are counted by the rerun profile's copy meter.
+    """
+
+    def __init__(self, table, rows=None):
+        self.table = table
+        if rows is None:
+            rows = np.arange(len(table), dtype=np.int64)
+        self.rows = np.asarray(rows, dtype=np.int64)
+        self.full = len(self.rows) == len(table)
+        self._frame = None
+        self._columns = {}
+        self._key = None
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def empty(self):
+        return len(self.rows) == 0
+
+    @property
+    def key(self):
+        """Hashable identity of this selection: the table and a digest of its rows."""
+        if self._key is None:
+            rows = hashlib.blake2b(self.rows.tobytes(), digest_size=16).hexdigest()
+            self._key = (_table_token(self.table), rows)
+        return self._key
+
+    def column(self, name):
+        """One column of the selected rows (taken once; only that column)."""
+        if self.full:
+            return self.table[name]
+        if self._frame is not None:
+            return self._frame[name]
+        if name not in self._columns:
+            self._columns[name] = record_copy(self.table[name].take(self.rows))
+        return self._columns[name]
+
+    def frame(self, columns=None):
+        """
+        The selected rows as a DataFrame: every column, or only
+        `columns` (an engine's declared inputs). A full view copies no
+        data (a shallow copy or column selection of the table, which
+        copy-on-write keeps apart from the shared table); a partial
+        view's projection is built from its taken columns.
+        """
+        if columns is not None:
+            columns = list(columns)
+            if self.full:
+                return self.table[columns]
+            if self._frame is not None:
+                return self._frame[columns]
+            return pd.DataFrame({name: self.column(name) for name in columns}, copy=False)
+        if self._frame is None:
+            if self.full:
+                self._frame = self.table.copy(deep=False)
+            else:
+                self._frame = record_copy(self.table.take(self.rows))
+        return self._frame
+
+
+def shot_view(df):
+    """A ShotView of every row of df (for callers holding a DataFrame)."""
+    return df if isinstance(df, ShotView) else ShotView(df)
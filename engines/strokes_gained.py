@@ -1,7 +1,8 @@
 import os
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
-import streamlit as st
 
 # ============================================================
 # STROKES GAINED ENGINE — BENCHMARK-BASED SG CALCULATOR
@@ -26,10 +27,11 @@ LOCATION_TO_COLUMN = {
 }
 
 
-@st.cache_data
+@lru_cache(maxsize=None)
 def load_benchmark(benchmark_name):
     """
     Load a benchmark CSV into a dict-of-dicts for fast lookup.
+    Read once per process; callers must not modify the returned dict.
 
     Returns:
         lookup: dict  {column_name: {distance_int: expected_strokes_float}}
@@ -112,8 +114,8 @@ def calculate_sg_for_shot(lookup, start_location, start_distance,
     if exp_end is None:
         return None
 
-    # Penalty: 'Yes' means 1 extra stroke consumed
-    penalty_strokes = 1 if str(penalty).strip().lower() == 'yes' else 0
+    # Penalty: 'Yes' (or True) means 1 extra stroke consumed
+    penalty_strokes = 1 if str(penalty).strip().lower() in ('yes', 'true') else 0
 
     sg = exp_start - exp_end - 1 - penalty_strokes
     return round(sg, 4)
@@ -136,8 +138,8 @@ def apply_benchmark_sg(df, benchmark_name):
 
     df = df.copy()
 
-    start_dist = pd.to_numeric(df['Starting Distance'], errors='coerce').round().clip(0, 600).astype('Int64')
-    end_dist   = pd.to_numeric(df['Ending Distance'],   errors='coerce').round().clip(0, 600).astype('Int64')
+    start_dist = df['Starting Distance'].round().clip(0, 600).astype('Int64')
+    end_dist   = df['Ending Distance'].round().clip(0, 600).astype('Int64')
 
     exp_start = pd.Series(np.nan, index=df.index, dtype=float)
     exp_end   = pd.Series(np.nan, index=df.index, dtype=float)
@@ -152,18 +154,17 @@ def apply_benchmark_sg(df, benchmark_name):
             exp_end[e_mask] = end_dist[e_mask].map(lookup[col])
 
     # Holed-out shots (ending distance <= 0)
-    holed = pd.to_numeric(df['Ending Distance'], errors='coerce') <= 0
+    holed = df['Ending Distance'] <= 0
     exp_end[holed] = 0.0
 
-    penalty_strokes = (df['Penalty'].astype(str).str.strip().str.lower() == 'yes').astype(int)
+    # Penalty is bool in the load_data schema: one extra stroke consumed
+    penalty_strokes = df['Penalty'].astype(int)
     calculated = exp_start - exp_end - 1 - penalty_strokes
 
     # Use calculated SG - if 'Strokes Gained' column doesn't exist in source data,
     # just use the calculated values
     if 'Strokes Gained' in df.columns:
-        original_sg = pd.to_numeric(df['Strokes Gained'], errors='coerce')
-        df['Strokes Gained'] = calculated.fillna(original_sg)
-    else:
-        df['Strokes Gained'] = calculated
+        calculated = calculated.fillna(df['Strokes Gained'].astype(float))
+    df['Strokes Gained'] = calculated
 
     return df
@@ -1,5 +1,6 @@
 import pandas as pd
 from ui.formatters import round_label
+from engines.partition import shot_type_slice
 
 # ============================================================
 # TIGER 5 ENGINE — CENTRALIZED & REUSABLE
@@ -11,7 +12,7 @@ def _t5_three_putts(hole_summary):
     fails = (hole_summary['num_putts'] >= 3).sum()
 
     detail = hole_summary[hole_summary['num_putts'] >= 3][
-        ['Player', 'Round ID', 'Date', 'Course', 'Hole', 'Par', 'Hole Score']
+        ['Player', 'Round ID', 'Date', 'Course', 'Hole', 'Hole Key', 'Par', 'Hole Score']
     ].copy()
 
     return attempts, fails, detail
@@ -24,7 +25,7 @@ def _t5_double_bogey(hole_summary):
     fails = mask.sum()
 
     detail = hole_summary[mask][
-        ['Player', 'Round ID', 'Date', 'Course', 'Hole', 'Par', 'Hole Score']
+        ['Player', 'Round ID', 'Date', 'Course', 'Hole', 'Hole Key', 'Par', 'Hole Score']
     ].copy()
 
     return attempts, fails, detail
@@ -39,35 +40,41 @@ def _t5_par5_bogey(hole_summary):
     fails = mask.sum()
 
     detail = par5[mask][
-        ['Player', 'Round ID', 'Date', 'Course', 'Hole', 'Par', 'Hole Score']
+        ['Player', 'Round ID', 'Date', 'Course', 'Hole', 'Hole Key', 'Par', 'Hole Score']
     ].copy()
 
     return attempts, fails, detail
 
 
-def _t5_missed_green_short_game(df, hole_summary):
+def _t5_missed_green_short_game(df, hole_summary, shots=None):
     """Missed Green: any short game shot not ending on the green."""
-    sg_shots = df[df['Shot Type'] == 'Short Game'].copy()
+    sg_shots = shot_type_slice(df, 'Short Game', shots)
     if sg_shots.empty:
-        return 0, 0, sg_shots
+        return 0, 0, sg_shots.copy()
 
-    sg_shots['missed_green'] = sg_shots['Ending Location'] != 'Green'
+    sg_shots = sg_shots.assign(missed_green=sg_shots['Ending Location'] != 'Green')
 
-    by_hole = sg_shots.groupby(
-        ['Player', 'Round ID', 'Date', 'Course', 'Hole']
-    ).agg(any_missed=('missed_green', 'any')).reset_index()
+    # Hole Key order matches (Player, Round ID, Hole)
+    by_hole = sg_shots.groupby('Hole Key').agg(
+        Player=('Player', 'first'),
+        **{'Round ID': ('Round ID', 'first')},
+        Date=('Date', 'first'),
+        Course=('Course', 'first'),
+        Hole=('Hole', 'first'),
+        any_missed=('missed_green', 'any'),
+    ).reset_index()
 
     attempts = len(by_hole)
     fails = by_hole['any_missed'].sum()
 
     detail = by_hole[by_hole['any_missed']][
-        ['Player', 'Round ID', 'Date', 'Course', 'Hole']
-    ].copy()
+        ['Player', 'Round ID', 'Date', 'Course', 'Hole', 'Hole Key']
+    ].reset_index(drop=True)
 
     if not detail.empty:
         detail = detail.merge(
-            hole_summary[['Player', 'Round ID', 'Hole', 'Par', 'Hole Score']],
-            on=['Player', 'Round ID', 'Hole'],
+            hole_summary[['Hole Key', 'Par', 'Hole Score']],
+            on='Hole Key',
             how='left'
         )
 
@@ -86,14 +93,16 @@ def _t5_approach_125_bogey(df, hole_summary):
         )
     )
 
-    candidates = df[cond][['Player', 'Round ID', 'Date', 'Course', 'Hole']].drop_duplicates()
+    candidates = df.loc[
+        cond, ['Player', 'Round ID', 'Date', 'Course', 'Hole', 'Hole Key']
+    ].drop_duplicates('Hole Key')
 
     if candidates.empty:
         return 0, 0, candidates
 
     with_score = candidates.merge(
-        hole_summary[['Player', 'Round ID', 'Hole', 'Hole Score', 'Par']],
-        on=['Player', 'Round ID', 'Hole'],
+        hole_summary[['Hole Key', 'Hole Score', 'Par']],
+        on='Hole Key',
         how='left'
     )
 
@@ -110,12 +119,24 @@ def _t5_approach_125_bogey(df, hole_summary):
 # MASTER TIGER 5 CALCULATOR (RENAMED FOR APP.PY)
 # ============================================================
 
-def build_tiger5_results(df, hole_summary):
+# Shot table columns build_tiger5_results reads
+TIGER5_COLUMNS = (
+    'Player', 'Course', 'Date', 'Round ID', 'Hole', 'Shot',
+    'Starting Distance', 'Starting Location', 'Ending Location', 'Par',
+    'Shot Type', 'Hole Key',
+)
+
+
+def build_tiger5_results(df, hole_summary, shots=None, rollup=None):
     """
     Returns:
         - results: dict of each Tiger 5 category with attempts, fails, detail_holes
         - total_fails: total Tiger 5 fails
         - grit_score: success rate %
+
+    With a RoundRollup of the same rounds (see round_cube.py) attempts,
+    fails and by_round come from its per-round rows; df and hole_summary
+    are then only scanned for the detail_holes tables.
     """
     results = {}
 
@@ -144,7 +165,7 @@ def build_tiger5_results(df, hole_summary):
     }
 
     # Missed Green
-    a_mg, f_mg, d_mg = _t5_missed_green_short_game(df, hole_summary)
+    a_mg, f_mg, d_mg = _t5_missed_green_short_game(df, hole_summary, shots)
     results['Missed Green'] = {
         'attempts': a_mg,
         'fails': f_mg,
@@ -159,6 +180,11 @@ def build_tiger5_results(df, hole_summary):
         'detail_holes': d_125
     }
 
+    if rollup is not None:
+        for name, r in results.items():
+            r['attempts'] = rollup[f't5_attempts:{name}']
+            r['fails'] = rollup[f't5_fails:{name}']
+
     # Totals
     total_attempts = sum(r['attempts'] for r in results.values())
     total_fails = sum(r['fails'] for r in results.values())
@@ -171,7 +197,10 @@ def build_tiger5_results(df, hole_summary):
     # Pack grit_score and by_round into the results dict so overview_tab
     # can access them as tiger5_results["grit_score"] and tiger5_results["by_round"]
     results["grit_score"] = grit_score
-    results["by_round"] = tiger5_by_round(df, hole_summary)
+    results["by_round"] = (
+        tiger5_by_round(df, hole_summary) if rollup is None
+        else _tiger5_by_round_from_rollup(rollup, list(results)[:5])
+    )
 
     return results, total_fails, grit_score
 
@@ -182,7 +211,7 @@ def build_tiger5_results(df, hole_summary):
 
 def tiger5_by_round(df, hole_summary):
     """Per-round Tiger 5 breakdown."""
-    round_info = df.groupby('Round ID').agg(
+    round_info = df.groupby('Round ID', observed=True).agg(
         Date=('Date', 'first'),
         Course=('Course', 'first')
     ).reset_index()
@@ -233,10 +262,40 @@ def tiger5_by_round(df, hole_summary):
     return t5_df
 
 
+def _tiger5_by_round_from_rollup(rollup, categories):
+    """tiger5_by_round() read from the rollup's per-round rows."""
+    rows = rollup.rows
+    if rows.empty:
+        return pd.DataFrame()
+
+    t5_df = pd.DataFrame({
+        'Round ID': rows['Round ID'].astype(str).to_numpy(),
+        'Date': pd.to_datetime(rows['Date']).to_numpy(),
+        'Course': rows['Course'].to_numpy(),
+    })
+    t5_df.insert(1, 'Label', [
+        round_label(d, c) for d, c in zip(t5_df['Date'], t5_df['Course'])
+    ])
+    for name in categories:
+        t5_df[name] = rows[f't5_fails:{name}'].to_numpy()
+    t5_df['Total Score'] = rows['strokes'].to_numpy()
+
+    t5_df = t5_df.sort_values('Date')
+    t5_df['Total Fails'] = t5_df[categories].sum(axis=1)
+    return t5_df
+
+
 # ============================================================
 # TIGER 5 ROOT CAUSE ANALYSIS
 # ============================================================
 
+# Shot table columns build_tiger5_root_cause reads
+TIGER5_ROOT_CAUSE_COLUMNS = (
+    'Shot', 'Starting Distance', 'Ending Distance', 'Shot Type', 'Hole Key',
+    'Strokes Gained',
+)
+
+
 def build_tiger5_root_cause(df, tiger5_results, hole_summary):
     """
     Analyse every Tiger 5 fail to determine which shot type caused it.
@@ -260,6 +319,9 @@ def build_tiger5_root_cause(df, tiger5_results, hole_summary):
     tiger5_names = ['3 Putts', 'Double Bogey', 'Par 5 Bogey',
                     'Missed Green', '125yd Bogey']
 
+    # Row positions of every hole's shots, looked up by Hole Key
+    hole_rows = df.groupby('Hole Key', sort=False).indices
+
     for stat_name in tiger5_names:
         info = tiger5_results.get(stat_name, {})
         if not isinstance(info, dict) or info.get('fails', 0) == 0:
@@ -270,19 +332,18 @@ def build_tiger5_root_cause(df, tiger5_results, hole_summary):
         items = []
 
         for _, row in detail_holes.iterrows():
-            rid = row['Round ID']
-            hole = row['Hole']
-            hole_shots = df[(df['Round ID'] == rid) & (df['Hole'] == hole)].copy()
-            if hole_shots.empty:
+            rows = hole_rows.get(row['Hole Key'])
+            if rows is None:
                 continue
+            hole_shots = df.iloc[rows]
 
-            sg_numeric = pd.to_numeric(hole_shots['Strokes Gained'], errors='coerce')
-            end_dist = pd.to_numeric(hole_shots['Ending Distance'], errors='coerce')
+            sg_numeric = hole_shots['Strokes Gained']
+            end_dist = hole_shots['Ending Distance']
 
             if stat_name == '3 Putts':
-                putts = hole_shots[hole_shots['Shot Type'] == 'Putt'].copy()
-                putts_sg = pd.to_numeric(putts['Strokes Gained'], errors='coerce')
-                putts_end = pd.to_numeric(putts['Ending Distance'], errors='coerce')
+                putts = hole_shots[hole_shots['Shot Type'] == 'Putt']
+                putts_sg = putts['Strokes Gained']
+                putts_end = putts['Ending Distance']
                 if len(putts) >= 2:
                     first_end = putts_end.iloc[0]
                     if pd.notna(first_end) and first_end < 6:
@@ -302,10 +363,7 @@ def build_tiger5_root_cause(df, tiger5_results, hole_summary):
                 worst_row = hole_shots.loc[worst_idx]
                 raw_type = worst_row['Shot Type']
                 if raw_type == 'Putt':
-                    start_dist = pd.to_numeric(
-                        worst_row.get('Starting Distance', 0),
-                        errors='coerce'
-                    )
+                    start_dist = worst_row.get('Starting Distance', 0)
                     if pd.notna(start_dist) and start_dist < 6:
                         mapped = 'Short Putts'
                     else:
@@ -331,9 +389,7 @@ def build_tiger5_root_cause(df, tiger5_results, hole_summary):
                 if len(putts) >= 3:
                     cause = 'Three Putt'
                     # Determine lag vs short putt root cause
-                    putts_end = pd.to_numeric(
-                        putts['Ending Distance'], errors='coerce'
-                    )
+                    putts_end = putts['Ending Distance']
                     first_end = putts_end.iloc[0] if len(putts) >= 2 else None
                     if pd.notna(first_end) and first_end < 6:
                         putt_cat = 'Short Putts'
@@ -349,16 +405,11 @@ def build_tiger5_root_cause(df, tiger5_results, hole_summary):
                         )
                     ]
                     if not relevant.empty:
-                        rel_sg = pd.to_numeric(
-                            relevant['Strokes Gained'], errors='coerce'
-                        )
+                        rel_sg = relevant['Strokes Gained']
                         worst_idx = rel_sg.idxmin()
                         raw_type = relevant.loc[worst_idx, 'Shot Type']
                         if raw_type == 'Putt':
-                            start_dist = pd.to_numeric(
-                                relevant.loc[worst_idx, 'Starting Distance'],
-                                errors='coerce'
-                            )
+                            start_dist = relevant.loc[worst_idx, 'Starting Distance']
                             if pd.notna(start_dist) and start_dist < 6:
                                 mapped = 'Short Putts'
                             else:
@@ -0,0 +1,8 @@
+# ============================================================
+# GOLF ANALYTICS — HEADLESS ENTRY POINT
+# ============================================================
+# The engine pipeline (pipeline.py), report cache (cache.py), result
+# writers (output.py) and CLI (cli.py), usable without Streamlit:
+#
+#     python -m golf_analytics report --players "Player 0" --format parquet
+# ============================================================
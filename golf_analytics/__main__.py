@@ -0,0 +1,5 @@
+import sys
+
+from golf_analytics.cli import main
+
+sys.exit(main())
@@ -0,0 +1,290 @@
+import html
+import importlib
+import logging
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+
+from data.snapshot import read_snapshot, write_snapshot, SNAPSHOT_DIR
+from golf_analytics.output import write_report
+from golf_analytics.pipeline import select_shots, build_engine_results, build_report
+
+# ============================================================
+# BATCH REPORTS — ONE STATIC HTML REPORT PER PLAYER (× TOURNAMENT)
+# ============================================================
+# Fans the engine pipeline out over every player and every (player,
+# tournament) pair in the data on a process pool. Workers open the
+# warm-start snapshot, whose Feather files are memory-mapped, instead
+# of each receiving a pickled copy of the shot table. Every report is
+# written as <slug>.html (the dashboard's Plotly figures and headline
+# numbers, tab by tab) and <slug>/report.json (all results).
+#
+# Figures are the dashboard's own: each tab function runs with
+# Streamlit in bare mode (no server; widgets return their defaults)
+# while st.plotly_chart and section_header are intercepted.
+# ============================================================
+
+# (title, tabs module, function, args from (filtered_df, engine results))
+TABS = [
+    ("Tiger 5", "tabs.tiger5", "tiger5_tab",
+     lambda df, r: (df, r["hole_summary"], r["tiger5"], r["total_tiger5_fails"], r["num_rounds"])),
+    ("Driving", "tabs.driving", "driving_tab",
+     lambda df, r: (r["driving"], r["num_rounds"], r["hole_summary"])),
+    ("Approach", "tabs.approach", "approach_tab",
+     lambda df, r: (r["approach"], r["num_rounds"])),
+    ("Short Game", "tabs.short_game", "short_game_tab",
+     lambda df, r: (r["short_game"], r["num_rounds"])),
+    ("Putting", "tabs.putting", "putting_tab",
+     lambda df, r: (r["putting"], r["num_rounds"])),
+    ("Strokes Gained", "tabs.strokes_gained", "strokes_gained_tab",
+     lambda df, r: (df, r["hole_summary"], r["num_rounds"], r["driving"], r["approach"],
+                    r["short_game"], r["putting"], r["tiger5"], r["shots"], r["rollup"])),
+    ("Scoring Performance", "tabs.scoring_performance", "scoring_perf_tab",
+     lambda df, r: (df, r["hole_summary"], r["scoring_perf"])),
+]
+
+# Headline numbers shown per tab: (title, results key)
+HEADLINES = [
+    ("Tiger 5", "tiger5"), ("Driving", "driving"), ("Approach", "approach"),
+    ("Short Game", "short_game"), ("Putting", "putting"),
+    ("Scoring Performance", "scoring_perf"),
+]
+
+# Set in each worker by _init_worker
+_worker = {}
+
+
+def slugify(*parts):
+    text = '-'.join(str(p) for p in parts if p)
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-') or 'report'
+
+
+def report_jobs(df, by='both'):
+    """
+    (player, tournament) pairs to report on, tournament None for a
+    player's whole season. `by`: 'player', 'player-tournament' or 'both'.
+    """
+    jobs = []
+    if by in ('player', 'both'):
+        jobs += [(p, None) for p in sorted(df['Player'].unique())]
+    if by in ('player-tournament', 'both'):
+        pairs = df[['Player', 'Tournament']].drop_duplicates()
+        jobs += sorted((p, t) for p, t in pairs.itertuples(index=False))
+    return jobs
+
+
+# ============================================================
+# FIGURES — THE TABS' PLOTLY CHARTS WITHOUT A SERVER
+# ============================================================
+
+@contextmanager
+def _capturing(figures, modules):
+    """Collect st.plotly_chart figures under the current section_header."""
+    import streamlit as st
+    section = [None]
+
+    def plotly_chart(fig, *args, **kwargs):
+        figures.append((section[0], fig))
+
+    def section_header(title):
+        section[0] = title
+
+    saved = [(st, 'plotly_chart', st.plotly_chart)]
+    saved += [(m, 'section_header', m.section_header) for m in modules
+              if hasattr(m, 'section_header')]
+    st.plotly_chart = plotly_chart
+    for module, name, _ in saved[1:]:
+        setattr(module, name, section_header)
+    try:
+        yield
+    finally:
+        for module, name, original in saved:
+            setattr(module, name, original)
+
+
+def capture_figures(filtered_df, results):
+    """[(tab, section, plotly Figure)] the dashboard draws for these results."""
+    captured = []
+    for title, module_name, fn_name, args in TABS:
+        module = importlib.import_module(module_name)
+        figures = []
+        with _capturing(figures, [module]):
+            getattr(module, fn_name)(*args(filtered_df, results))
+        captured += [(title, section, fig) for section, fig in figures]
+    return captured
+
+
+# ============================================================
+# HTML
+# ============================================================
+
+_CSS = """
+body{font-family:Inter,Helvetica,Arial,sans-serif;background:#F4F3F1;color:#252220;margin:0 auto;max-width:1200px;padding:2rem}
+h1{font-size:1.8rem;margin-bottom:.25rem}h2{border-bottom:2px solid #B8973A;padding-bottom:.4rem;margin-top:2.5rem}
+h3{font-size:1rem;color:#5E6460;margin:1.5rem 0 .5rem}.meta{color:#8F9490}
+table{border-collapse:collapse;background:#fff;margin:.5rem 0}td,th{border:1px solid #DCDAD6;padding:.3rem .7rem;text-align:left}
+.fig{background:#fff;border:1px solid #DCDAD6;border-radius:8px;margin:.75rem 0;padding:.5rem}
+"""
+
+
+def _headline_table(results):
+    """Top-level scalar metrics of a results dict as an HTML table."""
+    rows = []
+    for key, value in results.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        shown = f"{value:,.2f}" if isinstance(value, float) else f"{value:,}"
+        rows.append(f"<tr><th>{html.escape(key.replace('_', ' '))}</th><td>{shown}</td></tr>")
+    return f"<table>{''.join(rows)}</table>" if rows else ""
+
+
+def render_html(title, meta, results, figures):
+    """A standalone report page; Plotly is loaded from plotly.min.js beside it."""
+    parts = [
+        "<!DOCTYPE html><html><head><meta charset='utf-8'>",
+        f"<title>{html.escape(title)}</title><style>{_CSS}</style>",
+        "<script src='plotly.min.js'></script></head><body>",
+        f"<h1>{html.escape(title)}</h1>",
+        f"<p class='meta'>{html.escape(meta)}</p>",
+    ]
+    headlines = dict(HEADLINES)
+    for tab, *_ in TABS:
+        parts.append(f"<h2>{html.escape(tab)}</h2>")
+        if tab in headlines and isinstance(results.get(headlines[tab]), dict):
+            parts.append(_headline_table(results[headlines[tab]]))
+        last = None
+        for fig_tab, section, fig in figures:
+            if fig_tab != tab:
+                continue
+            if section and section != last:
+                parts.append(f"<h3>{html.escape(section)}</h3>")
+                last = section
+            parts.append("<div class='fig'>"
+                         + fig.to_html(full_html=False, include_plotlyjs=False)
+                         + "</div>")
+    parts.append("</body></html>")
+    return "\n".join(parts)
+
+
+# ============================================================
+# WORKERS
+# ============================================================
+
+def _init_worker(snapshot_dir, benchmark, out_dir):
+    from data.refresh import DatasetVersion
+    from streamlit import config
+    from streamlit.logger import set_log_level
+    # Bare-mode Streamlit warns on every call; tabs are rendered headless.
+    # Parsing the config re-applies logger.level to every Streamlit
+    # logger, so parse it first, then lower the level
+    config.get_config_options()
+    set_log_level(logging.ERROR)
+    dataset = DatasetVersion.from_snapshot(read_snapshot(snapshot_dir))
+    _worker.update(
+        df=dataset.df(benchmark),
+        cube=dataset.round_cube(benchmark),
+        partition=dataset.partition(benchmark),
+        version=dataset.version,
+        benchmark=benchmark,
+        out_dir=out_dir,
+    )
+
+
+def _run_job(job):
+    """Build, render and write one report; returns its stats."""
+    start = time.perf_counter()
+    player, tournament = job
+    view = select_shots(
+        _worker["df"], players=[player], tournaments=[tournament] if tournament else None
+    )
+    results = build_engine_results(view, _worker["cube"], partition=_worker["partition"])
+    filtered = results.df
+    figures = capture_figures(filtered, results)
+
+    slug = slugify(player, tournament)
+    title = f"{player} — {tournament}" if tournament else f"{player} — all tournaments"
+    meta = (f"{results['num_rounds']} rounds · {len(filtered):,} shots · "
+            f"{_worker['benchmark']} benchmark · data {_worker['version']}")
+    out_dir = _worker["out_dir"]
+    with open(os.path.join(out_dir, f"{slug}.html"), "w") as fh:
+        fh.write(render_html(title, meta, results, figures))
+    write_report(build_report(view, results=results), os.path.join(out_dir, slug))
+    return {
+        "player": player,
+        "tournament": tournament,
+        "file": f"{slug}.html",
+        "title": title,
+        "shots": len(filtered),
+        "figures": len(figures),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def _write_index(out_dir, done, meta):
+    links = "".join(
+        f"<tr><td><a href='{html.escape(r['file'])}'>{html.escape(r['title'])}</a></td>"
+        f"<td>{r['shots']:,}</td><td>{r['figures']}</td></tr>"
+        for r in sorted(done, key=lambda r: (r['player'], r['tournament'] or ''))
+    )
+    with open(os.path.join(out_dir, "index.html"), "w") as fh:
+        fh.write(
+            f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>Reports</title>"
+            f"<style>{_CSS}</style></head><body><h1>Reports</h1>"
+            f"<p class='meta'>{html.escape(meta)}</p>"
+            f"<table><tr><th>Report</th><th>Shots</th><th>Figures</th></tr>{links}</table>"
+            f"</body></html>"
+        )
+
+
+def run_batch(out_dir, benchmark, by='both', workers=None, dataset=None, progress=None):
+    """
+    Write every report into out_dir on a pool of `workers` processes
+    (default: CPU count). `dataset` is a DatasetVersion to report on;
+    without one the warm-start snapshot is used as is. Returns a summary
+    with per-report stats and reports/minute.
+    """
+    from plotly.offline import get_plotlyjs
+
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, "plotly.min.js"), "w") as fh:
+        fh.write(get_plotlyjs())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot_dir = SNAPSHOT_DIR
+        if dataset is not None or read_snapshot(snapshot_dir) is None:
+            if dataset is None:
+                raise RuntimeError("no warm-start snapshot; pass a dataset")
+            # Workers map this version from a private snapshot
+            snapshot_dir = tmp
+            df = dataset.df(benchmark)
+            write_snapshot(dataset.shots, {benchmark: df['Strokes Gained'].to_numpy()},
+                           {benchmark: dataset.round_cube(benchmark)}, dataset.source, tmp)
+        df = read_snapshot(snapshot_dir).shots
+        jobs = report_jobs(df, by)
+
+        start = time.perf_counter()
+        done = []
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker,
+            initargs=(snapshot_dir, benchmark, out_dir),
+        ) as pool:
+            futures = [pool.submit(_run_job, job) for job in jobs]
+            for future in as_completed(futures):
+                done.append(future.result())
+                if progress:
+                    progress(done[-1], len(done), len(jobs))
+        elapsed = time.perf_counter() - start
+
+    summary = {
+        "reports": len(done),
+        "workers": workers or os.cpu_count(),
+        "seconds": elapsed,
+        "reports_per_minute": len(done) / elapsed * 60 if elapsed else None,
+        "results": done,
+    }
+    _write_index(out_dir, done, f"{len(done)} reports · {benchmark} benchmark · "
+                                f"{summary['reports_per_minute']:.1f} reports/minute")
+    return summary
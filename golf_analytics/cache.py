@@ -0,0 +1,89 @@
+import os
+import pickle
+
+from engines.section_cache import SectionCache, fingerprint
+
+# ============================================================
+# REPORT CACHE — PLUGGABLE STORES FOR HEADLESS RESULTS
+# ============================================================
+# A report is keyed by the dataset's content digest, the benchmark and
+# the filters, so a repeated request (same data, same selection) is
+# read back instead of recomputed. Stores share SectionCache's
+# interface: get(key) -> (hit, value) and put(key, value).
+#
+#     none            no caching
+#     memory          in-process LRU (SectionCache)
+#     pickle[:DIR]    one pickle file per key (default DIR: REPORT_CACHE_DIR)
+# ============================================================
+
+REPORT_CACHE_DIR = os.environ.get(
+    'GOLF_REPORT_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache', 'reports'),
+)
+
+
+def cache_key(*parts):
+    """Hex key of any mix of strings, numbers, lists and dicts."""
+    return fingerprint(list(parts))
+
+
+class NullCache:
+    """Never hits; put() discards."""
+
+    def get(self, key):
+        return False, None
+
+    def put(self, key, value):
+        pass
+
+
+class PickleCache:
+    """One pickle file per key in `directory`, written atomically."""
+
+    suffix = '.pkl'
+
+    def __init__(self, directory=REPORT_CACHE_DIR):
+        self.directory = directory
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + self.suffix)
+
+    def _dump(self, value, fh):
+        pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _load(self, fh):
+        return pickle.load(fh)
+
+    def get(self, key):
+        try:
+            with open(self._path(key), 'rb') as fh:
+                return True, self._load(fh)
+        except Exception:
+            # Missing, truncated or unreadable, or pickled by an older
+            # tree (a moved or renamed class): recompute it
+            return False, None
+
+    def put(self, key, value):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = self._path(key) + f'.tmp-{os.getpid()}'
+        with open(tmp, 'wb') as fh:
+            self._dump(value, fh)
+        os.replace(tmp, self._path(key))
+
+
+# name -> factory(argument or None)
+CACHE_BACKENDS = {
+    'none': lambda arg: NullCache(),
+    'memory': lambda arg: SectionCache(int(arg) if arg else 64),
+    'pickle': lambda arg: PickleCache(arg or REPORT_CACHE_DIR),
+}
+
+
+def make_cache(spec):
+    """A report cache from 'name' or 'name:argument' (see CACHE_BACKENDS)."""
+    name, _, arg = (spec or 'none').partition(':')
+    if name not in CACHE_BACKENDS:
+        raise ValueError(
+            f"Unknown cache '{name}' (choose from {', '.join(CACHE_BACKENDS)})"
+        )
+    return CACHE_BACKENDS[name](arg or None)
@@ -0,0 +1,169 @@
+import argparse
+import os
+import sys
+import time
+
+from data.load_data import enrich, read_source, DATA_SOURCE
+from data.refresh import DatasetVersion, source_digest
+from data.snapshot import read_snapshot
+from engines.rerun_profile import RerunProfile
+from engines.strokes_gained import BENCHMARK_FILES
+from golf_analytics.cache import make_cache, cache_key
+from golf_analytics.output import write_report, FORMATS
+from golf_analytics.pipeline import select_shots, build_report, DEFAULT_BENCHMARK
+
+# ============================================================
+# HEADLESS CLI — python -m golf_analytics report|batch ...
+# ============================================================
+# report: loads the dataset (the warm-start snapshot when there is
+# one, else the source), applies the same filters as the sidebar, runs
+# every engine through golf_analytics.pipeline and writes the results
+# as JSON or JSON + Parquet. Never imports Streamlit or Plotly.
+# batch: one static HTML report per player and per player x
+# tournament on a process pool (golf_analytics/batch.py).
+# ============================================================
+
+# Bumped when report contents change; older cached reports are ignored
+REPORT_CACHE_VERSION = 2
+
+DEFAULT_CACHE = os.environ.get('GOLF_REPORT_CACHE', 'pickle')
+
+
+def load_dataset(source=None):
+    """
+    DatasetVersion to report on: the warm-start snapshot when no source
+    is given and one exists, else `source` (default DATA_SOURCE) read
+    and enriched.
+    """
+    if source is None:
+        snapshot = read_snapshot()
+        if snapshot is not None:
+            return DatasetVersion.from_snapshot(snapshot)
+    shots = enrich(read_source(source))
+    return DatasetVersion(shots, source_digest(shots))
+
+
+def _match(requested, available, what):
+    """Requested names mapped case-insensitively onto the dataset's values."""
+    if not requested:
+        return None
+    lookup = {str(v).lower(): v for v in available}
+    missing = [r for r in requested if r.lower() not in lookup]
+    if missing:
+        raise SystemExit(
+            f"Unknown {what}: {', '.join(missing)}. "
+            f"Available: {', '.join(sorted(map(str, lookup.values())))}"
+        )
+    return [lookup[r.lower()] for r in requested]
+
+
+def report_command(args):
+    start = time.perf_counter()
+    dataset = load_dataset(args.source)
+    df = dataset.df(args.benchmark)
+
+    players = _match(args.players, df['Player'].unique(), 'players')
+    courses = _match(args.courses, df['Course'].unique(), 'courses')
+    tournaments = _match(args.tournaments, df['Tournament'].unique(), 'tournaments')
+    date_range = (args.start, args.end) if args.start or args.end else None
+
+    view = select_shots(df, players, courses, tournaments, date_range)
+    if len(view) == 0:
+        raise SystemExit("No shots match these filters.")
+
+    cache = make_cache(args.cache)
+    key = cache_key('report', REPORT_CACHE_VERSION, dataset.source, args.benchmark,
+                    players, courses, tournaments, args.start, args.end)
+    hit, report = cache.get(key)
+    profile = RerunProfile(args.timings and not hit, memory=False)
+    if not hit:
+        report = build_report(
+            view, dataset.round_cube(args.benchmark), profile,
+            partition=dataset.partition(args.benchmark),
+        )
+        cache.put(key, report)
+
+    meta = {
+        "benchmark": args.benchmark,
+        "players": players,
+        "courses": courses,
+        "tournaments": tournaments,
+        "start": args.start,
+        "end": args.end,
+        "version": dataset.version,
+        "source": dataset.source,
+        "generated": time.strftime('%Y-%m-%dT%H:%M:%S'),
+        "cached": hit,
+    }
+    if profile.enabled:
+        meta["timings"] = profile.frame()
+    paths = write_report({"meta": meta, **report}, args.out, args.format)
+
+    print(f"{len(paths)} file(s) in {args.out} · {report['shots']:,} shots, "
+          f"{report['num_rounds']} rounds · {'cached' if hit else 'computed'} in "
+          f"{time.perf_counter() - start:.2f}s", file=sys.stderr)
+    return 0
+
+
+def batch_command(args):
+    # Imported here: batch renders the tabs' figures (Streamlit, Plotly)
+    from golf_analytics.batch import run_batch
+
+    dataset = None
+    if args.source is not None or read_snapshot() is None:
+        dataset = load_dataset(args.source)
+
+    def progress(result, done, total):
+        print(f"[{done}/{total}] {result['title']} · {result['shots']:,} shots · "
+              f"{result['figures']} figures · {result['seconds']:.1f}s", file=sys.stderr)
+
+    summary = run_batch(args.out, args.benchmark, args.by, args.workers, dataset, progress)
+    print(f"{summary['reports']} reports in {summary['seconds']:.1f}s with "
+          f"{summary['workers']} workers · {summary['reports_per_minute']:.1f} reports/minute · "
+          f"{os.path.join(args.out, 'index.html')}", file=sys.stderr)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m golf_analytics',
+        description='Golf analytics without the dashboard.',
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    report = commands.add_parser(
+        'report', help='run every engine for one filter state and write the results'
+    )
+    report.add_argument('--benchmark', default=DEFAULT_BENCHMARK, choices=list(BENCHMARK_FILES))
+    report.add_argument('--players', nargs='+', metavar='NAME', help='default: all')
+    report.add_argument('--courses', nargs='+', metavar='NAME', help='default: all')
+    report.add_argument('--tournaments', nargs='+', metavar='NAME', help='default: all')
+    report.add_argument('--start', metavar='YYYY-MM-DD', help='first date (inclusive)')
+    report.add_argument('--end', metavar='YYYY-MM-DD', help='last date (inclusive)')
+    report.add_argument('--source', default=None,
+                        help=f'CSV path/URL or synthetic:<shots> (default: snapshot, else {DATA_SOURCE[:40]}...)')
+    report.add_argument('--out', default='report', help='output directory (default: ./report)')
+    report.add_argument('--format', default='json', choices=FORMATS,
+                        help='json: tables inline; parquet: tables as Parquet files')
+    report.add_argument('--cache', default=DEFAULT_CACHE,
+                        help='none, memory or pickle[:DIR] (default: %(default)s)')
+    report.add_argument('--timings', action='store_true',
+                        help='include per-engine timings in meta')
+    report.set_defaults(run=report_command)
+
+    batch = commands.add_parser(
+        'batch', help='write a static HTML report per player and per player x tournament'
+    )
+    batch.add_argument('--by', default='both', choices=['player', 'player-tournament', 'both'])
+    batch.add_argument('--benchmark', default=DEFAULT_BENCHMARK, choices=list(BENCHMARK_FILES))
+    batch.add_argument('--workers', type=int, default=None, help='processes (default: CPU count)')
+    batch.add_argument('--source', default=None,
+                       help='CSV path/URL or synthetic:<shots> (default: snapshot, else the sheet)')
+    batch.add_argument('--out', default='reports', help='output directory (default: ./reports)')
+    batch.set_defaults(run=batch_command)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.run(args)
@@ -0,0 +1,119 @@
+import datetime
+import json
+import math
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+# ============================================================
+# REPORT OUTPUT — JSON, WITH TABLES INLINE OR AS PARQUET
+# ============================================================
+# A report is a nested dict of DataFrames, dicts, lists and scalars.
+# Both formats write <out>/report.json; DataFrames are either inlined
+# as lists of records ('json') or written to <out>/tables/<path>.parquet
+# and referenced as {"$table": file, "rows": n} ('parquet').
+# ============================================================
+
+FORMATS = ('json', 'parquet')
+
+
+def _scalar(obj):
+    if isinstance(obj, (np.bool_, bool)):
+        return bool(obj)
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, (np.floating, float)):
+        return None if math.isnan(obj) or math.isinf(obj) else float(obj)
+    if isinstance(obj, (pd.Timestamp, datetime.date, datetime.datetime, np.datetime64)):
+        return None if pd.isna(obj) else pd.Timestamp(obj).isoformat()
+    if isinstance(obj, pd.Timedelta):
+        return obj.total_seconds()
+    if obj is None or obj is pd.NA or obj is pd.NaT:
+        return None
+    return obj
+
+
+def _records(df):
+    """A DataFrame as JSON-ready records (index kept unless a RangeIndex)."""
+    return [
+        {k: _to_json(v) for k, v in row.items()}
+        for row in _table(df).to_dict(orient='records')
+    ]
+
+
+def _table(df):
+    """A DataFrame ready for Parquet: string column names, plain index."""
+    if not isinstance(df.index, pd.RangeIndex):
+        df = df.reset_index()
+    else:
+        df = df.copy()
+    df.columns = [str(c) for c in df.columns]
+    return df
+
+
+def _to_json(obj, tables=None, path=()):
+    """
+    obj converted to JSON types. With `tables` (a dict), DataFrames are
+    collected there under their dotted path instead of being inlined.
+    """
+    if isinstance(obj, pd.DataFrame):
+        if tables is None:
+            return _records(obj)
+        name = re.sub(r'[^\w.-]+', '_', '.'.join(path)) or 'table'
+        tables[name] = obj
+        return {"$table": f"tables/{name}.parquet", "rows": len(obj)}
+    if isinstance(obj, pd.Series):
+        return _to_json(obj.to_dict(), tables, path)
+    if isinstance(obj, dict):
+        return {str(_scalar(k)): _to_json(v, tables, path + (str(k),)) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set)):
+        return [_to_json(v, tables, path + (str(i),)) for i, v in enumerate(obj)]
+    if isinstance(obj, np.ndarray):
+        return _to_json(obj.tolist(), tables, path)
+    return _scalar(obj)
+
+
+def write_report(report, out_dir, fmt='json'):
+    """Write `report` to out_dir in `fmt`; returns the paths written."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}' (choose from {', '.join(FORMATS)})")
+    os.makedirs(out_dir, exist_ok=True)
+    written = []
+
+    tables = {} if fmt == 'parquet' else None
+    doc = _to_json(report, tables)
+    if tables:
+        table_dir = os.path.join(out_dir, 'tables')
+        os.makedirs(table_dir, exist_ok=True)
+        for name, df in tables.items():
+            path = os.path.join(table_dir, f"{name}.parquet")
+            try:
+                _table(df).to_parquet(path, index=False)
+            except (TypeError, ValueError, NotImplementedError, ImportError):
+                # Mixed or nested object columns: keep this table inline
+                _replace_table(doc, name, _records(df))
+                continue
+            written.append(path)
+
+    path = os.path.join(out_dir, 'report.json')
+    with open(path, 'w') as fh:
+        json.dump(doc, fh, indent=1, default=str)
+    written.append(path)
+    return written
+
+
+def _replace_table(doc, name, records):
+    """Swap the {"$table": ...} reference of table `name` for records."""
+    ref = f"tables/{name}.parquet"
+    stack = [doc]
+    while stack:
+        node = stack.pop()
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        for k, v in items:
+            if isinstance(v, dict) and v.get("$table") == ref:
+                node[k] = records
+                return
+            if isinstance(v, (dict, list)):
+                stack.append(v)
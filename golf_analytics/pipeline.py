@@ -0,0 +1,339 @@
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+from engines.rerun_profile import RerunProfile
+from engines.shot_view import ShotView, shot_view
+
+# ============================================================
+# ENGINE PIPELINE — FILTER STATE TO RESULTS, WITHOUT STREAMLIT
+# ============================================================
+# The engine orchestration shared by app.py and the headless report:
+# select the filtered rows of the shared SG shot table (a ShotView:
+# row positions, no copy), build the per-filter-state inputs (hole
+# summary, shot partition, round rollup) once, then run the engines
+# in dependency order. Nothing here imports Streamlit or Plotly.
+#
+# Engine results are lazy: each engine (and its module) is loaded and
+# run when its result is first read, so a dashboard rerun builds only
+# what the open tab shows.
+# ============================================================
+
+# The dashboard's default benchmark
+DEFAULT_BENCHMARK = 'Elite College (+3)'
+
+# RerunProfile used when the caller passes none (step/call are no-ops)
+_NO_PROFILE = RerunProfile(False)
+
+
+def filter_rows(df, players=None, courses=None, tournaments=None, date_range=None):
+    """
+    Sorted positions of the rows of `df` matching the sidebar filters. A
+    filter left as None (or empty) keeps every value; `date_range` is an
+    inclusive (start, end).
+    """
+    mask = np.ones(len(df), dtype=bool)
+    if players:
+        mask &= df['Player'].isin(players).to_numpy()
+    if courses:
+        mask &= df['Course'].isin(courses).to_numpy()
+    if tournaments:
+        mask &= df['Tournament'].isin(tournaments).to_numpy()
+    if date_range:
+        start, end = date_range
+        if start is not None:
+            mask &= (df['_date'] >= pd.Timestamp(start)).to_numpy()
+        if end is not None:
+            mask &= (df['_date'] <= pd.Timestamp(end)).to_numpy()
+    return np.flatnonzero(mask)
+
+
+def select_shots(df, players=None, courses=None, tournaments=None, date_range=None):
+    """ShotView of the rows of the shared table `df` matching the filters."""
+    return ShotView(df, filter_rows(df, players, courses, tournaments, date_range))
+
+
+def filter_shots(df, players=None, courses=None, tournaments=None, date_range=None):
+    """Rows of `df` matching the filters, as a DataFrame (see select_shots)."""
+    return select_shots(df, players, courses, tournaments, date_range).frame()
+
+
+# ============================================================
+# ENGINE RESULTS — BUILT ON FIRST ACCESS
+# ============================================================
+# Each builder runs one engine (importing it then) and returns the
+# result keys it produces; its inputs are read from the results, which
+# builds them in turn.
+
+def _hole_summary(r):
+    from engines.hole_summary import build_hole_summary, HOLE_SUMMARY_COLUMNS
+    return {"hole_summary": r.call(
+        "build_hole_summary", build_hole_summary, columns=HOLE_SUMMARY_COLUMNS,
+    )}
+
+
+def _shot_partition(r):
+    from engines.partition import build_shot_partition
+    # Selected from the shared table's partition when there is one,
+    # else one sort per filter state; engines slice it
+    return {"shots": r.call(
+        "build_shot_partition", build_shot_partition, r.view, r.partition,
+    )}
+
+
+def _rollup(r):
+    # Filters select whole rounds; additive metrics are summed from the
+    # per-round cube rows instead of scanning shots
+    if r.round_cube is None:
+        return {"rollup": None}
+    return {"rollup": r.call(
+        "round_cube.select", r.round_cube.select,
+        r.view.column('Round Key').unique(), rows_in=r["num_rounds"],
+    )}
+
+
+def _driving(r):
+    from engines.driving import build_driving_results, DRIVING_COLUMNS
+    return {"driving": r.call(
+        "build_driving_results", build_driving_results,
+        r["num_rounds"], r["hole_summary"], r["shots"], columns=DRIVING_COLUMNS,
+    )}
+
+
+def _approach(r):
+    from engines.approach import build_approach_results, APPROACH_COLUMNS
+    return {"approach": r.call(
+        "build_approach_results", build_approach_results,
+        r["num_rounds"], r["shots"], columns=APPROACH_COLUMNS,
+    )}
+
+
+def _short_game(r):
+    from engines.short_game import build_short_game_results, SHORT_GAME_COLUMNS
+    return {"short_game": r.call(
+        "build_short_game_results", build_short_game_results,
+        r["num_rounds"], r["shots"], columns=SHORT_GAME_COLUMNS,
+    )}
+
+
+def _putting(r):
+    from engines.putting import build_putting_results, PUTTING_COLUMNS
+    return {"putting": r.call(
+        "build_putting_results", build_putting_results,
+        r["num_rounds"], r["shots"], columns=PUTTING_COLUMNS,
+    )}
+
+
+def _tiger5(r):
+    from engines.tiger5 import build_tiger5_results, TIGER5_COLUMNS
+    tiger5, total_fails, grit_score = r.call(
+        "build_tiger5_results", build_tiger5_results,
+        r["hole_summary"], r["shots"], r["rollup"], columns=TIGER5_COLUMNS,
+    )
+    return {"tiger5": tiger5, "total_tiger5_fails": total_fails, "grit_score": grit_score}
+
+
+def _scoring_perf(r):
+    from engines.scoring_performance import (
+        build_scoring_performance, SCORING_PERFORMANCE_COLUMNS,
+    )
+    return {"scoring_perf": r.call(
+        "build_scoring_performance", build_scoring_performance,
+        r["hole_summary"], columns=SCORING_PERFORMANCE_COLUMNS,
+    )}
+
+
+def _coachs_corner(r):
+    from engines.coachs_corner import build_coachs_corner, COACHS_CORNER_COLUMNS
+    return {"coachs_corner": r.call(
+        "build_coachs_corner", build_coachs_corner,
+        r["hole_summary"], r["driving"], r["approach"], r["short_game"],
+        r["putting"], r["tiger5"], r["scoring_perf"], r["grit_score"],
+        r["num_rounds"], r["shots"], r["rollup"], selection=r.view.key,
+        columns=COACHS_CORNER_COLUMNS,
+    )}
+
+
+def _on_columns(engine, view, columns):
+    """engine, with the view projected onto `columns` as first argument at call time."""
+    return lambda *args, **kwargs: engine(view.frame(columns), *args, **kwargs)
+
+
+# result key -> builder, in dependency order
+_BUILDERS = {
+    "num_rounds": lambda r: {"num_rounds": r.view.column('Round ID').nunique()},
+    "hole_summary": _hole_summary,
+    "shots": _shot_partition,
+    "rollup": _rollup,
+    "driving": _driving,
+    "approach": _approach,
+    "short_game": _short_game,
+    "putting": _putting,
+    "tiger5": _tiger5,
+    "total_tiger5_fails": _tiger5,
+    "grit_score": _tiger5,
+    "scoring_perf": _scoring_perf,
+    "coachs_corner": _coachs_corner,
+}
+
+
+class EngineResults(Mapping):
+    """
+    The engine results of one filter state, read like a dict. A result
+    is built on first access (with whatever it depends on) and kept;
+    iterating or dict(...) builds them all.
+    """
+
+    def __init__(self, filtered, round_cube=None, profile=None, partition=None):
+        self.view = shot_view(filtered)
+        self.round_cube = round_cube
+        self.partition = partition
+        self.profile = profile or _NO_PROFILE
+        self._values = {}
+
+    @property
+    def df(self):
+        """The filtered shots as a DataFrame (taken once, on first use)."""
+        return self.view.frame()
+
+    def frame(self, columns):
+        """The filtered shots projected onto `columns` (see ShotView.frame)."""
+        return self.view.frame(columns)
+
+    def call(self, name, fn, *args, columns=None, rows_in=None, **kwargs):
+        """
+        Run one engine under the profile (rows_in: filtered shots). With
+        `columns` (the engine's declared inputs), its first argument is
+        the filtered shots projected onto them, taken inside its step.
+        """
+        if columns is not None:
+            fn = _on_columns(fn, self.view, columns)
+        return self.profile.call(
+            name, fn, *args, rows_in=len(self.view) if rows_in is None else rows_in, **kwargs
+        )
+
+    def __getitem__(self, key):
+        if key not in self._values:
+            if key not in _BUILDERS:
+                raise KeyError(key)
+            self._values.update(_BUILDERS[key](self))
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(_BUILDERS)
+
+    def __len__(self):
+        return len(_BUILDERS)
+
+    def built(self):
+        """Keys built so far."""
+        return [key for key in _BUILDERS if key in self._values]
+
+
+def build_engine_results(filtered, round_cube=None, profile=None, partition=None):
+    """
+    The dashboard engines on one filter state, each run on first access.
+
+    Args:
+        filtered: ShotView of the shared SG shot table (or a filtered
+            DataFrame)
+        round_cube: RoundCube of the unfiltered table (engines then read
+            additive totals from its rollup of the selected rounds)
+        profile: RerunProfile timing each step (optional)
+        partition: ShotPartition of the shared table the view selects
+            from (the view's partition is then selected, not sorted)
+
+    Returns:
+        EngineResults mapping num_rounds, hole_summary, shots
+        (ShotPartition), rollup and the results of driving, approach,
+        short_game, putting, tiger5 (plus total_tiger5_fails,
+        grit_score), scoring_perf and coachs_corner
+    """
+    return EngineResults(filtered, round_cube, profile, partition)
+
+
+def build_report(filtered, round_cube=None, profile=None, results=None, partition=None):
+    """
+    Every result the dashboard shows for one filter state: the engine
+    results plus what the tabs build themselves (overview, SG
+    separators and trend, scoring by par, hole outcomes, SG by hole,
+    Tiger 5 root cause and scoring impact, coaches table).
+
+    `filtered`, `round_cube`, `partition` are as for
+    build_engine_results; pass `results` when it already ran for this
+    filter state. Returns a dict of plain results (DataFrames, dicts,
+    scalars); the shot partition and rollup are left out.
+    """
+    from engines.tiger5 import (
+        build_tiger5_root_cause, build_tiger5_scoring_impact, TIGER5_ROOT_CAUSE_COLUMNS,
+    )
+    from engines.coaches_table import build_coaches_table_results, COACHES_TABLE_COLUMNS
+    from engines.overview import (
+        overview_engine, build_sg_separators, build_sg_trend,
+        build_scoring_by_par, build_hole_outcomes, build_sg_by_hole_pivot,
+        OVERVIEW_COLUMNS, SG_SEPARATOR_COLUMNS, SG_TREND_COLUMNS, SG_BY_HOLE_COLUMNS,
+    )
+
+    profile = profile or _NO_PROFILE
+    view = shot_view(filtered)
+    if results is None:
+        results = build_engine_results(view, round_cube, profile, partition)
+    rows = len(view)
+    hole_summary, shots, rollup = results["hole_summary"], results["shots"], results["rollup"]
+    num_rounds, tiger5 = results["num_rounds"], results["tiger5"]
+
+    overview = profile.call(
+        "overview_engine", _on_columns(overview_engine, view, OVERVIEW_COLUMNS),
+        hole_summary, results["driving"], results["approach"],
+        results["short_game"], results["putting"], tiger5, shots, rollup,
+        rows_in=rows,
+    )
+    separators, best_key, worst_key = profile.call(
+        "build_sg_separators", _on_columns(build_sg_separators, view, SG_SEPARATOR_COLUMNS),
+        num_rounds, shots, rollup=rollup, rows_in=rows,
+    )
+    shot_type_counts, detail_by_type = profile.call(
+        "build_tiger5_root_cause",
+        _on_columns(build_tiger5_root_cause, view, TIGER5_ROOT_CAUSE_COLUMNS),
+        tiger5, hole_summary, rows_in=rows,
+    )
+
+    return {
+        "num_rounds": num_rounds,
+        "shots": rows,
+        "hole_summary": hole_summary,
+        "driving": results["driving"],
+        "approach": results["approach"],
+        "short_game": results["short_game"],
+        "putting": results["putting"],
+        "tiger5": {
+            **tiger5,
+            "total_fails": results["total_tiger5_fails"],
+            "grit_score": results["grit_score"],
+            "root_cause_counts": shot_type_counts,
+            "root_cause_detail": detail_by_type,
+            "scoring_impact": build_tiger5_scoring_impact(
+                tiger5.get("by_round", pd.DataFrame())
+            ),
+        },
+        "scoring_performance": results["scoring_perf"],
+        "coachs_corner": results["coachs_corner"],
+        "coaches_table": profile.call(
+            "build_coaches_table_results",
+            _on_columns(build_coaches_table_results, view, COACHES_TABLE_COLUMNS),
+            hole_summary, rows_in=rows,
+        ),
+        "strokes_gained": {
+            "overview": overview,
+            "separators": pd.DataFrame(
+                separators, columns=["label", "total", "per_round", "key"]
+            ),
+            "best_separator": best_key,
+            "worst_separator": worst_key,
+            "trend": build_sg_trend(view.frame(SG_TREND_COLUMNS), shots),
+            "scoring_by_par": build_scoring_by_par(hole_summary, rollup),
+            "hole_outcomes": build_hole_outcomes(hole_summary, rollup),
+            "by_hole": build_sg_by_hole_pivot(view.frame(SG_BY_HOLE_COLUMNS), hole_summary, shots),
+        },
+    }
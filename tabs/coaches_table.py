@@ -2,7 +2,10 @@ import streamlit as st
 import pandas as pd
 from ui.components import section_header
 from ui.theme import POSITIVE_BG, NEGATIVE_BG, WHITE
-from engines.coaches_table import build_coaches_table_results
+from engines.coaches_table import build_coaches_table_results, COACHES_TABLE_COLUMNS
+
+# Shot table columns this tab's engine reads (app.py passes only these)
+SHOT_COLUMNS = COACHES_TABLE_COLUMNS
 
 # ============================================================
 # COACHES TABLE TAB
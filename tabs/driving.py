@@ -20,6 +20,8 @@ from ui.components import (
 )
 from ui.formatters import format_sg, format_pct, format_date
 
+from engines.helpers import penalty_labels
+
 
 def driving_tab(drive, num_rounds, hole_summary):
 
@@ -395,6 +397,7 @@ def driving_tab(drive, num_rounds, hole_summary):
         detail['Distance'] = detail['Distance'].round(0).astype(int)
         detail['End Dist'] = detail['End Dist'].round(0).astype(int)
         detail['SG'] = detail['SG'].round(2)
+        detail['Penalty'] = penalty_labels(detail['Penalty'])
 
         st.dataframe(
             detail.sort_values(['Date', 'Hole'], ascending=[False, True]),
@@ -17,6 +17,9 @@ from ui.components import (
 )
 from ui.formatters import format_sg, format_pct, format_date
 
+# The tab reads its engine results only; filtered_df gets no columns
+SHOT_COLUMNS = ()
+
 
 def scoring_perf_tab(filtered_df, hole_summary, scoring_perf_results):
     """
@@ -22,20 +22,29 @@ from ui.formatters import format_sg, format_pct, format_score
 from engines.overview import (
     overview_engine, build_sg_separators, build_sg_trend,
     build_scoring_by_par, build_hole_outcomes,
-    build_sg_by_hole_pivot, build_shot_detail,
+    build_sg_by_hole_pivot, build_sg_by_hole_pivot_by_course,
+    build_shot_detail,
+    OVERVIEW_COLUMNS, SG_SEPARATOR_COLUMNS, SG_TREND_COLUMNS, SG_BY_HOLE_COLUMNS,
+    ROUND_DETAIL_COLUMNS,
 )
 
+# Shot table columns this tab's engines read (app.py passes only these)
+SHOT_COLUMNS = tuple(dict.fromkeys(
+    OVERVIEW_COLUMNS + SG_SEPARATOR_COLUMNS + SG_TREND_COLUMNS
+    + SG_BY_HOLE_COLUMNS + ROUND_DETAIL_COLUMNS
+))
+
 
 def strokes_gained_tab(
     filtered_df, hole_summary, num_rounds,
     driving_results, approach_results, short_game_results,
-    putting_results, tiger5_results,
+    putting_results, tiger5_results, shots=None, rollup=None,
 ):
 
     overview = overview_engine(
         filtered_df, hole_summary, driving_results,
         approach_results, short_game_results, putting_results,
-        tiger5_results,
+        tiger5_results, shots, rollup,
     )
 
     total_sg = overview["total_sg"]
@@ -89,60 +98,36 @@ def strokes_gained_tab(
     # ----------------------------------------------------------------
     section_header("Strokes Gained Separators")
 
-    separators, best_key, worst_key = build_sg_separators(filtered_df, num_rounds)
+    separators, best_key, worst_key = build_sg_separators(filtered_df, num_rounds, shots, rollup=rollup)
 
     if separators:
-        row1 = st.columns(4)
-        for col, (label, val, pr, key) in zip(row1, separators[:4]):
-            border_style = ""
-            if key == best_key:
-                border_style = f"border:2px solid {POSITIVE};"
-            elif key == worst_key:
-                border_style = f"border:2px solid {NEGATIVE};"
-
-            sent_color = sg_color_5(val)
-
-            with col:
-                st.markdown(f'''
-                    <div style="background:{WHITE};border-radius:{CARD_RADIUS};
-                         padding:{CARD_PADDING};text-align:center;
-                         box-shadow:0 1px 4px rgba(0,0,0,0.04);
-                         border:1px solid {BORDER_LIGHT};margin-bottom:1rem;{border_style}">
-                        <div style="font-family:{FONT_DATA};font-size:0.65rem;font-weight:400;
-                             color:{SLATE};text-transform:uppercase;letter-spacing:0.08em;
-                             margin-bottom:0.5rem;">{label}</div>
-                        <div style="font-family:{FONT_HEADING};font-size:2rem;font-weight:700;
-                             color:{sent_color};line-height:1;">{format_sg(val)}</div>
-                        <div style="font-family:{FONT_DATA};font-size:0.65rem;color:{SLATE};
-                             margin-top:0.3rem;">{format_sg(pr)} per round</div>
-                    </div>
-                ''', unsafe_allow_html=True)
-
-        row2 = st.columns(4)
-        for col, (label, val, pr, key) in zip(row2, separators[4:]):
-            border_style = ""
-            if key == best_key:
-                border_style = f"border:2px solid {POSITIVE};"
-            elif key == worst_key:
-                border_style = f"border:2px solid {NEGATIVE};"
-
-            sent_color = sg_color_5(val)
-
-            with col:
-                st.markdown(f'''
-                    <div style="background:{WHITE};border-radius:{CARD_RADIUS};
-                         padding:{CARD_PADDING};text-align:center;
-                         box-shadow:0 1px 4px rgba(0,0,0,0.04);
-                         border:1px solid {BORDER_LIGHT};margin-bottom:1rem;{border_style}">
-                        <div style="font-family:{FONT_DATA};font-size:0.65rem;font-weight:400;
-                             color:{SLATE};text-transform:uppercase;letter-spacing:0.08em;
-                             margin-bottom:0.5rem;">{label}</div>
-                        <div style="font-family:{FONT_HEADING};font-size:2rem;font-weight:700;
-                             color:{sent_color};line-height:1;">{format_sg(val)}</div>
-                        <div style="font-family:{FONT_DATA};font-size:0.65rem;color:{SLATE};
-                             margin-top:0.3rem;">{format_sg(pr)} per round</div>
-                    </div>
-                ''', unsafe_allow_html=True)
+        # Four cards per row, as many rows as the separator catalog needs
+        for start in range(0, len(separators), 4):
+            row = st.columns(4)
+            for col, (label, val, pr, key) in zip(row, separators[start:start + 4]):
+                border_style = ""
+                if key == best_key:
+                    border_style = f"border:2px solid {POSITIVE};"
+                elif key == worst_key:
+                    border_style = f"border:2px solid {NEGATIVE};"
+
+                sent_color = sg_color_5(val)
+
+                with col:
+                    st.markdown(f'''
+                        <div style="background:{WHITE};border-radius:{CARD_RADIUS};
+                             padding:{CARD_PADDING};text-align:center;
+                             box-shadow:0 1px 4px rgba(0,0,0,0.04);
+                             border:1px solid {BORDER_LIGHT};margin-bottom:1rem;{border_style}">
+                            <div style="font-family:{FONT_DATA};font-size:0.65rem;font-weight:400;
+                                 color:{SLATE};text-transform:uppercase;letter-spacing:0.08em;
+                                 margin-bottom:0.5rem;">{label}</div>
+                            <div style="font-family:{FONT_HEADING};font-size:2rem;font-weight:700;
+                                 color:{sent_color};line-height:1;">{format_sg(val)}</div>
+                            <div style="font-family:{FONT_DATA};font-size:0.65rem;color:{SLATE};
+                                 margin-top:0.3rem;">{format_sg(pr)} per round</div>
+                        </div>
+                    ''', unsafe_allow_html=True)
 
         # Add legend
         st.markdown(
@@ -158,7 +143,19 @@ def strokes_gained_tab(
     # ----------------------------------------------------------------
     section_header("Hole-by-Hole Strokes Gained")
 
-    sg_pivot = build_sg_by_hole_pivot(filtered_df, hole_summary)
+    sg_pivot = build_sg_by_hole_pivot(filtered_df, hole_summary, shots)
+
+    # Multi-course selections can switch to one course's hole table
+    if filtered_df['Course'].nunique() > 1:
+        course_pivots = build_sg_by_hole_pivot_by_course(
+            filtered_df, hole_summary, shots
+        )
+        pivot_course = st.selectbox(
+            "Course", ["All Courses"] + list(course_pivots),
+            key="sg_pivot_course",
+        )
+        if pivot_course != "All Courses":
+            sg_pivot = course_pivots[pivot_course]
 
     if not sg_pivot.empty:
         hole_cols = [c for c in sg_pivot.columns if c != 'Shot Type']
@@ -285,7 +282,7 @@ def strokes_gained_tab(
     # ----------------------------------------------------------------
     section_header("Strokes Gained Trend")
 
-    sg_trend = build_sg_trend(filtered_df)
+    sg_trend = build_sg_trend(filtered_df, shots)
 
     if not sg_trend.empty:
         use_ma_sg = st.checkbox("Apply Moving Average", value=False,
@@ -339,8 +336,8 @@ def strokes_gained_tab(
     # ----------------------------------------------------------------
     section_header("Scoring & Hole Outcomes")
 
-    outcomes = build_hole_outcomes(hole_summary)
-    scoring_par = build_scoring_by_par(hole_summary)
+    outcomes = build_hole_outcomes(hole_summary, rollup)
+    scoring_par = build_scoring_by_par(hole_summary, rollup)
 
     col_donut, col_cards = st.columns([3, 2])
 
@@ -472,13 +469,23 @@ def strokes_gained_tab(
     # ----------------------------------------------------------------
     # SHOT LEVEL DETAIL
     # ----------------------------------------------------------------
-    with st.expander("View Shot Level Detail"):
-        shot_detail = build_shot_detail(filtered_df)
-
-        if shot_detail:
-            for round_lbl, detail_df in shot_detail.items():
-                st.markdown(f"#### {round_lbl}")
-                st.dataframe(detail_df, use_container_width=True,
-                             hide_index=True)
-        else:
-            st.info("No shot data available.")
+    # Shot detail is built only while the expander is open, and only the
+    # selected round is materialized
+    detail_section = st.expander("View Shot Level Detail",
+                                 key="sg_shot_detail", on_change="rerun")
+    with detail_section:
+        if detail_section.open:
+            shot_detail = build_shot_detail(filtered_df)
+
+            if shot_detail:
+                round_idx = st.selectbox(
+                    "Round",
+                    options=range(len(shot_detail)),
+                    format_func=lambda i: shot_detail.labels[i],
+                    key="sg_shot_detail_round",
+                )
+                st.markdown(f"#### {shot_detail.labels[round_idx]}")
+                st.dataframe(shot_detail.round(round_idx),
+                             use_container_width=True, hide_index=True)
+            else:
+                st.info("No shot data available.")
@@ -16,8 +16,13 @@ from ui.components import (
 )
 from ui.formatters import format_sg, format_pct, format_date
 
-from engines.overview import build_tiger5_fail_shots
-from engines.tiger5 import build_tiger5_root_cause, build_tiger5_scoring_impact
+from engines.overview import build_tiger5_fail_shots, tiger5_fail_holes, TIGER5_FAIL_SHOT_COLUMNS
+from engines.tiger5 import (
+    build_tiger5_root_cause, build_tiger5_scoring_impact, TIGER5_ROOT_CAUSE_COLUMNS,
+)
+
+# Shot table columns this tab's engines read (app.py passes only these)
+SHOT_COLUMNS = tuple(dict.fromkeys(TIGER5_ROOT_CAUSE_COLUMNS + TIGER5_FAIL_SHOT_COLUMNS))
 
 
 def tiger5_tab(filtered_df, hole_summary, tiger5_results, total_tiger5_fails, num_rounds):
@@ -205,16 +210,19 @@ def tiger5_tab(filtered_df, hole_summary, tiger5_results, total_tiger5_fails, nu
     # ----------------------------------------------------------------
     # TIGER 5 FAIL DETAILS (shot-level)
     # ----------------------------------------------------------------
-    with st.expander("View Tiger 5 Fail Details"):
-        fail_shots = build_tiger5_fail_shots(filtered_df, tiger5_results)
-        any_fails = False
-
-        for stat_name in tiger5_names:
-            holes = fail_shots.get(stat_name, [])
-            if holes:
-                any_fails = True
-                st.markdown(f"#### {T5_DISPLAY_NAMES.get(stat_name, stat_name)}")
-                for hole_data in holes:
+    # Shots are joined and sliced only while the expander is open
+    fail_details = st.expander("View Tiger 5 Fail Details",
+                               key="t5_fail_details", on_change="rerun")
+    with fail_details:
+        if fail_details.open:
+            fail_shots = build_tiger5_fail_shots(filtered_df, tiger5_results)
+            any_fails = False
+
+            for stat_name in tiger5_names:
+                for i, hole_data in enumerate(tiger5_fail_holes(fail_shots, stat_name)):
+                    if i == 0:
+                        any_fails = True
+                        st.markdown(f"#### {T5_DISPLAY_NAMES.get(stat_name, stat_name)}")
                     st.markdown(
                         f"**{hole_data['date']} &mdash; "
                         f"{hole_data['course']} &mdash; "
@@ -226,8 +234,8 @@ def tiger5_tab(filtered_df, hole_summary, tiger5_results, total_tiger5_fails, nu
                         hide_index=True,
                     )
 
-        if not any_fails:
-            st.info("No Tiger 5 fails to display.")
+            if not any_fails:
+                st.info("No Tiger 5 fails to display.")
 
     # ----------------------------------------------------------------
     # SCORING IMPACT
@@ -480,3 +480,24 @@ def sidebar_label(text):
         f'margin-bottom:0.5rem;margin-top:1.25rem;">{text}</p>',
         unsafe_allow_html=True,
     )
+
+
+def perf_panel(profile):
+    """Sidebar table of one rerun's profile steps (RerunProfile), slowest first."""
+    steps = profile.frame()
+    sidebar_label(f"Performance · {profile.total_ms:,.0f} ms")
+    st.dataframe(
+        steps[['name', 'ms', 'rows_in', 'rows_out', 'peak_kb', 'copied_kb']],
+        hide_index=True,
+        column_config={
+            'name': st.column_config.TextColumn("Step"),
+            'ms': st.column_config.NumberColumn("ms", format="%.1f"),
+            'rows_in': st.column_config.NumberColumn("Rows in", format="%d"),
+            'rows_out': st.column_config.NumberColumn("Rows out", format="%d"),
+            'peak_kb': st.column_config.NumberColumn("Peak KB", format="%.0f"),
+            'copied_kb': st.column_config.NumberColumn("Copied KB", format="%.0f"),
+        },
+    )
+    st.caption(f"Steps {steps['ms'].sum():,.0f} ms of {profile.total_ms:,.0f} ms; "
+               f"{profile.copied_kb:,.0f} KB copied. Peak KB is Python allocation "
+               "per step; copied KB counts shot-table row takes")